@@ -18,7 +18,6 @@ from core.measurement_manager import MeasurementManager
 from core.constants import TCONS_LOW, EXCEL_BASE_DIR
 from data_handlers.excel_handler import ExcelHandler
 from ui.plot_manager import PlotManager
-from utils.helpers import parse_pin_states
 
 def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_rate=None,
          auto_save=True, save_data=True, custom_save_location=False, save_location=None):
@@ -152,12 +151,14 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
             
             # Démarrer les mesures
             keithley.turn_output_on()
+            # Lectures du Keithley et de l'appareil de régénération dans des threads dédiés
+            measurements.start_background_reads()
             print("Automatic measurements started")
             
             # Si on reprend après pause (passage de False à True)
             if not previous_state and measurements.pause_time_conductance is not None:
                 # Calculer combien de temps s'est écoulé depuis la pause
-                current_time = time.time()
+                current_time = time.monotonic()
                 pause_duration = current_time - measurements.pause_time_conductance
                 # Ajouter cette durée aux temps d'offset pour ajuster les timestamps
                 measurements.elapsed_time_conductance += pause_duration
@@ -174,14 +175,15 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                 regeneration_button.active = True
                 regeneration_button.ax.figure.canvas.draw_idle()
         else:
-            # Arrêter les mesures
+            # Arrêter les mesures (threads d'acquisition arrêtés avant de couper la sortie)
+            measurements.stop_background_reads()
             keithley.turn_output_off()
             print("Automatic measurements stopped")
             
             # Si on met en pause (passage de True à False)
             if previous_state:
                 # Enregistrer le temps d'arrêt pour plus tard
-                current_time = time.time()
+                current_time = time.monotonic()
                 measurements.pause_time_conductance = current_time
                 measurements.pause_time_co2_temp_humidity = current_time
                 measurements.pause_time_res_temp = current_time
@@ -259,13 +261,13 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         Met à jour la valeur de R0 dans le système
         """
         value = plot_manager.textboxes['R0'].text
-        measurements.set_R0(value)
+        measurements.set_R0(value, force=True)
     
     def update_read_R0(event):
         """
         Lit la valeur de R0 depuis le capteur et met à jour l'affichage
         """
-        R0 = measurements.read_R0()
+        R0 = measurements.read_R0(force=True)
         if R0 is not None:
             plot_manager.update_R0_display(R0)
     
@@ -350,7 +352,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         nonlocal escape_pressed
         # Définir Tcons à 0°C avant de fermer
         try:
-            measurements.set_Tcons(str(TCONS_LOW))
+            measurements.set_Tcons(str(TCONS_LOW), force=True)
             print(f"Tcons défini à {TCONS_LOW}°C avant fermeture")
         except Exception as e:
             print(f"Erreur lors de la définition de Tcons: {e}")
@@ -410,6 +412,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
 
         # Fermer toutes les connexions
         print("Fermeture des connexions...")
+        measurements.stop_background_reads()
         try:
             keithley.close()
             arduino.close()
@@ -463,143 +466,73 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     plot_manager.connect_radiobutton('time_unit', plot_manager.on_time_unit_change)
     
     # Main loop
-    last_conductance_time = 0
-    last_temp_data_time = 0
     measurement_cycle = 0  # Pour alterner entre les différentes mesures
     
     while not escape_pressed:
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Lire l'état des capteurs (indépendamment du mode de mesure)
         # Pour que les voyants soient mis à jour en continu
         if not measure_auto:  # Seulement quand le mode auto n'est pas actif
-            # Fonction pour traiter les états des pins et mettre à jour l'UI
-            def process_pin_states(line):
-                """
-                Traite les informations d'état des pins et met à jour l'interface
-                
-                Cette fonction analyse les états des pins (capteurs de position) depuis
-                une ligne de données Arduino et met à jour les indicateurs visuels correspondants.
-                
-                Args:
-                    line: Ligne de texte contenant les informations d'état des pins
-                    
-                Returns:
-                    bool: True si des états de pins ont été traités, False sinon
-                """
-                pin_states = parse_pin_states(line)
-                if pin_states:
-                    # Stocker les états des pins pour la mise à jour de l'UI
-                    measurements.pin_states = pin_states
-                    # Mettre à jour les indicateurs LED si les états des pins ont changé
-                    plot_manager.update_sensor_indicators(measurements.pin_states)
-                    return True
-                return False
-            
-            # Lire jusqu'à 3 lignes en mode non-auto
-            for _ in range(3):
-                if not arduino.device or not hasattr(arduino.device, 'in_waiting') or arduino.device.in_waiting <= 0:
-                    break  # Aucune donnée disponible
-                    
-                line = arduino.device.readline().decode('utf-8', errors='ignore').strip()
-                if not line:
-                    continue
-                
-                # Traiter uniquement les messages d'état des pins
-                process_pin_states(line)
-                
-                # En mode non-auto, on ignore les données CO2/temp/humidity
+            # Vider le tampon série en une fois ; en mode non-auto, on ignore les données CO2/temp/humidity
+            if measurements.read_arduino_status_only():
+                # Mettre à jour les indicateurs LED si les états des pins ont changé
+                plot_manager.update_sensor_indicators(measurements.pin_states)
         
         if measure_auto:
             # Rotation des mesures pour éviter de surcharger l'appareil
             measurement_cycle = (measurement_cycle + 1) % 10
             
-            # Lire toutes les données disponibles du port série (à chaque cycle)
-            # Vérifier si données disponibles et les traiter en fonction du mode actif
-            for _ in range(10):  # Lire jusqu'à 10 lignes par itération pour vider le buffer
-                if not arduino.device or not hasattr(arduino.device, 'in_waiting') or arduino.device.in_waiting <= 0:
-                    break  # Aucune donnée disponible, sortir de la boucle
-                
-                line = arduino.device.readline().decode('utf-8', errors='ignore').strip()
-                if not line:
-                    continue
-                
-                # Traiter les états des pins (pour les voyants) en utilisant la fonction définie précédemment
-                if process_pin_states(line):
-                    continue
-                
-                # Traiter les données CO2/temp/humidity
-                elif line.startswith('@'):
-                    data = line[1:].split()
-                    if len(data) == 3:
-                        try:
-                            co2 = float(data[0])
-                            temperature = float(data[1])
-                            humidity = float(data[2])
-                            
-                            # Only initialize start_time when we actually get data to plot
-                            if measurements.start_time_co2_temp_humidity is None:
-                                measurements.start_time_co2_temp_humidity = current_time
-                            
-                            # Calculate timestamp
-                            timestamp = current_time - measurements.start_time_co2_temp_humidity - measurements.elapsed_time_co2_temp_humidity
-                            
-                            # Store data
-                            measurements.timestamps_co2.append(timestamp)
-                            measurements.values_co2.append(co2)
-                            measurements.timestamps_temp.append(timestamp)
-                            measurements.values_temp.append(temperature)
-                            measurements.timestamps_humidity.append(timestamp)
-                            measurements.values_humidity.append(humidity)
-                            
-                            # Update plot
-                            plot_manager.update_co2_temp_humidity_plot(
-                                measurements.timestamps_co2,
-                                measurements.values_co2,
-                                measurements.timestamps_temp,
-                                measurements.values_temp,
-                                measurements.timestamps_humidity,
-                                measurements.values_humidity,
-                                measurements.regeneration_timestamps
-                            )
-                        except ValueError:
-                            print(f"Error parsing CO2/temp/humidity data: {line}")
+            # Lire toutes les données disponibles du port série (à chaque cycle) en une seule lecture :
+            # états des pins (pour les voyants) et données CO2/temp/humidity
+            pin_states = measurements.pin_states
+            co2_samples = measurements.read_arduino_batch()
+            if measurements.pin_states is not pin_states:
+                plot_manager.update_sensor_indicators(measurements.pin_states)
+            
+            if co2_samples:
+                # Update plot (une fois pour toutes les lignes reçues)
+                plot_manager.update_co2_temp_humidity_plot(
+                    measurements.timestamps_co2,
+                    measurements.values_co2,
+                    measurements.timestamps_temp,
+                    measurements.values_temp,
+                    measurements.timestamps_humidity,
+                    measurements.values_humidity,
+                    measurements.regeneration_timestamps
+                )
             
-            # Lecture du Keithley (conductance) tous les 5 cycles avec un délai minimum de 1 seconde
-            if measurement_cycle % 5 == 0 and current_time - last_conductance_time >= 1:
-                conductance_data = measurements.read_conductance()
-                if conductance_data:
-                    last_conductance_time = current_time
-                    
-                    # Détecter les éléments du cycle de conductance
-                    measurements.detect_increase()
-                    measurements.detect_stabilization()
-                    measurements.check_reset_detection_indicators()
-                    measurements.detect_post_regen_stability()
-                    
-                    plot_manager.update_conductance_plot(
-                        measurements.timeList,
-                        measurements.conductanceList,
-                        {
-                            'increase_time': measurements.increase_time,
-                            'stabilization_time': measurements.stabilization_time,
-                            'max_slope_time': measurements.max_slope_time,
-                            'conductance_decrease_time': measurements.conductance_decrease_time,
-                            'post_regen_stability_time': measurements.post_regen_stability_time
-                        }
-                    )
+            # Mesures de conductance lues par le thread d'acquisition (une par seconde) :
+            # la boucle ne fait que les enregistrer, sans attendre l'appareil
+            conductance_data = measurements.poll_conductance()
+            if conductance_data:
+                # Détecter les éléments du cycle de conductance
+                measurements.detect_increase()
+                measurements.detect_stabilization()
+                measurements.check_reset_detection_indicators()
+                measurements.detect_post_regen_stability()
+                
+                plot_manager.update_conductance_plot(
+                    measurements.timeList,
+                    measurements.conductanceList,
+                    {
+                        'increase_time': measurements.increase_time,
+                        'stabilization_time': measurements.stabilization_time,
+                        'max_slope_time': measurements.max_slope_time,
+                        'conductance_decrease_time': measurements.conductance_decrease_time,
+                        'post_regen_stability_time': measurements.post_regen_stability_time
+                    }
+                )
             
-            # Lecture de la température tous les 3 cycles avec un délai minimum de 1 seconde
-            elif measurement_cycle % 3 == 0 and current_time - last_temp_data_time >= 1:
-                temp_data = measurements.read_res_temp()
-                if temp_data:
-                    last_temp_data_time = current_time
-                    plot_manager.update_res_temp_plot(
-                        measurements.timestamps_res_temp,
-                        measurements.temperatures,
-                        measurements.Tcons_values,
-                        measurements.regeneration_timestamps
-                    )
+            # Mesures de température lues par le thread d'acquisition
+            temp_data = measurements.poll_res_temp()
+            if temp_data:
+                plot_manager.update_res_temp_plot(
+                    measurements.timestamps_res_temp,
+                    measurements.temperatures,
+                    measurements.Tcons_values,
+                    measurements.regeneration_timestamps
+                )
             
             # Exécuter l'automate de détection à chaque itération, mais après avoir lu les données
             if measurement_cycle % 10 == 0:
@@ -613,7 +546,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                 
             # Gérer le protocole de régénération si actif
             if measurements.regeneration_in_progress:
-                regeneration_status = measurements.manage_regeneration_protocol()
+                regeneration_status = measurements.manage_regeneration_protocol(current_time)
                 plot_manager.update_regeneration_status(regeneration_status, measurements.regeneration_results)
         
         # Update UI - délai court pour une meilleure réactivité
@@ -685,4 +618,6 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     sys.exit(0)
 
 if __name__ == "__main__":
+    from utils.logging_utils import configure_logging
+    configure_logging()
     main()
\ No newline at end of file
@@ -49,6 +49,7 @@ REGEN_COMMAND_DELAY = 0.2  # Délai après envoi d'une commande à la carte de r
 REGEN_DATA_CHECK_INTERVAL = 0.1  # Intervalle entre vérifications de données disponibles en secondes
 REGEN_MAX_DATA_CHECK_ATTEMPTS = 5  # Nombre maximum de tentatives de vérification de données
 REGEN_WRITE_DELAY = 0.1  # Délai après écriture d'un paramètre en secondes
+REGEN_WRITE_TIMEOUT = 3  # Attente maximale de la confirmation d'une écriture en secondes
 
 # Configuration de stockage des données
 EXCEL_BASE_DIR = "donnees_excel"  # Répertoire de base pour le stockage des fichiers Excel générés
\ No newline at end of file
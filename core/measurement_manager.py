@@ -2,8 +2,14 @@
 Gestionnaire de mesures - Gère la logique de collecte et de traitement des données des capteurs
 """
 
+import collections
+import logging
+import queue
+import threading
 import time
-import numpy as np
+import types
+from enum import Enum, IntEnum, auto
+from typing import NamedTuple
 import serial
 from serial.serialutil import SerialException
 import pyvisa
@@ -13,11 +19,203 @@ from core.constants import (
     CO2_STABILITY_THRESHOLD, CO2_STABILITY_DURATION, REGENERATION_DURATION,
     CONDUCTANCE_DECREASE_THRESHOLD, CO2_INCREASE_THRESHOLD
 )
+from utils.helpers import (
+    parse_co2_data, parse_number, parse_pin_states, three_point_slope, RollingSlope, OnlineRegression
+)
+from utils.logging_utils import RateLimitFilter
+from utils.sample_buffer import SampleBuffer
+
+# Rafales de messages identiques écartées : voir utils.logging_utils.RateLimitFilter
+logger = logging.getLogger(__name__)
+logger.addFilter(RateLimitFilter(interval=1.0))
+
+# Horloge unique du gestionnaire : toutes les lectures de temps passent par cette
+# référence, résolue une seule fois à l'import (les applications partagent la même base).
+# Horloge monotone : les durées ne sont pas faussées par un réglage de l'heure système
+_now = time.monotonic
+
+# Facteur de conversion ppm·L -> µg de carbone (12 g/mol / 24.5 L/mol), évalué une fois.
+# CELL_VOLUME reste lu à l'appel : il peut être modifié depuis la configuration
+CARBON_MASS_FACTOR = 12 / 24.5
+
+# Consignes de température sous la forme texte attendue par set_Tcons, converties une seule fois
+# (TCONS_LOW et REGENERATION_TEMP sont liés à l'import de ce module)
+_TCONS_LOW_STR = str(TCONS_LOW)
+_REGEN_TEMP_STR = str(REGENERATION_TEMP)
+
+# Commande brute de retour à la consigne basse, encodée une seule fois
+_TCONS_LOW_CMD = f"ea{_TCONS_LOW_STR}\n".encode('ascii')
+
+# Parties invariantes des messages d'état des protocoles, assemblées une seule fois
+# (constantes liées à l'import) : seule la valeur mesurée est formatée à chaque appel
+_MSG_REGEN_STARTED = f"Régénération à {REGENERATION_TEMP}°C démarrée"
+_MSG_REGEN_PREFIX = "Régénération en cours ("
+_MSG_REGEN_SUFFIX = f"/{REGENERATION_DURATION}s)"
+_MSG_REGEN_RESTAB_SUFFIX = _MSG_REGEN_SUFFIX + " (restabilisation en cours)"
+_MSG_RESTAB_WAIT_PREFIX = "Attente restabilisation CO2 ("
+_MSG_RESTAB_SUFFIX = f"/{CO2_STABILITY_DURATION}s)"
+_MSG_TARGET_STOPPED_PREFIX = "Résistance > 1 MΩ atteinte! (arrêté depuis "
+_MSG_HEATING_PREFIX = "Chauffage en cours: "
+_MSG_HEATING_SUFFIX = " kΩ (cible: 1000 kΩ)"
+_MSG_HEATING_WAIT_PREFIX = "Chauffage en cours... ("
+
+# Coefficients de progression des protocoles (pourcentage par seconde),
+# pré-divisés pour que chaque calcul de progression soit une simple multiplication
+_REGEN_PROGRESS_RATE = (66.7 * 0.5) / REGENERATION_DURATION
+_CO2_STABILITY_PROGRESS_RATE = 33.3 / CO2_STABILITY_DURATION
+_RESTAB_PROGRESS_RATE = 25.0 / CO2_STABILITY_DURATION
+_STABILITY_PERCENT_RATE = 100.0 / CO2_STABILITY_DURATION
+_FULL_PROGRESS_PER_STEP = 100 / 6  # Protocole complet : 6 étapes
+
+# Seuils de pente des détecteurs de stabilisation, pré-divisés à l'import
+_STABILIZATION_SLOPE_MAX = INCREASE_SLOPE_MIN / 2
+_POST_REGEN_SLOPE_MAX = INCREASE_SLOPE_MIN / 3
+
+# Résistance cible du protocole de conductance (1 MΩ) et son inverse
+_OHM_TARGET = 1_000_000.0
+_INV_OHM_TARGET = 1e-6
+
+class RegenStep(IntEnum):
+    """Étapes du protocole de régénération CO2 (valeurs de regeneration_step)"""
+    IDLE = 0            # Protocole inactif
+    INIT_STABILITY = 1  # Vérification de la stabilité CO2 initiale
+    HEATING = 2         # Régénération à haute température (durée fixe)
+    AWAIT_RESTAB = 3    # Chauffage terminé et pic détecté : attente de la restabilisation
+    DONE = 4            # Protocole terminé
+
+
+class RegenEvent(Enum):
+    """Événements qui font évoluer le protocole de régénération CO2"""
+    CO2_STABLE = auto()        # Stabilité CO2 initiale atteinte
+    CO2_INCREASE = auto()      # Augmentation du CO2 confirmée pendant le chauffage
+    CO2_PEAK = auto()          # Pic de CO2 détecté
+    HEATING_ELAPSED = auto()   # Durée de régénération écoulée
+    CO2_RESTABILIZED = auto()  # CO2 restabilisé après le pic
+
+
+# Mesures retournées par les lectures : tuples nommés (plus légers qu'un dict par
+# échantillon), champs accessibles par attribut
+class ConductanceSample(NamedTuple):
+    """Mesure de conductance retournée par read_conductance / poll_conductance"""
+    timestamp: float    # Temps relatif (s)
+    conductance: float  # Conductance (µS)
+    resistance: float   # Résistance (Ω)
+
+
+class Co2Sample(NamedTuple):
+    """Mesure de l'Arduino retournée par read_arduino_batch / read_arduino_data"""
+    timestamp: float    # Temps relatif (s)
+    co2: float          # Concentration de CO2 (ppm)
+    temperature: float  # Température (°C)
+    humidity: float     # Humidité relative (%)
+
+
+class ResTempSample(NamedTuple):
+    """Mesure de température de résistance retournée par read_res_temp / poll_res_temp"""
+    timestamp: float    # Temps relatif (s)
+    temperature: float  # Température mesurée (°C)
+    Tcons: float        # Consigne de température (°C)
+
+
+# États entièrement constants retournés par les protocoles, construits une seule fois.
+# Vues en lecture seule : un même objet est partagé par tous les appels
+_STATUS_REGEN_INACTIVE = types.MappingProxyType({
+    'active': False,
+    'step': RegenStep.IDLE,
+    'message': "Regeneration not active",
+    'progress': 0
+})
+_STATUS_REGEN_DONE = types.MappingProxyType({
+    'active': False,
+    'step': RegenStep.DONE,
+    'message': "Régénération terminée avec succès",
+    'progress': 100
+})
+_STATUS_CONDUCTANCE_INACTIVE = types.MappingProxyType({
+    'active': False,
+    'step': 0,
+    'message': "Protocole non actif",
+    'progress': 0
+})
+_STATUS_FULL_INACTIVE = types.MappingProxyType({
+    'active': False,
+    'step': 0,
+    'message': "Protocole complet non actif",
+    'progress': 0,
+    'protocol_type': 'full'
+})
+
 
 class MeasurementManager:
     """Gère toutes les opérations de mesure et implémente la logique de détection des capteurs"""
     
-    def __init__(self, keithley_device, arduino_device, regen_device):
+    # Attributs d'instance déclarés (pas de __dict__) : accès par position fixe et
+    # instance plus compacte. Tout nouvel attribut doit être ajouté ici
+    __slots__ = (
+        'keithley', 'arduino', '_regen', '_log', '_keithley_error_count', '_serial_error_count',
+        '_keithley_error_reported', '_regen_error_reported', 'on_keithley_disconnected',
+        'excel_handler', '_keithley_lock', '_conductance_q', '_res_temp_q', '_reader_stop',
+        '_reader_threads', '_auto_state', '_auto_deadline', '_auto_co2_reference',
+        '_auto_co2_since', '_auto_regen_start', '_auto_conductance_seen', 'timeList', 'conductanceList',
+        'resistanceList', '_conductance_slope', '_stability_regression', '_window10_ready',
+        '_window15_ready', '_current_slope',
+        '_stability_window_start', 'timestamps_co2', 'values_co2', 'timestamps_temp',
+        'values_temp', 'timestamps_humidity', 'values_humidity', 'latest_co2',
+        'latest_resistance', '_co2_max_dq', 'timestamps_res_temp', 'temperatures',
+        'Tcons_values', 'start_time_conductance', 'start_time_co2_temp_humidity',
+        'start_time_res_temp', 'elapsed_time_conductance', 'elapsed_time_co2_temp_humidity',
+        'elapsed_time_res_temp', 'pause_time_conductance', 'pause_time_co2_temp_humidity',
+        'pause_time_res_temp', 'increase_detected', 'stabilized', 'increase_time',
+        'stabilization_time', 'max_slope_value', 'max_slope_time', 'sensor_state',
+        'escape_pressed', 'last_set_Tcons', '_current_tcons', '_r0_cache',
+        '_current_R0',
+        'first_stability_time', 'conductance_decrease_detected', 'conductance_decrease_time',
+        'post_regen_stability_detected', 'post_regen_stability_time',
+        'co2_increase_detection_started', 'co2_base_value', 'co2_increase_detected',
+        'co2_peak_value', 'co2_peak_time', 'co2_peak_detected', 'co2_max_slope_value',
+        'co2_max_slope_time', 'co2_peak_detection_started', 'co2_peak_detection_value',
+        'co2_restabilization_start_time', 'co2_restabilization_reference', 'co2_restabilized',
+        'tcons_reduced', 'co2_values_after_increase', 'co2_timestamps_after_increase',
+        'co2_stability_shifted', 'co2_previous_stable_value', 'co2_stability_shift_count',
+        'pin_states', 'regeneration_in_progress', 'regeneration_step',
+        'co2_stability_start_time', 'regeneration_start_time', 'co2_stable_value',
+        '_regen_last_key', '_regen_last_result', '_regen_step_handlers', '_regen_transitions',
+        '_full_step_handlers', '_full_heating_log_bucket',
+        'regeneration_timestamps', 'regeneration_results', 'conductance_regen_in_progress',
+        'conductance_regen_start_time', 'conductance_regen_target_reached',
+        'conductance_regen_stop_time', 'full_protocol_in_progress', 'full_protocol_start_time',
+        'full_regen_target_reached', 'full_regen_stop_time',
+        # Attributs initialisés par les protocoles et les réinitialisations
+        'full_protocol_step', '_co2_restab_off_count', '_co2_restab_seen',
+        'full_protocol_substep', 'full_protocol_substep_start_time',
+        'full_protocol_co2_initial', 'full_protocol_co2_final', '_co2_increase_on_count',
+        '_co2_regen_seen', '_co2_restab_checked', '_co2_stability_checked',
+    )
+    
+    # Séries de données réinitialisées ensemble par reset_data, par type de mesure
+    _DATA_CHANNELS = {
+        "conductance": ('timeList', 'conductanceList', 'resistanceList'),
+        "co2_temp_humidity": ('timestamps_co2', 'values_co2', 'timestamps_temp',
+                              'values_temp', 'timestamps_humidity', 'values_humidity'),
+        "res_temp": ('timestamps_res_temp', 'temperatures', 'Tcons_values'),
+    }
+    
+    # Nombre de mises à jour de la régression de stabilisation entre deux recalculs exacts
+    _REGRESSION_REBUILD_INTERVAL = 256
+    
+    # Durée (s) pendant laquelle une valeur de R0 lue est réutilisée par read_R0
+    _R0_CACHE_TTL = 0.5
+    
+    # Nombre de points CO2 examinés par detect_co2_peak pour trouver le maximum
+    _CO2_PEAK_WINDOW = 10
+    
+    # Hystérésis du protocole de régénération (en nombre de nouveaux points CO2) :
+    # points consécutifs au-dessus du seuil pour valider l'augmentation, et hors de
+    # la bande de stabilité pour réinitialiser la référence de restabilisation
+    _CO2_INCREASE_ON_SAMPLES = 3
+    _CO2_RESTAB_OFF_SAMPLES = 2
+    
+    def __init__(self, keithley_device, arduino_device, regen_device, capacity_hint=3_600 * 10):
         """
         Initialise le gestionnaire de mesures
         
@@ -25,28 +223,94 @@ class MeasurementManager:
             keithley_device: Appareil pour les mesures de résistance
             arduino_device: Appareil pour les mesures de CO2, température, humidité
             regen_device: Appareil pour le contrôle de température de résistance
+            capacity_hint: Nombre d'échantillons préalloués par série (durée de session
+                           attendue × fréquence d'acquisition) ; au-delà, les tampons doublent
         """
         self.keithley = keithley_device
         self.arduino = arduino_device
         self.regen = regen_device
+        self._log = logger
+        
+        # Compteurs d'erreurs de communication consécutives (remis à zéro à chaque lecture réussie)
+        self._keithley_error_count = 0
+        self._serial_error_count = 0
+        
+        # Indisponibilité déjà signalée (évite de répéter l'avertissement à chaque lecture)
+        self._keithley_error_reported = False
+        self._regen_error_reported = False
+        
+        # Rappel de l'interface appelé lors d'une déconnexion du Keithley
+        # (sans effet par défaut : l'appel ne nécessite aucune vérification)
+        self.on_keithley_disconnected = lambda: None
+        
+        # Gestionnaire Excel optionnel : les données de conductance lui sont
+        # transmises avant chaque réinitialisation (None si aucun)
+        self.excel_handler = None
+        
+        # Acquisition en arrière-plan (voir start_background_reads) : un thread par
+        # appareil effectue les lectures bloquantes et dépose les résultats bruts dans
+        # une file, vidée par la boucle principale (poll_conductance / poll_res_temp)
+        self._keithley_lock = threading.Lock()
+        self._conductance_q = queue.SimpleQueue()
+        self._res_temp_q = queue.SimpleQueue()
+        self._reader_stop = threading.Event()
+        self._reader_threads = []
+        
+        # Étape d'attente du mode automatique ('IDLE' hors attente) et son échéance
+        self._auto_state = 'IDLE'
+        self._auto_deadline = 0.0
+        
+        # Suivi des étapes de régénération du mode automatique, évaluées à chaque appel :
+        # référence CO2 et début de sa stabilité, début du chauffage et nombre de
+        # mesures de conductance déjà examinées
+        self._auto_co2_reference = None
+        self._auto_co2_since = 0.0
+        self._auto_regen_start = 0.0
+        self._auto_conductance_seen = 0
         
         # Data storage for conductance measurements
-        self.timeList = []
-        self.conductanceList = []
-        self.resistanceList = []
+        self.timeList = SampleBuffer(capacity_hint)
+        self.conductanceList = SampleBuffer(capacity_hint)
+        self.resistanceList = SampleBuffer(capacity_hint)
+        
+        # Pente glissante des 10 dernières conductances, mise à jour à chaque mesure
+        self._conductance_slope = RollingSlope(10)
+        # Pente des 10 dernières conductances, calculée une seule fois par mesure
+        # et partagée par tous les détecteurs appelés ensuite
+        self._current_slope = 0.0
+        
+        # Régression en ligne sur la fenêtre temporelle de detect_stabilization
+        # (mesures des SLIDING_WINDOW/2 dernières secondes, à partir de l'indice de début)
+        self._stability_regression = OnlineRegression()
+        self._stability_window_start = 0
+        
+        # Au moins 10 (resp. 15) mesures de conductance enregistrées : posés une fois
+        # la fenêtre remplie, ils évitent aux détecteurs de recompter la série
+        self._window10_ready = False
+        self._window15_ready = False
         
         # Data storage for CO2, temperature and humidity
-        self.timestamps_co2 = []
-        self.values_co2 = []
-        self.timestamps_temp = []
-        self.values_temp = []
-        self.timestamps_humidity = []
-        self.values_humidity = []
+        self.timestamps_co2 = SampleBuffer(capacity_hint)
+        self.values_co2 = SampleBuffer(capacity_hint)
+        self.timestamps_temp = SampleBuffer(capacity_hint)
+        self.values_temp = SampleBuffer(capacity_hint)
+        self.timestamps_humidity = SampleBuffer(capacity_hint)
+        self.values_humidity = SampleBuffer(capacity_hint)
+        
+        # Dernières valeurs mesurées (None tant qu'aucune mesure n'est enregistrée),
+        # lues par les protocoles et détecteurs à la place de values_co2[-1] / resistanceList[-1].
+        # Les séries complètes restent nécessaires (tracés, Excel, masse de carbone)
+        self.latest_co2 = None
+        self.latest_resistance = None
+        
+        # Maximum glissant de CO2 sur les _CO2_PEAK_WINDOW derniers points : file de
+        # couples (valeur, indice) à valeurs décroissantes, la tête est le maximum
+        self._co2_max_dq = collections.deque()
         
         # Data storage for resistance temperature
-        self.timestamps_res_temp = []
-        self.temperatures = []
-        self.Tcons_values = []
+        self.timestamps_res_temp = SampleBuffer(capacity_hint)
+        self.temperatures = SampleBuffer(capacity_hint)
+        self.Tcons_values = SampleBuffer(capacity_hint)
         
         # Time tracking variables
         self.start_time_conductance = None
@@ -71,6 +335,9 @@ class MeasurementManager:
         self.sensor_state = None  # None: unknown, True: out, False: in
         self.escape_pressed = False
         self.last_set_Tcons = None  # Stocke la dernière valeur de Tcons définie
+        self._current_tcons = None  # Consigne envoyée à l'appareil (None si inconnue)
+        self._r0_cache = (0.0, None)  # (instant de lecture, dernière valeur valide de R0)
+        self._current_R0 = None  # Dernier R0 écrit avec succès sur l'appareil (None si inconnu)
         self.first_stability_time = None  # Temps de la première stabilité dans le protocole complet
         
         # Variables pour la détection des étapes post-régénération
@@ -116,11 +383,44 @@ class MeasurementManager:
         
         # Regeneration protocol variables
         self.regeneration_in_progress = False
-        self.regeneration_step = 0  # 0: not started, 1: checking CO2 stability, 2: regeneration active, 3: completed
+        self.regeneration_step = RegenStep.IDLE
         self.co2_stability_start_time = None
         self.regeneration_start_time = None
         self.co2_stable_value = None  # To store the reference CO2 value for stability check
         
+        # Compteurs d'hystérésis CO2 du protocole de régénération
+        self._reset_co2_hysteresis()
+        
+        # Dernier état retourné par manage_regeneration_protocol et sa clé
+        # (étape, nombre de points CO2, seconde courante)
+        self._regen_last_key = None
+        self._regen_last_result = None
+        
+        # Table de dispatch des étapes du protocole (construite une seule fois)
+        self._regen_step_handlers = {
+            RegenStep.INIT_STABILITY: self._regen_step1,
+            RegenStep.HEATING: self._regen_step2,
+            RegenStep.AWAIT_RESTAB: self._regen_step3,
+        }
+        self._full_step_handlers = {
+            1: self._full_step1,
+            2: self._full_step2,
+            3: self._full_step3,
+            4: self._full_step4,
+            5: self._full_step5,
+            6: self._full_step6,
+        }
+        
+        # Table des transitions : (étape, événement) -> action ; un événement absent
+        # de la table pour l'étape courante est ignoré
+        self._regen_transitions = {
+            (RegenStep.INIT_STABILITY, RegenEvent.CO2_STABLE): self._on_regen_co2_stable,
+            (RegenStep.HEATING, RegenEvent.CO2_INCREASE): self._on_regen_co2_increase,
+            (RegenStep.HEATING, RegenEvent.CO2_PEAK): self._on_regen_co2_peak,
+            (RegenStep.HEATING, RegenEvent.HEATING_ELAPSED): self._on_regen_heating_elapsed,
+            (RegenStep.AWAIT_RESTAB, RegenEvent.CO2_RESTABILIZED): self._on_regen_co2_restabilized,
+        }
+        
         # Timestamps for key events in the regeneration protocol (for plotting markers)
         self.regeneration_timestamps = {
             'r0_actualized': None,          # Moment où R0 est actualisé
@@ -149,6 +449,21 @@ class MeasurementManager:
         self.full_protocol_start_time = None
         self.full_regen_target_reached = False
         self.full_regen_stop_time = None
+        self._full_heating_log_bucket = -1  # Dernière tranche de 5 s tracée à l'étape 3
+    
+    @property
+    def regen(self):
+        """Appareil de régénération utilisé par le gestionnaire"""
+        return self._regen
+    
+    @regen.setter
+    def regen(self, regen_device):
+        # Nouvel appareil (reconnexion, redémarrage de la carte) : les consignes
+        # mémorisées ne correspondent plus à ce qui est programmé sur l'appareil
+        self._regen = regen_device
+        self._current_tcons = None
+        self._current_R0 = None
+        self._r0_cache = (0.0, None)
     
     def reset_data(self, data_type=None):
         """
@@ -158,11 +473,11 @@ class MeasurementManager:
             data_type: Type of data to reset, or None for all data
         """
         # Sauvegardons la dernière valeur de Tcons avant de tout réinitialiser
-        last_tcons = getattr(self, 'last_set_Tcons', None)
+        last_tcons = self.last_set_Tcons
         
         if data_type in [None, "conductance"]:
             # Save current data before resetting if we have an ExcelHandler
-            if hasattr(self, 'excel_handler') and len(self.timeList) > 0:
+            if self.excel_handler is not None and len(self.timeList) > 0:
                 # This will trigger the save to Excel
                 self.excel_handler.raz_conductance_data(
                     self.timeList,
@@ -171,9 +486,14 @@ class MeasurementManager:
                 )
                 
             # Now reset the data
-            self.timeList.clear()
-            self.conductanceList.clear()
-            self.resistanceList.clear()
+            self._clear_series(self._DATA_CHANNELS["conductance"])
+            self._conductance_slope.clear()
+            self._current_slope = 0.0
+            self._stability_regression.clear()
+            self._stability_window_start = 0
+            self._window10_ready = False
+            self._window15_ready = False
+            self.latest_resistance = None
             self.start_time_conductance = None
             self.pause_time_conductance = None
             self.elapsed_time_conductance = 0
@@ -181,12 +501,9 @@ class MeasurementManager:
         if data_type in [None, "co2_temp_humidity"]:
             # Handle CO2/temp/humidity data similarly if needed
             # (Add similar code here for CO2/temp/humidity when implemented)
-            self.timestamps_co2.clear()
-            self.values_co2.clear()
-            self.timestamps_temp.clear()
-            self.values_temp.clear()
-            self.timestamps_humidity.clear()
-            self.values_humidity.clear()
+            self._clear_series(self._DATA_CHANNELS["co2_temp_humidity"])
+            self._co2_max_dq.clear()
+            self.latest_co2 = None
             self.start_time_co2_temp_humidity = None
             self.pause_time_co2_temp_humidity = None
             self.elapsed_time_co2_temp_humidity = 0
@@ -194,9 +511,7 @@ class MeasurementManager:
         if data_type in [None, "res_temp"]:
             # Handle temp_res data similarly if needed
             # (Add similar code here for temp_res when implemented)
-            self.timestamps_res_temp.clear()
-            self.temperatures.clear()
-            self.Tcons_values.clear()
+            self._clear_series(self._DATA_CHANNELS["res_temp"])
             self.start_time_res_temp = None
             self.pause_time_res_temp = None
             self.elapsed_time_res_temp = 0
@@ -219,107 +534,242 @@ class MeasurementManager:
         if last_tcons is not None:
             self.last_set_Tcons = last_tcons
     
-    def read_conductance(self):
-        """Lit les données de conductance depuis l'appareil Keithley"""
-        current_time = time.time()
+    def _clear_series(self, names):
+        """
+        Vide sur place les séries indiquées
+        
+        Toutes les séries sont des tampons SampleBuffer : la réinitialisation
+        remet la tête d'écriture à zéro et conserve la mémoire allouée.
+        
+        Args:
+            names: Noms des attributs de séries à vider
+        """
+        for name in names:
+            getattr(self, name).clear()
+    
+    def _update_stability_window(self, timestamp, conductance):
+        """
+        Fait glisser la fenêtre de régression utilisée par detect_stabilization
+        
+        La nouvelle mesure est ajoutée et les mesures antérieures à
+        timestamp - SLIDING_WINDOW/2 sont retirées, en O(1) amorti par mesure.
+        
+        Args:
+            timestamp: Temps de la nouvelle mesure (déjà ajouté à timeList)
+            conductance: Conductance de la nouvelle mesure
+        """
+        regression = self._stability_regression
+        regression.push(timestamp, conductance)
+        
+        # Vues NumPy des séries (sans copie) : évite l'indexation Python de SampleBuffer
+        times = self.timeList.view()
+        values = self.conductanceList.view()
+        
+        lower_bound = timestamp - SLIDING_WINDOW/2
+        start = self._stability_window_start
+        while times.item(start) < lower_bound:
+            regression.pop(times.item(start), values.item(start))
+            start += 1
+        self._stability_window_start = start
+        
+        # Recalcul exact périodique pour effacer la dérive d'arrondi des ajouts/retraits
+        if regression.updates_since_rebuild >= self._REGRESSION_REBUILD_INTERVAL:
+            regression.rebuild(times[start:], values[start:])
+    
+    def _stamp(self, key, current_time):
+        """
+        Enregistre un marqueur de régénération, relatif au début de la série CO2
+        
+        Sans effet tant que la série CO2 n'a pas commencé.
+        
+        Args:
+            key: Clé du marqueur dans regeneration_timestamps
+            current_time: Temps courant (horloge du gestionnaire)
+        """
+        start = self.start_time_co2_temp_humidity
+        if start is not None:
+            self.regeneration_timestamps[key] = current_time - start - self.elapsed_time_co2_temp_humidity
+    
+    @staticmethod
+    def _rel_time(start, elapsed, now):
+        """
+        Calcule un horodatage relatif au début d'une série de mesures
+        
+        Args:
+            start: Instant de la première mesure de la série (None si aucune)
+            elapsed: Durée cumulée des pauses à retrancher
+            now: Instant courant
+            
+        Returns:
+            float: Temps écoulé depuis le début de la série, pauses exclues
+        """
+        return (now - start - elapsed) if start is not None else 0.0
+    
+    def _pause_conductance(self, current_time):
+        """
+        Marque la pause de la série conductance et prévient l'interface de la déconnexion
+        
+        Args:
+            current_time: Instant de la lecture en échec
+        """
+        # Si on avait commencé à collecter des données, mémoriser le moment de la pause
+        if self.start_time_conductance is not None:
+            self.pause_time_conductance = current_time
+        
+        # Marquer la déconnexion pour l'interface
+        self.on_keithley_disconnected()
+    
+    def _check_keithley_available(self, current_time):
+        """
+        Vérifie que le Keithley est disponible avant une lecture
         
-        # Vérifier si le Keithley est disponible
-        if self.keithley is None or not hasattr(self.keithley, 'device') or self.keithley.device is None:
+        Args:
+            current_time: Instant courant (mémorisé comme début de pause si indisponible)
+            
+        Returns:
+            bool: True si l'appareil est connecté, False sinon
+        """
+        if getattr(self.keithley, 'device', None) is None:
             # Si l'erreur a déjà été signalée précédemment, ne pas la répéter
-            if not hasattr(self, '_keithley_error_reported') or not self._keithley_error_reported:
-                print("Warning: Attempting to read conductance but Keithley device is not available")
+            if not self._keithley_error_reported:
+                self._log.warning("Attempting to read conductance but Keithley device is not available")
                 self._keithley_error_reported = True
-                
-                # Si on avait commencé à collecter des données, mémoriser le moment de la pause
-                if self.start_time_conductance is not None:
-                    self.pause_time_conductance = current_time
-                    
-                # Marquer la déconnexion pour l'interface
-                if hasattr(self, 'on_keithley_disconnected') and callable(self.on_keithley_disconnected):
-                    self.on_keithley_disconnected()
-            return None
+                self._pause_conductance(current_time)
+            return False
         
         # Réinitialiser le marqueur d'erreur puisque l'appareil est disponible
         self._keithley_error_reported = False
+        return True
+    
+    def _acquire_resistance(self):
+        """
+        Effectue l'échange bloquant avec le Keithley, sans modifier l'état des mesures
         
-        # Read resistance from Keithley
-        try:
-            # Capturer les erreurs de communication VISA spécifiques
+        Appelé depuis la boucle principale ou depuis le thread d'acquisition.
+        
+        Returns:
+            tuple: (instant de la lecture, résistance ou None, exception ou None)
+        """
+        with self._keithley_lock:
+            current_time = _now()
             try:
-                resistance = self.keithley.read_resistance()
-                
-                # Si la lecture échoue, on considère que le Keithley n'est plus disponible
-                if resistance is None:
-                    print("Lecture de résistance a échoué (None retourné)")
-                    self.keithley.device = None
-                    self._keithley_error_reported = True
-                    
-                    # Si on avait commencé à collecter des données, mémoriser le moment de la pause
-                    if self.start_time_conductance is not None:
-                        self.pause_time_conductance = current_time
-                        
-                    # Marquer la déconnexion pour l'interface
-                    if hasattr(self, 'on_keithley_disconnected') and callable(self.on_keithley_disconnected):
-                        self.on_keithley_disconnected()
-                    return None
-                    
-                if resistance == 0.0:
-                    conductance = float('inf')
-                else:
-                    conductance = (1 / resistance) * 1e6  # Convert to µS
-                    
-                # Si on arrive ici, la lecture a réussi, donc l'appareil est fonctionnel
-                # Réinitialiser les compteurs d'erreur si nécessaire
-                if hasattr(self, '_keithley_error_count'):
-                    self._keithley_error_count = 0
-                    
-            except (IOError, OSError, pyvisa.errors.VisaIOError) as visa_err:
-                # Erreur de communication VISA critique - l'appareil est probablement déconnecté
-                if not hasattr(self, '_keithley_error_count'):
-                    self._keithley_error_count = 0
-                
-                self._keithley_error_count += 1
-                
-                # N'afficher que périodiquement les erreurs pour éviter le spam
-                if self._keithley_error_count % 20 == 1:
-                    print(f"Error communicating with Keithley: {visa_err}")
-                
-                # Marquer l'appareil comme non disponible pour éviter d'autres erreurs
-                self.keithley.device = None
-                self._keithley_error_reported = True
-                
-                # Si on avait commencé à collecter des données, mémoriser le moment de la pause
-                if self.start_time_conductance is not None:
-                    self.pause_time_conductance = current_time
-                    
-                # Marquer la déconnexion pour l'interface
-                if hasattr(self, 'on_keithley_disconnected') and callable(self.on_keithley_disconnected):
-                    self.on_keithley_disconnected()
-                return None
-                
-        except Exception as e:
-            print(f"Error reading conductance: {e}")
+                return current_time, self.keithley.read_resistance(), None
+            except Exception as e:
+                return current_time, None, e
+    
+    def read_conductance(self):
+        """Lit les données de conductance depuis l'appareil Keithley"""
+        # Avec l'acquisition en arrière-plan, le thread est le seul à interroger l'appareil
+        if self._reader_threads:
+            return self.poll_conductance()
+        
+        if not self._check_keithley_available(_now()):
+            return None
+        
+        return self._store_conductance(*self._acquire_resistance())
+    
+    def poll_conductance(self):
+        """
+        Enregistre les lectures de conductance produites par le thread d'acquisition
+        
+        Les détecteurs sont exécutés sur le thread appelant, comme avec read_conductance.
+        
+        Returns:
+            ConductanceSample: Dernière mesure enregistrée, ou None si aucune nouvelle mesure
+        """
+        data = None
+        while True:
+            try:
+                reading = self._conductance_q.get_nowait()
+            except queue.Empty:
+                break
+            result = self._store_conductance(*reading)
+            if result is not None:
+                data = result
+        
+        if data is None:
+            self._check_keithley_available(_now())
+        return data
+    
+    def _handle_keithley_error(self, current_time, error):
+        """
+        Traite une lecture du Keithley en échec et met la série conductance en pause
+        
+        Une erreur de communication (VISA, E/S) ou une lecture sans valeur marque
+        l'appareil comme indisponible ; les autres erreurs sont seulement signalées.
+        
+        Args:
+            current_time: Instant de la lecture
+            error: Exception levée pendant la lecture, ou None si aucune valeur n'a été retournée
+        """
+        if error is None:
+            # Si la lecture échoue, on considère que le Keithley n'est plus disponible
+            self._log.warning("Lecture de résistance a échoué (None retourné)")
+            disconnected = True
+        elif isinstance(error, (IOError, OSError, pyvisa.errors.VisaIOError)):
+            # Erreur de communication VISA critique - l'appareil est probablement déconnecté
+            self._keithley_error_count += 1
+            
+            # Les répétitions rapprochées sont écartées par le filtre du journal
+            self._log.warning("Error communicating with Keithley (erreur n°%d): %s",
+                              self._keithley_error_count, error)
+            disconnected = True
+        else:
+            self._log.warning("Error reading conductance: %s", error)
+            disconnected = False
+        
+        if disconnected:
+            # Marquer l'appareil comme non disponible pour éviter d'autres erreurs
+            self.keithley.device = None
+            self._keithley_error_reported = True
+        
+        # Erreur pouvant indiquer une déconnexion
+        self._pause_conductance(current_time)
+    
+    def _store_conductance(self, current_time, resistance, error):
+        """
+        Traite une lecture du Keithley : gestion des erreurs, enregistrement et détection
+        
+        Args:
+            current_time: Instant de la lecture
+            resistance: Résistance lue (None si la lecture a échoué)
+            error: Exception levée pendant la lecture, ou None
             
-            # Si on avait commencé à collecter des données, mémoriser le moment de la pause
-            if self.start_time_conductance is not None:
-                self.pause_time_conductance = current_time
-                
-            # Marquer la déconnexion pour l'interface si c'est une erreur qui peut indiquer une déconnexion
-            if hasattr(self, 'on_keithley_disconnected') and callable(self.on_keithley_disconnected):
-                self.on_keithley_disconnected()
+        Returns:
+            ConductanceSample: Données de la mesure enregistrée, ou None en cas d'échec
+        """
+        if error is not None or resistance is None:
+            self._handle_keithley_error(current_time, error)
             return None
         
+        if resistance == 0.0:
+            conductance = float('inf')
+        else:
+            conductance = (1 / resistance) * 1e6  # Convert to µS
+        
+        # Si on arrive ici, la lecture a réussi, donc l'appareil est fonctionnel
+        # Réinitialiser les compteurs d'erreur si nécessaire
+        self._keithley_error_count = 0
+        
         # Only initialize start_time when we actually get data to plot
         if self.start_time_conductance is None:
             self.start_time_conductance = current_time
         
         # Calculate timestamp
-        timestamp = current_time - self.start_time_conductance - self.elapsed_time_conductance
+        timestamp = self._rel_time(self.start_time_conductance, self.elapsed_time_conductance, current_time)
         
         # Store data
         self.timeList.append(timestamp)
         self.conductanceList.append(conductance)
         self.resistanceList.append(resistance)
+        self.latest_resistance = resistance
+        self._conductance_slope.push(timestamp, conductance)
+        self._current_slope = self._conductance_slope.slope()
+        self._update_stability_window(timestamp, conductance)
+        if not self._window15_ready:
+            count = len(self.timeList)
+            self._window10_ready = count >= 10
+            self._window15_ready = count >= 15
 
         # 1. Vérifier si la conductance a diminué sous le seuil après stabilisation
         if self.stabilized and not self.conductance_decrease_detected:
@@ -334,247 +784,403 @@ class MeasurementManager:
         if self.conductance_decrease_detected and not self.post_regen_stability_detected:
             self.detect_post_regen_stability()
 
-        return {
-            'timestamp': timestamp,
-            'conductance': conductance,
-            'resistance': resistance
-        }
+        return ConductanceSample(timestamp, conductance, resistance)
     
-    def read_arduino_status_only(self):
+    def update_pin_states(self, line):
         """
-        Read pin states from Arduino without storing CO2/temperature/humidity data
-        Returns: True if pin states were updated, False otherwise
+        Met à jour les états des pins si la ligne est un message d'état (VR, VS, TO, TF)
+        
+        Args:
+            line: Ligne reçue de l'Arduino
+        
+        Returns:
+            bool: True si la ligne contenait les états des pins, False sinon
         """
-        line = self.arduino.read_line()
+        pin_states = parse_pin_states(line)
+        if pin_states is None:
+            return False
         
-        # Check for sensor status messages (VR, VS, TO, TF pins)
-        if line and "VR:" in line and "VS:" in line and "TO:" in line and "TF:" in line:
-            try:
-                # Parse individual pin states
-                vr_part = line.split("VR:")[1].split()[0]
-                vs_part = line.split("VS:")[1].split()[0]
-                to_part = line.split("TO:")[1].split()[0]
-                tf_part = line.split("TF:")[1].split()[0]
-                
-                # Clarify status parsing (HIGH = True, LOW = False)
-                vr_state = vr_part == "HIGH"
-                vs_state = vs_part == "HIGH"
-                to_state = to_part == "HIGH"
-                tf_state = tf_part == "HIGH"
-                
-                # Print status for debugging
-                print(f"Pin states: VR={vr_state}, VS={vs_state}, TO={to_state}, TF={tf_state}")
-                
-                # Store the pin states for UI updating
-                self.pin_states = {
-                    'vr': vr_state,  # Vérin Rentré
-                    'vs': vs_state,  # Vérin Sorti
-                    'to': to_state,  # Trappe Ouverte
-                    'tf': tf_state   # Trappe Fermée
-                }
-                return True
-            except Exception as e:
-                print(f"Error parsing pin states: {e}, line: {line}")
-                return False
+        # Trace de débogage, formatée uniquement si le niveau DEBUG est actif
+        if self._log.isEnabledFor(logging.DEBUG):
+            self._log.debug("Pin states: VR=%(vr)s, VS=%(vs)s, TO=%(to)s, TF=%(tf)s", pin_states)
         
-        # Ignorer les données CO2/temp/humidity si la ligne commence par @
-        if line and line.startswith('@'):
-            return True  # Juste pour indiquer qu'une ligne a été traitée
-            
-        return False  # Aucune ligne valide
+        # Store the pin states for UI updating
+        self.pin_states = pin_states
+        return True
     
-    def read_arduino_data(self):
-        """
-        Read CO2, temperature, humidity data from Arduino and store it
-        Only called when measurements are active
+    def read_arduino_batch(self, store_co2=True, raise_errors=False):
         """
-        current_time = time.time()
+        Vide en une fois le tampon de réception de l'Arduino et traite toutes les lignes complètes
         
-        # Vérifier si l'Arduino est disponible
-        if not hasattr(self.arduino, 'read_line') or self.arduino.device is None:
-            return None
+        Les messages d'état des pins mettent à jour pin_states ; les lignes CO2
+        (préfixe @) sont enregistrées si store_co2 est vrai, ignorées sinon.
+        Toutes les lignes d'un même appel reçoivent le même horodatage.
         
-        # Initialize start_time only when first data point is collected
-        # instead of when the function is first called
-        line = self.arduino.read_line()
+        Args:
+            store_co2: Enregistrer les mesures CO2/température/humidité reçues
+            raise_errors: Propager les erreurs du port série au lieu de les journaliser
         
-        # Si pas de ligne, c'est peut-être un Arduino simulé ou pas de données
-        if not line:
-            return None
+        Returns:
+            list: Mesures enregistrées, dans l'ordre de réception
+                  (Co2Sample : timestamp, co2, temperature, humidity)
+        """
+        samples = []
         
-        # Handle pin state updates if they come through
-        if line and "VR:" in line and "VS:" in line and "TO:" in line and "TF:" in line:
-            try:
-                # Parse individual pin states
-                vr_part = line.split("VR:")[1].split()[0]
-                vs_part = line.split("VS:")[1].split()[0]
-                to_part = line.split("TO:")[1].split()[0]
-                tf_part = line.split("TF:")[1].split()[0]
-                
-                # Clarify status parsing (HIGH = True, LOW = False)
-                vr_state = vr_part == "HIGH"
-                vs_state = vs_part == "HIGH"
-                to_state = to_part == "HIGH"
-                tf_state = tf_part == "HIGH"
-                
-                # Store the pin states for UI updating
-                self.pin_states = {
-                    'vr': vr_state,  # Vérin Rentré
-                    'vs': vs_state,  # Vérin Sorti
-                    'to': to_state,  # Trappe Ouverte
-                    'tf': tf_state   # Trappe Fermée
-                }
-            except Exception as e:
-                print(f"Error parsing pin states: {e}, line: {line}")
-            
-            return None  # No CO2 data in this message
+        # Vérifier si l'Arduino est disponible
+        if not hasattr(self.arduino, 'read_lines') or self.arduino.device is None:
+            return samples
         
-        if not line.startswith('@'):
-            return None
+        try:
+            lines = self.arduino.read_lines()
+        except (SerialException, OSError) as e:
+            if raise_errors:
+                raise
+            self._log.warning("Error reading from Arduino: %s", e)
+            return samples
+        if not lines:
+            return samples
+        
+        current_time = _now()
+        timestamp = None
+        for line in lines:
+            if self.update_pin_states(line) or not store_co2:
+                continue
+            
+            parsed = parse_co2_data(line)
+            if parsed is None:
+                if line.startswith('@'):
+                    self._log.warning("Error parsing CO2/temp/humidity data: %s", line)
+                continue
+            co2, temperature, humidity = parsed
+            
+            if timestamp is None:
+                # Only initialize start_time when we actually get data to plot
+                if self.start_time_co2_temp_humidity is None:
+                    self.start_time_co2_temp_humidity = current_time
+                timestamp = self._rel_time(self.start_time_co2_temp_humidity, self.elapsed_time_co2_temp_humidity, current_time)
+            
+            # Store data
+            self.record_co2_sample(timestamp, co2, temperature, humidity)
+            samples.append(Co2Sample(timestamp, co2, temperature, humidity))
+        
+        return samples
+    
+    def read_arduino_status_only(self):
+        """
+        Read pin states from Arduino without storing CO2/temperature/humidity data
         
-        data = line[1:].split()
-        if len(data) != 3:
-            return None
+        Toutes les lignes disponibles sont lues ; les données CO2 sont ignorées.
         
-        # Parse data
-        try:
-            co2 = float(data[0])
-            temperature = float(data[1])
-            humidity = float(data[2])
-        except ValueError:
-            return None
+        Returns: True if pin states were updated, False otherwise
+        """
+        pin_states = self.pin_states
+        self.read_arduino_batch(store_co2=False)
+        return self.pin_states is not pin_states
+    
+    def read_arduino_data(self):
+        """
+        Read CO2, temperature, humidity data from Arduino and store it
+        Only called when measurements are active
         
-        # Only initialize start_time when we actually get data to plot
-        if self.start_time_co2_temp_humidity is None:
-            self.start_time_co2_temp_humidity = current_time
+        Enveloppe de compatibilité autour de read_arduino_batch : toutes les
+        lignes disponibles sont traitées et la dernière mesure est retournée.
+        """
+        samples = self.read_arduino_batch()
+        return samples[-1] if samples else None
         
-        # Calculate timestamp
-        timestamp = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+    def record_co2_sample(self, timestamp, co2, temperature, humidity):
+        """
+        Enregistre une mesure CO2/température/humidité et met à jour le maximum glissant
         
-        # Store data
+        Args:
+            timestamp: Temps relatif de la mesure (s)
+            co2: Concentration de CO2 (ppm)
+            temperature: Température (°C)
+            humidity: Humidité relative (%)
+        """
+        idx = len(self.values_co2)
         self.timestamps_co2.append(timestamp)
         self.values_co2.append(co2)
         self.timestamps_temp.append(timestamp)
         self.values_temp.append(temperature)
         self.timestamps_humidity.append(timestamp)
         self.values_humidity.append(humidity)
+        self.latest_co2 = co2
         
-        return {
-            'timestamp': timestamp,
-            'co2': co2,
-            'temperature': temperature,
-            'humidity': humidity
-        }
+        self._push_co2_max(co2, idx)
+    
+    def _push_co2_max(self, value, idx):
+        """
+        Ajoute un point à la file du maximum glissant de CO2
+        
+        Seules les valeurs strictement inférieures sont retirées : en cas d'égalité,
+        la première occurrence reste en tête (comme list.index).
         
+        Args:
+            value: Valeur de CO2 (ppm)
+            idx: Indice absolu du point dans values_co2
+        """
+        dq = self._co2_max_dq
+        while dq and dq[-1][0] < value:
+            dq.pop()
+        dq.append((value, idx))
+        if dq[0][1] <= idx - self._CO2_PEAK_WINDOW:
+            dq.popleft()
+    
     def read_arduino(self):
         """
         Méthode pour compatibilité - redirige vers read_arduino_data
         """
         return self.read_arduino_data()
     
-    def read_res_temp(self):
-        """Read resistance temperature data"""
-        current_time = time.time()
+    def _check_regen_available(self):
+        """
+        Vérifie que l'appareil de régénération est disponible avant une lecture
         
-        # Vérifier si le dispositif de régénération est disponible
-        if self.regen is None or not hasattr(self.regen, 'device') or self.regen.device is None:
+        Returns:
+            bool: True si le port série est attribué et ouvert, False sinon
+        """
+        if self.regen is None or not self.regen.is_connected():
             # Si l'erreur a déjà été signalée précédemment, ne pas la répéter
-            if not hasattr(self, '_regen_error_reported') or not self._regen_error_reported:
-                print("Warning: Attempting to read res_temp but regeneration device is not available")
+            if not self._regen_error_reported:
+                self._log.warning("Attempting to read res_temp but regeneration device is not available")
                 self._regen_error_reported = True
-            return None
+            return False
         
         # Réinitialiser le marqueur d'erreur puisque l'appareil est disponible
         self._regen_error_reported = False
         
-        try:
-            # Capturer toutes les erreurs possibles lors de la communication série
-            try:
-                # Vérifier que le device est toujours valide avant lecture
-                if not self.regen.device or not hasattr(self.regen.device, 'is_open') or not self.regen.device.is_open:
-                    print("Device disconnected before reading Tcons")
-                    self.regen.device = None
-                    self._regen_error_reported = True
-                    return None
-                    
-                raw_tcons = self.regen.read_variable('L', 'a')
-                
-                # Vérifier encore une fois que le device est valide
-                if not self.regen.device or not hasattr(self.regen.device, 'is_open') or not self.regen.device.is_open:
-                    print("Device disconnected after reading Tcons")
-                    self.regen.device = None
-                    self._regen_error_reported = True
-                    return None
-                
-                Tcons_value = float(raw_tcons)
-                
-                # On teste la deuxième lecture séparément pour isoler les erreurs
-                temperature_value = float(self.regen.read_variable('L', 'd'))
-                
-                # Si on arrive ici, les deux lectures ont réussi, donc l'appareil est fonctionnel
-                # Réinitialiser le compteur d'erreurs puisque les lectures ont réussi
-                if hasattr(self, '_serial_error_count'):
-                    self._serial_error_count = 0
-                
-                # Utilisation systématique de la dernière valeur définie pour Tcons
-                # plutôt que de faire confiance à la valeur retournée par l'appareil
-                if hasattr(self, 'last_set_Tcons') and self.last_set_Tcons is not None:
-                    # Si la dernière valeur définie est différente, on l'utilise
-                    if abs(Tcons_value - self.last_set_Tcons) > 50:  # Différence significative
-                        Tcons_value = self.last_set_Tcons
-                
-            except (OSError, IOError, serial.SerialException, PermissionError) as serial_err:
-                # Erreur de communication série critique - l'appareil est probablement déconnecté
-                # On la gère ici pour éviter de spammer la console
-                if not hasattr(self, '_serial_error_count'):
-                    self._serial_error_count = 0
-                
-                self._serial_error_count += 1
-                
-                # N'afficher que périodiquement les erreurs pour éviter le spam
-                if self._serial_error_count % 20 == 1:
-                    print(f"Error reading from regeneration device: {serial_err}")
-                
-                # Marquer l'appareil comme non disponible pour éviter d'autres erreurs
-                if hasattr(self.regen, 'device') and self.regen.device:
-                    try:
-                        # Tenter une fermeture propre
-                        self.regen.close()
-                    except:
-                        pass  # Ignorer les erreurs lors de la fermeture
-                
-                self.regen.device = None
-                self._regen_error_reported = True
-                return None
-                
-        except (ValueError, TypeError) as e:
-            # Erreur de conversion des données
-            print(f"Error processing temperature data: {e}, raw_tcons={raw_tcons if 'raw_tcons' in locals() else 'N/A'}")
-            return None
+        # Vérifier que le device est toujours valide avant lecture
+        if not getattr(self.regen.device, 'is_open', False):
+            self._log.warning("Device disconnected before reading Tcons")
+            self.regen.device = None
+            self._regen_error_reported = True
+            return False
+        return True
+    
+    def _acquire_res_temp(self):
+        """
+        Effectue l'échange bloquant avec l'appareil de régénération, sans modifier l'état des mesures
         
-        # Only initialize start_time when we actually get data to plot
-        if self.start_time_res_temp is None:
-            self.start_time_res_temp = current_time
+        Appelé depuis la boucle principale ou depuis le thread d'acquisition ; les
+        accès au port sont sérialisés par le verrou de RegenDevice.
         
-        # Calculate timestamp
-        timestamp = current_time - self.start_time_res_temp - self.elapsed_time_res_temp
+        Returns:
+            tuple: (instant de la lecture, consigne brute, température brute, exception ou None)
+        """
+        current_time = _now()
+        try:
+            # Consigne et température lues en un seul échange série
+            raw_tcons, raw_temp = self.regen.read_variables('L', ('a', 'd'))
+        except Exception as e:
+            return current_time, None, None, e
+        return current_time, raw_tcons, raw_temp, None
+    
+    def read_res_temp(self):
+        """Read resistance temperature data"""
+        # Avec l'acquisition en arrière-plan, le thread est le seul à interroger l'appareil
+        if self._reader_threads:
+            return self.poll_res_temp()
         
-        # Store data
-        self.timestamps_res_temp.append(timestamp)
-        self.temperatures.append(temperature_value)
-        self.Tcons_values.append(Tcons_value)
+        if not self._check_regen_available():
+            return None
         
-        return {
-            'timestamp': timestamp,
-            'temperature': temperature_value,
-            'Tcons': Tcons_value
-        }
+        return self._store_res_temp(*self._acquire_res_temp())
+    
+    def poll_res_temp(self):
+        """
+        Enregistre les lectures de température produites par le thread d'acquisition
+        
+        Returns:
+            ResTempSample: Dernière mesure enregistrée, ou None si aucune nouvelle mesure
+        """
+        data = None
+        while True:
+            try:
+                reading = self._res_temp_q.get_nowait()
+            except queue.Empty:
+                break
+            result = self._store_res_temp(*reading)
+            if result is not None:
+                data = result
+        
+        if data is None:
+            self._check_regen_available()
+        return data
+    
+    def _store_res_temp(self, current_time, raw_tcons, raw_temp, error):
+        """
+        Traite une lecture de l'appareil de régénération : gestion des erreurs et enregistrement
+        
+        Args:
+            current_time: Instant de la lecture
+            raw_tcons: Consigne lue (chaîne)
+            raw_temp: Température lue (chaîne)
+            error: Exception levée pendant la lecture, ou None
+            
+        Returns:
+            ResTempSample: Données de la mesure enregistrée, ou None en cas d'échec
+        """
+        if error is not None:
+            if not isinstance(error, (OSError, IOError, serial.SerialException, PermissionError)):
+                self._log.warning("Error reading res_temp: %s", error)
+                return None
+            
+            # Erreur de communication série critique - l'appareil est probablement déconnecté
+            self._serial_error_count += 1
+            
+            # Les répétitions rapprochées sont écartées par le filtre du journal
+            self._log.warning("Error reading from regeneration device (erreur n°%d): %s",
+                              self._serial_error_count, error)
+            
+            # Marquer l'appareil comme non disponible pour éviter d'autres erreurs
+            if self.regen.is_connected():
+                try:
+                    # Tenter une fermeture propre
+                    self.regen.close()
+                except:
+                    pass  # Ignorer les erreurs lors de la fermeture
+            
+            self.regen.device = None
+            self._regen_error_reported = True
+            return None
+        
+        # Vérifier encore une fois que le device est valide
+        if not getattr(self.regen.device, 'is_open', False):
+            self._log.warning("Device disconnected after reading Tcons")
+            self.regen.device = None
+            self._regen_error_reported = True
+            return None
+        
+        # Validation des réponses avant conversion (pas d'exception sur une réponse tronquée)
+        Tcons_value = parse_number(raw_tcons)
+        temperature_value = parse_number(raw_temp)
+        if Tcons_value is None or temperature_value is None:
+            self._log.warning("Error processing temperature data: raw_tcons=%r, raw_temp=%r",
+                              raw_tcons, raw_temp)
+            return None
+        
+        # Si on arrive ici, les deux lectures ont réussi, donc l'appareil est fonctionnel
+        # Réinitialiser le compteur d'erreurs puisque les lectures ont réussi
+        self._serial_error_count = 0
+        
+        # Utilisation systématique de la dernière valeur définie pour Tcons
+        # plutôt que de faire confiance à la valeur retournée par l'appareil
+        if self.last_set_Tcons is not None:
+            # Si la dernière valeur définie est différente, on l'utilise
+            if abs(Tcons_value - self.last_set_Tcons) > 50:  # Différence significative
+                Tcons_value = self.last_set_Tcons
+        
+        # Only initialize start_time when we actually get data to plot
+        if self.start_time_res_temp is None:
+            self.start_time_res_temp = current_time
+        
+        # Calculate timestamp
+        timestamp = self._rel_time(self.start_time_res_temp, self.elapsed_time_res_temp, current_time)
+        
+        # Store data
+        self.timestamps_res_temp.append(timestamp)
+        self.temperatures.append(temperature_value)
+        self.Tcons_values.append(Tcons_value)
+        
+        return ResTempSample(timestamp, temperature_value, Tcons_value)
+    
+    def start_background_reads(self, conductance_interval=1.0, res_temp_interval=1.0):
+        """
+        Démarre les threads d'acquisition du Keithley et de l'appareil de régénération
+        
+        Chaque thread effectue les lectures bloquantes (VISA, série) à son rythme et
+        dépose les résultats dans une file ; la boucle principale ne fait plus que les
+        enregistrer avec poll_conductance et poll_res_temp, sans attendre les appareils.
+        Tant que les threads tournent, read_conductance et read_res_temp vident les
+        files au lieu d'interroger les appareils. Sans effet si les threads tournent déjà.
+        
+        Chaque démarrage utilise son propre événement d'arrêt : un thread précédent
+        encore bloqué dans une lecture lente ne peut pas être relancé par erreur, et
+        il abandonne sa mesure au retour de cette lecture.
+        
+        Args:
+            conductance_interval: Délai en secondes entre deux lectures du Keithley
+            res_temp_interval: Délai en secondes entre deux lectures de température
+        """
+        if self._reader_threads:
+            return
+        
+        # Mesures déposées par un thread précédent après son arrêt : acquises avant
+        # la pause, elles auraient un horodatage antérieur aux dernières mesures
+        self._discard_queue(self._conductance_q)
+        self._discard_queue(self._res_temp_q)
+        
+        stop = threading.Event()
+        self._reader_stop = stop
+        self._reader_threads = [
+            threading.Thread(target=self._conductance_loop, args=(conductance_interval, stop),
+                             name="keithley-reader", daemon=True),
+            threading.Thread(target=self._res_temp_loop, args=(res_temp_interval, stop),
+                             name="regen-reader", daemon=True),
+        ]
+        for thread in self._reader_threads:
+            thread.start()
+    
+    def stop_background_reads(self, timeout=2.0):
+        """
+        Arrête les threads d'acquisition et enregistre les lectures encore en file
+        
+        Les lectures en file sont enregistrées immédiatement (poll_conductance,
+        poll_res_temp), avant que l'appelant ne note l'instant de pause : leurs
+        horodatages restent ainsi croissants après la reprise.
+        
+        Args:
+            timeout: Durée maximale d'attente de chaque thread en secondes
+        """
+        self._reader_stop.set()
+        for thread in self._reader_threads:
+            thread.join(timeout)
+            if thread.is_alive():
+                self._log.warning("Le thread %s est encore bloqué dans une lecture", thread.name)
+        self._reader_threads = []
+        
+        self.poll_conductance()
+        self.poll_res_temp()
+    
+    @staticmethod
+    def _discard_queue(q):
+        """Vide une file de lectures sans les enregistrer"""
+        while True:
+            try:
+                q.get_nowait()
+            except queue.Empty:
+                return
+    
+    def _conductance_loop(self, interval, stop):
+        """Boucle du thread d'acquisition du Keithley"""
+        while not stop.is_set():
+            # L'indisponibilité est signalée par poll_conductance sur le thread principal
+            if getattr(self.keithley, 'device', None) is not None:
+                reading = self._acquire_resistance()
+                # Arrêt demandé pendant la lecture : la mesure n'est plus attendue
+                if stop.is_set():
+                    break
+                self._conductance_q.put(reading)
+            stop.wait(interval)
+    
+    def _res_temp_loop(self, interval, stop):
+        """Boucle du thread d'acquisition de l'appareil de régénération"""
+        while not stop.is_set():
+            # L'indisponibilité est signalée par poll_res_temp sur le thread principal
+            regen = self.regen
+            if regen is not None and getattr(regen.device, 'is_open', False):
+                reading = self._acquire_res_temp()
+                if stop.is_set():
+                    break
+                self._res_temp_q.put(reading)
+            stop.wait(interval)
     
     def push_open_sensor(self):
         """Push/open the sensor"""
         # Vérifier si l'Arduino est disponible
         if not hasattr(self.arduino, 'send_command') or self.arduino.device is None:
-            print("Warning: Attempting to push/open sensor but Arduino is not available")
+            self._log.warning("Attempting to push/open sensor but Arduino is not available")
             return False
             
         self.arduino.send_command("ouvrir\n")
@@ -585,7 +1191,7 @@ class MeasurementManager:
         """Retract/close the sensor"""
         # Vérifier si l'Arduino est disponible
         if not hasattr(self.arduino, 'send_command') or self.arduino.device is None:
-            print("Warning: Attempting to retract/close sensor but Arduino is not available")
+            self._log.warning("Attempting to retract/close sensor but Arduino is not available")
             return False
             
         self.arduino.send_command("fermer\n")
@@ -596,138 +1202,166 @@ class MeasurementManager:
         """Initialize the system"""
         # Vérifier si l'Arduino est disponible
         if not hasattr(self.arduino, 'send_command') or self.arduino.device is None:
-            print("Warning: Attempting to initialize system but Arduino is not available")
+            self._log.warning("Attempting to initialize system but Arduino is not available")
             return False
             
         self.arduino.send_command("init\n")
         # État reste inchangé après initialisation
         return True
     
-    def set_R0(self, value):
-        """Set R0 value"""
+    def set_R0(self, value, force=False):
+        """
+        Set R0 value
+        
+        Args:
+            value: Valeur de R0 à envoyer
+            force: Si True, envoie la valeur même si elle est identique au dernier R0 écrit
+        
+        Returns:
+            bool: True si l'appareil de régénération est disponible, False sinon
+        """
         # Vérifier si le dispositif de régénération est disponible
-        if self.regen is None or not hasattr(self.regen, 'device') or self.regen.device is None:
-            print("Warning: Attempting to set R0 but regeneration device is not available")
+        if self.regen is None or not self.regen.is_connected():
+            self._log.warning("Attempting to set R0 but regeneration device is not available")
+            self._current_R0 = None
             return False
+        
+        try:
+            value_float = float(value)
+        except ValueError:
+            value_float = None
+        
+        # R0 déjà programmé : aucune écriture série
+        if not force and value_float is not None and value_float == self._current_R0:
+            return True
             
-        self.regen.write_parameter('e', 'b', str(value))
+        result = self.regen.write_parameter('e', 'b', str(value))
+        self._current_R0 = value_float if result else None
+        # La valeur en cache n'est plus à jour
+        self._r0_cache = (0.0, None)
         return True
     
-    def set_Tcons(self, value):
-        """Set Tcons value"""
+    def set_Tcons(self, value, verify=False, force=False):
+        """
+        Set Tcons value
+        
+        Args:
+            value: Consigne de température à envoyer
+            verify: Si True, relit la consigne sur l'appareil et ne retourne True
+                    que si elle correspond à la valeur envoyée
+            force: Si True, envoie la consigne même si elle est identique à la
+                   dernière consigne programmée (chemins de sécurité, saisie utilisateur)
+        
+        Returns:
+            bool: True si l'écriture de la consigne a été confirmée (et la consigne relue si
+                  demandé), False sinon
+        """
         # Vérifier si le dispositif de régénération est disponible
-        if self.regen is None or not hasattr(self.regen, 'device') or self.regen.device is None:
-            print("Warning: Attempting to set Tcons but regeneration device is not available")
+        if self.regen is None or not self.regen.is_connected():
+            self._log.warning("Attempting to set Tcons but regeneration device is not available")
+            self._current_tcons = None
             return False
         
         # Vérifier que le port est ouvert
-        if not hasattr(self.regen.device, 'is_open') or not self.regen.device.is_open:
-            print("Warning: Serial port is closed, cannot set Tcons")
+        if not getattr(self.regen.device, 'is_open', False):
+            self._log.warning("Serial port is closed, cannot set Tcons")
             self.regen.device = None
+            self._current_tcons = None
             return False
             
         try:
             value_float = float(value)
-            self.last_set_Tcons = value_float
-            
-            # 1. Utiliser la méthode write_parameter pour envoyer la commande
-            result = self.regen.write_parameter('e', 'a', str(value))
-            if not result:
-                print(f"Avertissement: Échec de l'envoi de Tcons via write_parameter")
-                # Si cette méthode échoue, on essaie la méthode directe en 2
-                
-            # 2. Essayer également d'écrire directement sur le périphérique pour s'assurer
-            # que la commande est transmise efficacement
-            try:
-                if self.regen.device and hasattr(self.regen.device, 'is_open') and self.regen.device.is_open:
-                    command_str = f"ea{value}\n"
-                    self.regen.device.write(command_str.encode())
-                    
-                    # Si l'opération a réussi, réinitialiser le compteur d'erreurs
-                    if hasattr(self, '_serial_error_count'):
-                        self._serial_error_count = 0
-                        
-                    return True  # Nous considérons que cette méthode fonctionne même si write_parameter échoue
-                else:
-                    print("Warning: Device not open when attempting direct write")
-                    self.regen.device = None
-                    return False
-            except (OSError, IOError, SerialException, PermissionError) as e:
-                print(f"Erreur lors de l'écriture directe de Tcons: {e}")
-                # Marquer l'appareil comme non disponible
-                if hasattr(self.regen, 'device') and self.regen.device:
-                    try:
-                        # Tenter une fermeture propre
-                        self.regen.close()
-                    except:
-                        pass  # Ignorer les erreurs lors de la fermeture
-                
-                self.regen.device = None
-                return False
-            except Exception as e:
-                print(f"Erreur inattendue lors de l'écriture directe de Tcons: {e}")
-                # Si la méthode directe échoue mais que write_parameter a réussi, on renvoie quand même True
-                return result
-                
         except ValueError:
-            print(f"Erreur: valeur Tcons invalide '{value}'")
+            self._log.warning("valeur Tcons invalide '%s'", value)
             return False
-            
-        return True
+        
+        self.last_set_Tcons = value_float
+        
+        # Consigne déjà programmée : aucune écriture série (sauf vérification ou envoi forcé)
+        if not verify and not force and value_float == self._current_tcons:
+            return True
+        
+        # Une seule commande par consigne : write_parameter gère déjà les erreurs série,
+        # marque l'appareil comme déconnecté si le port tombe et n'attend la confirmation
+        # du thread d'écriture que pendant un délai borné. Le cache n'est mis à jour
+        # qu'une fois l'écriture confirmée
+        result = self.regen.write_parameter('e', 'a', str(value))
+        if result is False and self.regen.device is not None:
+            # Nouvelle tentative uniquement si la consigne n'a pas été envoyée
+            # (None : envoi en cours non confirmé, qui ne doit pas être répété)
+            self._log.warning("Échec de l'envoi de Tcons via write_parameter, nouvelle tentative")
+            result = self.regen.write_parameter('e', 'a', str(value))
+        
+        if result:
+            # Si l'opération a réussi, réinitialiser le compteur d'erreurs
+            self._serial_error_count = 0
+            self._current_tcons = value_float
+        else:
+            if result is None:
+                self._log.warning("Envoi de Tcons non confirmé")
+            else:
+                self._log.warning("Échec de l'envoi de Tcons")
+            self._current_tcons = None
+            result = False
+        
+        if result and verify:
+            # Relecture de la consigne : read_variable retourne toujours une chaîne
+            echoed = self.regen.read_variable('L', 'a')
+            try:
+                result = abs(float(echoed) - value_float) < 1.0
+            except ValueError:
+                result = False
+            if not result:
+                self._log.warning("Tcons relu (%s) différent de la consigne %s", echoed, value_float)
+                self._current_tcons = None
+        
+        return result
+    
+    def read_R0(self, force=False):
+        """
+        Read R0 value
+        
+        Une valeur valide lue il y a moins de _R0_CACHE_TTL secondes est réutilisée
+        sans nouvel échange série : plusieurs étapes d'une même transition de
+        protocole relisent R0.
+        
+        Args:
+            force: Interroger l'appareil même si une valeur récente est en cache
+        
+        Returns:
+            float: Valeur de R0, ou None si la lecture a échoué
+        """
+        now = _now()
+        cached_at, value = self._r0_cache
+        if not force and value is not None and now - cached_at < self._R0_CACHE_TTL:
+            return value
+        
+        value = self._read_R0_device()
+        # Seules les lectures valides sont mémorisées : un échec invalide le cache
+        self._r0_cache = (now, value)
+        return value
     
-    def read_R0(self):
-        """Read R0 value"""
+    def _read_R0_device(self):
+        """Lit R0 sur l'appareil de régénération (échange série)"""
         # Vérifier si le dispositif de régénération est disponible
-        if self.regen is None or not hasattr(self.regen, 'device') or self.regen.device is None:
-            print("Warning: Attempting to read R0 but regeneration device is not available")
+        if self.regen is None or not self.regen.is_connected():
+            self._log.warning("Attempting to read R0 but regeneration device is not available")
             return None
             
         # Vérifier que le port est ouvert
-        if not hasattr(self.regen.device, 'is_open') or not self.regen.device.is_open:
-            print(f"Warning: Serial port is closed, cannot read R0. Port: {self.regen.port}")
+        if not getattr(self.regen.device, 'is_open', False):
+            self._log.warning("Serial port is closed, cannot read R0. Port: %s", self.regen.port)
             self.regen.device = None
             return None
             
         try:
             # La méthode read_variable retourne maintenant toujours une chaîne, jamais None
             R = self.regen.read_variable('L', 'c')
-            
-            # Vérification de sécurité supplémentaire
-            if not isinstance(R, str):
-                print(f"Warning: R0 reading returned non-string type: {type(R)}")
-                return None
-                
-            try:
-                # Tenter de faire le split avec gestion d'erreur
-                if 'c' in R:
-                    parts = R.split('c')
-                    if len(parts) > 1:
-                        try:
-                            value = float(parts[1])
-                            # Réinitialiser le compteur d'erreurs si la lecture réussit
-                            if hasattr(self, '_serial_error_count'):
-                                self._serial_error_count = 0
-                            return value
-                        except ValueError:
-                            print(f"Error converting R0: '{parts[1]}' is not a valid float")
-                else:
-                    # Essayer de convertir directement si le format attendu n'est pas présent
-                    try:
-                        value = float(R)
-                        # Réinitialiser le compteur d'erreurs si la lecture réussit
-                        if hasattr(self, '_serial_error_count'):
-                            self._serial_error_count = 0
-                        return value
-                    except ValueError:
-                        print(f"Error converting direct R0 value: '{R}' is not a valid float")
-            except Exception as e:
-                print(f"Unexpected error processing R0 value '{R}': {e}")
-                
         except (OSError, IOError, SerialException, PermissionError) as e:
-            print(f"Error reading R0: {e}")
+            self._log.warning("Error reading R0: %s", e)
             
             # Marquer l'appareil comme non disponible
-            if hasattr(self.regen, 'device') and self.regen.device:
+            if self.regen.is_connected():
                 try:
                     # Tenter une fermeture propre
                     self.regen.close()
@@ -736,34 +1370,52 @@ class MeasurementManager:
             
             self.regen.device = None
             return None
-            
-        return None
+        
+        # Vérification de sécurité supplémentaire
+        if not isinstance(R, str):
+            self._log.warning("R0 reading returned non-string type: %s", type(R))
+            return None
+        
+        # Valeur après le premier 'c' (sep vide si absent), sinon la réponse entière,
+        # validée avant conversion : aucune exception sur une réponse mal formée
+        _, sep, tail = R.partition('c')
+        value = parse_number(tail if sep else R)
+        if value is None:
+            if sep:
+                self._log.warning("Error converting R0: '%s' is not a valid float", tail)
+            else:
+                self._log.warning("Error converting direct R0 value: '%s' is not a valid float", R)
+            return None
+        
+        # Réinitialiser le compteur d'erreurs si la lecture réussit
+        self._serial_error_count = 0
+        return value
     
     def detect_increase(self):
         """
         Detect increase in conductance
         Returns: True if increase detected, False otherwise
         """
-        if self.increase_detected or len(self.conductanceList) < 10:
+        if self.increase_detected or not self._window10_ready:
             return False
         
-        # Calculate slope over last 10 points
-        time_window = self.timeList[-10:]
-        conductance_window = self.conductanceList[-10:]
-        slope = np.polyfit(time_window, conductance_window, 1)[0]  # slope in S/s
+        # Slope over last 10 points, computed once when the sample was recorded
+        slope = self._current_slope  # slope in S/s
         
         if INCREASE_SLOPE_MIN <= slope <= INCREASE_SLOPE_MAX:
+            current_time = self.timeList[-1]
             self.increase_detected = True
             self.max_slope_value = slope
-            self.max_slope_time = self.timeList[-1]
+            self.max_slope_time = current_time
             
             # Update increase_time only if it's not already set
             # Pour garder T perco de la première détection et ne pas le réinitialiser
             if self.increase_time is None:
-                self.increase_time = self.timeList[-1]
-                print(f"Time {self.timeList[-1]/60:.1f} min: Increase detected! Slope = {slope:.2f} µS/s")
+                self.increase_time = current_time
+                self._log.info("Time %.1f min: Increase detected! Slope = %.2f µS/s", current_time/60, slope)
             else:
-                print(f"Time {self.timeList[-1]/60:.1f} min: Increase detected again! Slope = {slope:.2f} µS/s (T perco preserved: {self.increase_time/60:.1f} min)")
+                self._log.info("Time %.1f min: Increase detected again! Slope = %.2f µS/s (T perco preserved: %.1f min)",
+                               current_time/60, slope, self.increase_time/60)
             
             return True
         
@@ -774,43 +1426,27 @@ class MeasurementManager:
         Detect stabilization in conductance
         Returns: True if stabilization detected, False otherwise
         """
-        if not self.increase_detected or self.stabilized or len(self.timeList) < 10:
+        if not self.increase_detected or self.stabilized or not self._window10_ready:
             return False
         
         current_time = self.timeList[-1]
         
-        # Find indices for sliding window
-        start_idx = None
-        end_idx = None
-        
-        for i, t in enumerate(self.timeList):
-            if t >= current_time - SLIDING_WINDOW/2 and start_idx is None:
-                start_idx = i
-            if t <= current_time + SLIDING_WINDOW/2:
-                end_idx = i
-        
-        if end_idx >= len(self.timeList):
-            end_idx = len(self.timeList) - 1
-        
-        if start_idx is not None and end_idx is not None and start_idx < end_idx:
-            window_time = self.timeList[start_idx:end_idx+1]
-            window_conductance = self.conductanceList[start_idx:end_idx+1]
-            
-            if len(window_time) > 1:
-                current_slope = np.polyfit(window_time, window_conductance, 1)[0]
-                
-                # Update maximum slope if needed
-                if current_slope > self.max_slope_value:
-                    self.max_slope_value = current_slope
-                    self.max_slope_time = current_time
-                
-                # Check if stabilized
-                if (current_time - self.max_slope_time >= STABILITY_DURATION and 
-                    abs(current_slope) < INCREASE_SLOPE_MIN/2):
-                    self.stabilized = True
-                    self.stabilization_time = current_time
-                    print(f"Time {current_time/60:.1f} min: Stabilization detected! Last slope = {current_slope:.4f} µS/s")
-                    return True
+        # La régression de la fenêtre glissante est tenue à jour à chaque mesure
+        if len(self._stability_regression) > 1:
+            current_slope = self._stability_regression.slope()
+            
+            # Update maximum slope if needed
+            if current_slope > self.max_slope_value:
+                self.max_slope_value = current_slope
+                self.max_slope_time = current_time
+            
+            # Check if stabilized
+            if (current_time - self.max_slope_time >= STABILITY_DURATION and 
+                abs(current_slope) < _STABILIZATION_SLOPE_MAX):
+                self.stabilized = True
+                self.stabilization_time = current_time
+                self._log.info("Time %.1f min: Stabilization detected! Last slope = %.4f µS/s", current_time/60, current_slope)
+                return True
         
         return False
         
@@ -822,33 +1458,39 @@ class MeasurementManager:
             None: Updates self.co2_peak_detected flag if a peak is detected
         """
         if not self.co2_peak_detected and self.co2_increase_detected and len(self.values_co2) >= 5:
-            current_co2 = self.values_co2[-1]
-            max_co2 = max(self.values_co2[-10:])  # Chercher sur les 10 dernières valeurs
+            current_co2 = self.latest_co2
+            # Maximum des 10 dernières valeurs et son indice : tête de la file monotone (O(1)).
+            # Si des points ont été ajoutés hors de record_co2_sample, la file est
+            # reconstruite une fois à partir de la fin de la série.
+            end = len(self.values_co2)
+            dq = self._co2_max_dq
+            if not dq or dq[-1][1] != end - 1:
+                dq.clear()
+                for idx in range(max(0, end - self._CO2_PEAK_WINDOW), end):
+                    self._push_co2_max(self.values_co2[idx], idx)
+            max_co2, max_idx = dq[0]
             
             # Condition 1: Augmentation minimale de 5 ppm par rapport à la base
             if (max_co2 - self.co2_base_value) >= 5:
                 # Condition 2: Descente actuelle d'au moins 1 ppm par rapport au max
                 if (max_co2 - current_co2) >= 1:
                     # Condition 3: Pente descendante significative
-                    slope = np.polyfit(self.timestamps_co2[-3:], self.values_co2[-3:], 1)[0]
+                    # Pente des moindres carrés sur les 3 derniers points
+                    t = self.timestamps_co2
+                    v = self.values_co2
+                    slope = three_point_slope(t[-3], t[-2], t[-1], v[-3], v[-2], v[-1])
                     if slope < -0.05:  # Pente descendante significative
                         self.co2_peak_detected = True
                         self.co2_peak_value = max_co2
-                        self.co2_peak_time = self.timestamps_co2[self.values_co2.index(max_co2, -10)]
+                        self.co2_peak_time = self.timestamps_co2[max_idx]
                         
                         # Enregistrer le timestamp du pic CO2 pour l'affichage avec pointillés
                         if self.start_time_co2_temp_humidity is not None:
                             self.regeneration_timestamps['co2_peak_reached'] = self.co2_peak_time
                         
-                        print(f"Pic CO2 détecté à {max_co2} ppm (augmentation de {max_co2-self.co2_base_value:.1f} ppm)")
-                        
-                        # Initialiser immédiatement la surveillance de la restabilisation
-                        self.co2_restabilization_reference = current_co2
-                        self.co2_restabilization_start_time = time.time()
-                        # Enregistrer le timestamp pour le début de la recherche de restabilisation
-                        if self.start_time_co2_temp_humidity is not None:
-                            self.regeneration_timestamps['co2_restabilization_start_time'] = self.timestamps_co2[-1]
-                        print(f"Début automatique de la surveillance de restabilisation CO2 à {current_co2} ppm")
+                        self._log.info("Pic CO2 détecté à %s ppm (augmentation de %.1f ppm)", max_co2, max_co2 - self.co2_base_value)
+                        # La surveillance de la restabilisation est initialisée par la
+                        # transition CO2_PEAK (_on_regen_co2_peak)
         
     def check_reset_detection_indicators(self):
         """
@@ -868,14 +1510,15 @@ class MeasurementManager:
             if not self.conductance_decrease_detected:
                 self.conductance_decrease_detected = True
                 self.conductance_decrease_time = self.timeList[-1]
-                print(f"Temps {self.timeList[-1]/60:.1f} min: Décroissance détectée - Conductance sous 5 µS ({current_conductance:.2f} µS)")
+                self._log.info("Temps %.1f min: Décroissance détectée - Conductance sous 5 µS (%.2f µS)",
+                               self.timeList[-1]/60, current_conductance)
             
             # Réinitialise seulement les indicateurs de détection, pas le temps de percolation
             old_increase_time = self.increase_time  # Mémoriser le temps de percolation actuel
             self.increase_detected = False
             self.stabilized = False
             # Ne pas réinitialiser le temps de percolation: self.increase_time reste inchangé
-            print(f"Conductance redescendue à {current_conductance:.2f} µS - Indicateurs réinitialisés (T perco conservé)")
+            self._log.info("Conductance redescendue à %.2f µS - Indicateurs réinitialisés (T perco conservé)", current_conductance)
             return True
             
         return False
@@ -888,13 +1531,11 @@ class MeasurementManager:
         Returns: True si une remontée est détectée et l'indicateur actualisé, False sinon
         """
         # Ne vérifie que si la conductance a été détectée comme ayant diminué et qu'il y a assez de mesures
-        if not self.conductance_decrease_detected or len(self.conductanceList) < 10:
+        if not self.conductance_decrease_detected or not self._window10_ready:
             return False
 
         # Calcule la pente sur les 10 derniers points pour détecter une augmentation
-        time_window = self.timeList[-10:]
-        conductance_window = self.conductanceList[-10:]
-        slope = np.polyfit(time_window, conductance_window, 1)[0]  # pente en S/s
+        slope = self._current_slope  # pente en S/s
 
         # Vérifie si la pente indique une augmentation significative
         if INCREASE_SLOPE_MIN <= slope <= INCREASE_SLOPE_MAX:
@@ -906,8 +1547,9 @@ class MeasurementManager:
             self.conductance_decrease_detected = False  # Réinitialise le marqueur de diminution
             self.post_regen_stability_detected = False  # Réinitialiser aussi le marqueur de stabilisation post-régén
 
-            print(f"Temps {self.timeList[-1]/60:.1f} min: Nouvelle augmentation détectée après diminution - Pente = {slope:.2f} µS/s")
-            print(f"Indicateur T perco actualisé à {self.increase_time/60:.1f} min")
+            self._log.info("Temps %.1f min: Nouvelle augmentation détectée après diminution - Pente = %.2f µS/s",
+                           self.timeList[-1]/60, slope)
+            self._log.info("Indicateur T perco actualisé à %.1f min", self.increase_time/60)
 
             return True
 
@@ -919,22 +1561,21 @@ class MeasurementManager:
         Returns: True si restabilisation détectée, False sinon
         """
         # Vérifie seulement si décroissance a été détectée mais pas encore restabilisé
-        if not self.conductance_decrease_detected or self.post_regen_stability_detected or len(self.timeList) < 15:
+        if not self.conductance_decrease_detected or self.post_regen_stability_detected or not self._window15_ready:
             return False
             
         current_time = self.timeList[-1]
         
         # Calculer la pente sur les 10 derniers points pour vérifier la stabilité
-        time_window = self.timeList[-10:]
-        conductance_window = self.conductanceList[-10:]
-        current_slope = np.polyfit(time_window, conductance_window, 1)[0]
+        current_slope = self._current_slope
         
         # Vérifier si la conductance s'est stabilisée après la chute
         # La pente est proche de zéro et le temps écoulé depuis la décroissance est significatif
-        if abs(current_slope) < INCREASE_SLOPE_MIN/3 and current_time - self.conductance_decrease_time >= STABILITY_DURATION:
+        if abs(current_slope) < _POST_REGEN_SLOPE_MAX and current_time - self.conductance_decrease_time >= STABILITY_DURATION:
             self.post_regen_stability_detected = True
             self.post_regen_stability_time = current_time
-            print(f"Temps {current_time/60:.1f} min: Restabilisation post-régénération détectée! Pente = {current_slope:.4f} µS/s")
+            self._log.info("Temps %.1f min: Restabilisation post-régénération détectée! Pente = %.4f µS/s",
+                           current_time/60, current_slope)
             return True
             
         return False
@@ -942,8 +1583,22 @@ class MeasurementManager:
     def automatic_mode_handler(self):
         """
         Handle automatic mode logic
+        
+        Les attentes de vanne (VALVE_DELAY) et de fin de cycle (STABILITY_DURATION)
+        ne bloquent plus l'appelant : une échéance est mémorisée et les appels
+        suivants retournent immédiatement jusqu'à ce qu'elle soit atteinte.
+        La vérification de stabilité du CO2 et la surveillance de la régénération
+        sont des étapes sans échéance : elles examinent les dernières mesures
+        (lues par la boucle principale) à chaque appel, sans attente.
+        
         Returns: True if action was taken, False otherwise
         """
+        # Attente en cours : poursuivre le cycle uniquement une fois l'échéance passée
+        if self._auto_state != 'IDLE':
+            if _now() < self._auto_deadline:
+                return False
+            return self._advance_auto_state()
+        
         # Check for increase in conductance
         if self.detect_increase():
             return True
@@ -952,119 +1607,159 @@ class MeasurementManager:
         if self.detect_stabilization():
             # Close valve after stabilization
             self.retract_close_sensor()
-            print("Auto: Closing valve")
-            time.sleep(VALVE_DELAY)
-            
-            # Read and update R0
-            R0 = self.read_R0()
-            if R0 is not None and R0 < R0_THRESHOLD:
-                # Actualiser R0 en l'écrivant dans les paramètres
-                self.set_R0(str(R0))
-                print(f"Auto: R0 updated to {R0}")
-                
-                # Vérifier la stabilité du CO2 avant d'augmenter la température
-                if len(self.values_co2) >= 3:
-                    # Initialisation de la vérification de stabilité
-                    co2_stable = False
-                    co2_stable_start_time = time.time()
-                    co2_reference = self.values_co2[-1]
-                    print(f"Auto: Vérification de la stabilité du CO2 avant régénération (valeur initiale: {co2_reference} ppm)")
-                    
-                    # Boucle de vérification de la stabilité
-                    while not co2_stable:
-                        # Vérifier si de nouvelles données CO2 sont disponibles
-                        self.read_arduino_data()
-                        if len(self.values_co2) > 0:
-                            current_co2 = self.values_co2[-1]
-                            current_time = time.time()
-                            
-                            # Vérifier si le CO2 est stable
-                            if abs(current_co2 - co2_reference) <= CO2_STABILITY_THRESHOLD:
-                                # Stable, vérifier la durée
-                                if current_time - co2_stable_start_time >= CO2_STABILITY_DURATION:
-                                    co2_stable = True
-                                    print(f"Auto: CO2 stable pendant {CO2_STABILITY_DURATION} secondes, lancement chauffage")
-                            else:
-                                # Non stable, réinitialiser la référence
-                                print(f"Auto: CO2 instable, nouvelle référence: {current_co2} ppm")
-                                co2_reference = current_co2
-                                co2_stable_start_time = current_time
-                                
-                        # Petite pause pour éviter de surcharger le processeur
-                        time.sleep(0.5)
-                        
-                        # Vérifier si le temps d'attente est trop long (3 minutes max)
-                        if time.time() - co2_stable_start_time > 3*60 and not co2_stable:
-                            print("Auto: Délai d'attente pour stabilité CO2 dépassé, continuation du processus")
-                            break
-                
-                # Une fois la stabilité CO2 vérifiée, lancer la régénération
-                print("Auto: Démarrage de la régénération - chauffage à haute température")
-                success = self.set_Tcons(str(REGENERATION_TEMP))
-                if not success:
-                    print(f"Auto: Erreur lors de la définition de Tcons à {REGENERATION_TEMP}°C")
-                
-                # Ajouter une sécurité pour le temps de régénération
-                regeneration_start_time = time.time()
-                regen_completed = False
-                
-                # Surveiller la conductance pendant la régénération
-                while not regen_completed and (time.time() - regeneration_start_time) < 3*60:
-                    # Lire la conductance actuelle
-                    conductance_data = self.read_conductance()
-                    if conductance_data and len(self.conductanceList) > 0:
-                        current_conductance = self.conductanceList[-1]
-                        
-                        # Vérifier si la conductance est descendue sous 1 µS
-                        if current_conductance <= 5e-6:
-                            print(f"Auto: Régénération terminée - Conductance inférieure à 1 µS ({current_conductance*1e6:.6f} µS)")
-                            regen_completed = True
-                            break
-                    
-                    # Petite pause pour éviter de surcharger le processeur
-                    time.sleep(0.5)
-                
-                # Si le temps maximum de régénération est atteint sans que la conductance ne descende assez
-                if not regen_completed:
-                    print("Auto: Temps maximum de régénération atteint (3 min) - Arrêt forcé")
-                
-                # Dans tous les cas, remettre Tcons à basse température
-                success = self.set_Tcons(str(TCONS_LOW))
-                if not success:
-                    print(f"Auto: Erreur lors de la définition de Tcons à {TCONS_LOW}°C")
-                
-            elif R0 is not None and R0 == 1000:
-                print("Error - R0 not detected")
-            else:
-                print("Auto: Error - R0 too high (> 12)")
-            
+            self._log.info("Auto: Closing valve")
+            self._start_auto_wait('VALVE_CLOSING', VALVE_DELAY)
             return True
             
         # Check if conductance has returned to 0 after stabilization
         if self.stabilized and len(self.conductanceList) > 0 and self.conductanceList[-1] <= 5e-6:
-            print(f"Auto: Conductance decreased below 1 µS ({self.conductanceList[-1]*1e6:.2f} µS)")
+            self._log.info("Auto: Conductance decreased below 1 µS (%.2f µS)", self.conductanceList[-1]*1e6)
             
             # Set Tcons to low temperature if not already done
-            success = self.set_Tcons(str(TCONS_LOW))
+            success = self.set_Tcons(_TCONS_LOW_STR)
             if not success:
-                print(f"Auto: Erreur lors de la définition de Tcons à {TCONS_LOW}°C")
+                self._log.warning("Auto: Erreur lors de la définition de Tcons à %s°C", TCONS_LOW)
             
-            time.sleep(STABILITY_DURATION)
+            self._start_auto_wait('COOLDOWN', STABILITY_DURATION)
+            return True
             
-            print("Auto: Cycle completed. Ready for next cycle.")
+        return False
+    
+    def _start_auto_wait(self, state, duration):
+        """
+        Place le mode automatique en attente non bloquante
+        
+        Args:
+            state: Étape du cycle automatique à reprendre à l'échéance
+            duration: Durée d'attente en secondes
+        """
+        self._auto_state = state
+        self._auto_deadline = _now() + duration
+    
+    def _advance_auto_state(self):
+        """
+        Exécute l'action qui suit une attente du mode automatique
+        
+        Returns:
+            bool: True (une action a été effectuée)
+        """
+        state = self._auto_state
+        self._auto_state = 'IDLE'
+        
+        if state == 'VALVE_CLOSING':
+            # Vanne fermée : mise à jour de R0 puis régénération
+            self._run_auto_regeneration()
+        elif state == 'COOLDOWN':
+            self._log.info("Auto: Cycle completed. Ready for next cycle.")
             
             # Open valve
             self.push_open_sensor()
-            print("Auto: Opening valve")
-            time.sleep(VALVE_DELAY)
-            
+            self._log.info("Auto: Opening valve")
+            self._start_auto_wait('VALVE_OPENING', VALVE_DELAY)
+        elif state == 'VALVE_OPENING':
             # Reset detection flags
             self.increase_detected = False
             self.stabilized = False
+        elif state == 'CO2_STABILITY':
+            self._poll_auto_co2_stability()
+        elif state == 'REGEN_MONITOR':
+            self._poll_auto_regeneration()
+        
+        return True
+    
+    def _run_auto_regeneration(self):
+        """Met à jour R0 puis lance la régénération du mode automatique (vanne fermée)"""
+        # Read and update R0
+        R0 = self.read_R0()
+        if R0 is not None and R0 < R0_THRESHOLD:
+            # Actualiser R0 en l'écrivant dans les paramètres
+            self.set_R0(str(R0))
+            self._log.info("Auto: R0 updated to %s", R0)
+            
+            # Vérifier la stabilité du CO2 avant d'augmenter la température
+            if len(self.values_co2) >= 3:
+                # Initialisation de la vérification de stabilité
+                self._auto_co2_reference = self.latest_co2
+                self._auto_co2_since = _now()
+                self._log.info("Auto: Vérification de la stabilité du CO2 avant régénération (valeur initiale: %s ppm)",
+                               self._auto_co2_reference)
+                self._start_auto_wait('CO2_STABILITY', 0)
+            else:
+                self._start_auto_heating()
             
-            return True
-            
-        return False
+        elif R0 is not None and R0 == 1000:
+            self._log.warning("Error - R0 not detected")
+        else:
+            self._log.warning("Auto: Error - R0 too high (> 12)")
+    
+    def _poll_auto_co2_stability(self):
+        """Vérifie la stabilité du CO2 avant la régénération du mode automatique (sans attente)"""
+        current_co2 = self.latest_co2
+        current_time = _now()
+        
+        if current_co2 is not None:
+            # Vérifier si le CO2 est stable
+            if abs(current_co2 - self._auto_co2_reference) <= CO2_STABILITY_THRESHOLD:
+                # Stable, vérifier la durée
+                if current_time - self._auto_co2_since >= CO2_STABILITY_DURATION:
+                    self._log.info("Auto: CO2 stable pendant %s secondes, lancement chauffage", CO2_STABILITY_DURATION)
+                    self._start_auto_heating()
+                    return
+            else:
+                # Non stable, réinitialiser la référence
+                self._log.info("Auto: CO2 instable, nouvelle référence: %s ppm", current_co2)
+                self._auto_co2_reference = current_co2
+                self._auto_co2_since = current_time
+        
+        # Vérifier si le temps d'attente est trop long (3 minutes max)
+        if current_time - self._auto_co2_since > 3*60:
+            self._log.info("Auto: Délai d'attente pour stabilité CO2 dépassé, continuation du processus")
+            self._start_auto_heating()
+            return
+        
+        self._start_auto_wait('CO2_STABILITY', 0)
+    
+    def _start_auto_heating(self):
+        """Lance le chauffage de régénération du mode automatique et sa surveillance"""
+        self._log.info("Auto: Démarrage de la régénération - chauffage à haute température")
+        success = self.set_Tcons(_REGEN_TEMP_STR)
+        if not success:
+            self._log.warning("Auto: Erreur lors de la définition de Tcons à %s°C", REGENERATION_TEMP)
+        
+        # Ajouter une sécurité pour le temps de régénération
+        self._auto_regen_start = _now()
+        self._auto_conductance_seen = len(self.conductanceList)
+        self._start_auto_wait('REGEN_MONITOR', 0)
+    
+    def _poll_auto_regeneration(self):
+        """Surveille la conductance pendant la régénération du mode automatique (sans attente)"""
+        # Examiner uniquement une nouvelle mesure de conductance
+        count = len(self.conductanceList)
+        if count != self._auto_conductance_seen:
+            self._auto_conductance_seen = count
+            current_conductance = self.conductanceList[-1] if count else None
+            
+            # Vérifier si la conductance est descendue sous 1 µS
+            if current_conductance is not None and current_conductance <= 5e-6:
+                self._log.info("Auto: Régénération terminée - Conductance inférieure à 1 µS (%.6f µS)",
+                               current_conductance*1e6)
+                self._finish_auto_regeneration()
+                return
+        
+        # Si le temps maximum de régénération est atteint sans que la conductance ne descende assez
+        if _now() - self._auto_regen_start >= 3*60:
+            self._log.info("Auto: Temps maximum de régénération atteint (3 min) - Arrêt forcé")
+            self._finish_auto_regeneration()
+            return
+        
+        self._start_auto_wait('REGEN_MONITOR', 0)
+    
+    def _finish_auto_regeneration(self):
+        """Termine la régénération du mode automatique"""
+        # Dans tous les cas, remettre Tcons à basse température
+        success = self.set_Tcons(_TCONS_LOW_STR, force=True)
+        if not success:
+            self._log.warning("Auto: Erreur lors de la définition de Tcons à %s°C", TCONS_LOW)
     
     def get_last_timestamps(self):
         """Get the latest timestamps for all data types"""
@@ -1085,35 +1780,36 @@ class MeasurementManager:
             bool: True if regeneration protocol was started, False if already in progress
         """
         if self.regeneration_in_progress:
-            print("Regeneration protocol already in progress")
+            self._log.info("Regeneration protocol already in progress")
             return False
             
         # Verify we have CO2 readings
         if not self.values_co2:
-            print("No CO2 readings available - can't start regeneration protocol")
+            self._log.warning("No CO2 readings available - can't start regeneration protocol")
             return False
         
         # Lire R0 avant de démarrer pour avoir une valeur initiale
         initial_R0 = self.read_R0()
         if initial_R0 is not None:
-            print(f"Starting regeneration protocol - Initial R0: {initial_R0}")
+            self._log.info("Starting regeneration protocol - Initial R0: %s", initial_R0)
             # Actualisation de R0 en l'écrivant dans les paramètres
             self.set_R0(str(initial_R0))
-            print(f"R0 actualisé: {initial_R0}")
+            self._log.info("R0 actualisé: %s", initial_R0)
             
             # Enregistrer le timestamp de l'actualisation de R0
-            current_time = time.time()
-            if self.start_time_co2_temp_humidity is not None:
-                self.regeneration_timestamps['r0_actualized'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+            current_time = _now()
+            self._stamp('r0_actualized', current_time)
             
         # Initialize regeneration state
         self.regeneration_in_progress = True
-        self.regeneration_step = 1  # Checking CO2 stability
+        self.regeneration_step = RegenStep.INIT_STABILITY
         self.co2_stability_start_time = None  # Will be set when first stable reading is found
         self.regeneration_start_time = None
         self.co2_stable_value = None
+        self._reset_co2_hysteresis()
+        self._regen_last_key = None
         
-        print("Regeneration protocol started: checking CO2 stability")
+        self._log.info("Regeneration protocol started: checking CO2 stability")
         return True
         
     def cancel_regeneration_protocol(self):
@@ -1124,32 +1820,34 @@ class MeasurementManager:
             bool: True if regeneration was cancelled, False if not in progress
         """
         if not self.regeneration_in_progress:
-            print("No regeneration protocol in progress to cancel")
+            self._log.info("No regeneration protocol in progress to cancel")
             return False
             
         # Set temperature back to low value - méthode renforcée
-        # 1. Utiliser d'abord la méthode interne set_Tcons
-        result = self.set_Tcons(str(TCONS_LOW))
+        # 1. Utiliser d'abord la méthode interne set_Tcons, avec relecture de la consigne
+        result = self.set_Tcons(_TCONS_LOW_STR, verify=True)
         if result:
-            print(f"Paramètre Tcons remis à {TCONS_LOW}°C après annulation via set_Tcons")
+            self._log.info("Paramètre Tcons remis à %s°C après annulation via set_Tcons", TCONS_LOW)
         else:
-            print(f"Erreur lors de la remise à {TCONS_LOW}°C après annulation via set_Tcons")
-        
-        # 2. Puis essayer d'écrire directement via le périphérique de régénération
-        try:
-            if self.regen and hasattr(self.regen, 'device') and self.regen.device:
-                command_str = f"ea{TCONS_LOW}\n"
-                self.regen.device.write(command_str.encode())
-                print(f"Paramètre Tcons remis à {TCONS_LOW}°C après annulation via commande brute")
-                
-                # Force une mise à jour de la mémoire interne
-                self.last_set_Tcons = float(TCONS_LOW)
-        except Exception as e:
-            print(f"Erreur lors de l'écriture directe pour remettre Tcons à {TCONS_LOW}°C après annulation: {e}")
+            self._log.warning("Erreur lors de la remise à %s°C après annulation via set_Tcons", TCONS_LOW)
+            
+            # 2. Écriture directe via le périphérique de régénération uniquement si
+            # la consigne n'a pas pu être envoyée ou vérifiée ; write_raw prend le
+            # verrou du port pour ne pas s'intercaler dans un autre échange
+            try:
+                if self.regen is not None and self.regen.is_connected() and self.regen.write_raw(_TCONS_LOW_CMD):
+                    self._log.info("Paramètre Tcons remis à %s°C après annulation via commande brute", TCONS_LOW)
+                    
+                    # Force une mise à jour de la mémoire interne
+                    self.last_set_Tcons = float(TCONS_LOW)
+                    self._current_tcons = float(TCONS_LOW)
+            except Exception as e:
+                self._log.warning("Erreur lors de l'écriture directe pour remettre Tcons à %s°C après annulation: %s",
+                                  TCONS_LOW, e)
         
         # Reset regeneration state
         self.regeneration_in_progress = False
-        self.regeneration_step = 0
+        self.regeneration_step = RegenStep.IDLE
         self.co2_stability_start_time = None
         self.regeneration_start_time = None
         self.co2_stable_value = None
@@ -1171,6 +1869,7 @@ class MeasurementManager:
         self.co2_restabilization_reference = None
         self.co2_restabilized = False
         self.tcons_reduced = False
+        self._reset_co2_hysteresis()
         
         # Reset CO2 stability shift variables
         self.co2_stability_shifted = False
@@ -1192,9 +1891,9 @@ class MeasurementManager:
         if self.full_protocol_in_progress:
             self.full_protocol_in_progress = False
             self.full_protocol_step = 0
-            print("Protocole complet également annulé")
+            self._log.info("Protocole complet également annulé")
         
-        print("Regeneration protocol cancelled")
+        self._log.info("Regeneration protocol cancelled")
         return True
         
     def cancel_full_protocol(self):
@@ -1205,52 +1904,56 @@ class MeasurementManager:
             bool: True si l'annulation a réussi, False si aucun protocole n'est en cours
         """
         if not self.full_protocol_in_progress:
-            print("Aucun protocole complet actif à annuler")
+            self._log.info("Aucun protocole complet actif à annuler")
             return False
             
         # Arrêter le protocole
         self.full_protocol_in_progress = False
         self.full_protocol_step = 0
-        print("Protocole complet annulé par l'utilisateur")
+        self._log.info("Protocole complet annulé par l'utilisateur")
         
         # Réinitialiser la température à 0°C par sécurité
-        result = self.set_Tcons(str(TCONS_LOW))
+        result = self.set_Tcons(_TCONS_LOW_STR, force=True)
         if result:
-            print(f"Paramètre Tcons remis à {TCONS_LOW}°C après annulation du protocole complet")
+            self._log.info("Paramètre Tcons remis à %s°C après annulation du protocole complet", TCONS_LOW)
         else:
-            print(f"Erreur lors de la remise à {TCONS_LOW}°C après annulation du protocole complet")
+            self._log.warning("Erreur lors de la remise à %s°C après annulation du protocole complet", TCONS_LOW)
         
         # Mettre à jour la dernière valeur définie pour Tcons
         self.last_set_Tcons = float(TCONS_LOW)
         
         return True
         
-    def check_co2_stability(self):
+    def check_co2_stability(self, current_time=None):
         """
         Check if CO2 readings are stable (±2 ppm for 2 minutes)
         
+        Args:
+            current_time: Temps courant (horloge du gestionnaire) déjà lu par
+                          l'appelant ; lu ici si None
+        
         Returns:
             bool: True if CO2 is stable for the required duration, False otherwise
         """
-        if not self.regeneration_in_progress or self.regeneration_step != 1:
+        if not self.regeneration_in_progress or self.regeneration_step != RegenStep.INIT_STABILITY:
             return False
             
         # Need at least a few readings
         if len(self.values_co2) < 3:
             return False
             
-        current_time = time.time()
-        latest_co2 = self.values_co2[-1]
+        if current_time is None:
+            current_time = _now()
+        latest_co2 = self.latest_co2
         
         # If we don't have a reference stable value yet, use the current value
         if self.co2_stable_value is None:
             self.co2_stable_value = latest_co2
             self.co2_stability_start_time = current_time
-            print(f"Setting initial CO2 reference value: {latest_co2} ppm")
+            self._log.info("Setting initial CO2 reference value: %s ppm", latest_co2)
             
             # Enregistrer le timestamp du début de la vérification de stabilité CO2
-            if self.start_time_co2_temp_humidity is not None:
-                self.regeneration_timestamps['co2_stability_started'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+            self._stamp('co2_stability_started', current_time)
                 
             return False
         
@@ -1260,19 +1963,22 @@ class MeasurementManager:
             if self.co2_stability_start_time is not None:
                 stable_duration = current_time - self.co2_stability_start_time
                 
-                print(f"DEBUG Stabilisation initiale: Écart CO2 = {abs(latest_co2 - self.co2_stable_value):.2f} ppm, Durée stable = {stable_duration:.1f}/{CO2_STABILITY_DURATION} s")
+                # Trace de débogage, formatée uniquement si le niveau DEBUG est actif
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("Stabilisation initiale: Écart CO2 = %.2f ppm, Durée stable = %.1f/%s s",
+                                    abs(latest_co2 - self.co2_stable_value), stable_duration, CO2_STABILITY_DURATION)
                 
                 if stable_duration >= CO2_STABILITY_DURATION:
                     # Avant de confirmer la stabilité, lire R0, l'afficher et l'actualiser
                     R0 = self.read_R0()
                     if R0 is not None:
-                        print(f"CO2 stable - R0 initial: {R0}")
+                        self._log.info("CO2 stable - R0 initial: %s", R0)
                         # Actualisation de R0 en l'écrivant dans les paramètres
                         self.set_R0(str(R0))
-                        print(f"R0 actualisé avant régénération: {R0}")
+                        self._log.info("R0 actualisé avant régénération: %s", R0)
                     
                     # Enregistrer le timestamp de la stabilité CO2 atteinte
-                    self.regeneration_timestamps['co2_stability_achieved'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+                    self._stamp('co2_stability_achieved', current_time)
                     return True
                 else:
                     return False
@@ -1284,71 +1990,91 @@ class MeasurementManager:
             
             # Mettre à jour le marqueur de début de vérification de stabilité CO2
             # UNIQUEMENT pendant la phase 1, avant la mise en chauffage
-            if self.start_time_co2_temp_humidity is not None and self.regeneration_step == 1:
-                self.regeneration_timestamps['co2_stability_started'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
-                print(f"Marqueur de début stabilité CO2 déplacé: {latest_co2} ppm (variation de {variation:.2f} ppm > {CO2_STABILITY_THRESHOLD} ppm)")
+            if self.start_time_co2_temp_humidity is not None and self.regeneration_step == RegenStep.INIT_STABILITY:
+                self._stamp('co2_stability_started', current_time)
+                self._log.info("Marqueur de début stabilité CO2 déplacé: %s ppm (variation de %.2f ppm > %s ppm)",
+                               latest_co2, variation, CO2_STABILITY_THRESHOLD)
             
             return False
             
-    def check_co2_restabilization(self):
+    def check_co2_restabilization(self, current_time=None):
         """
         Check if CO2 readings have restabilized after the peak
         
+        Args:
+            current_time: Temps courant (horloge du gestionnaire) déjà lu par
+                          l'appelant ; lu ici si None
+        
         Returns:
             bool: True if CO2 is stable for the required duration, False otherwise
         """
         if not self.co2_peak_detected or len(self.values_co2) < 3:
             return False
             
-        current_time = time.time()
-        latest_co2 = self.values_co2[-1]
+        if current_time is None:
+            current_time = _now()
+        latest_co2 = self.latest_co2
         
         # If we don't have a reference stabilization value yet, initialize it
         if self.co2_restabilization_reference is None:
             self.co2_restabilization_reference = latest_co2
             self.co2_restabilization_start_time = current_time
-            print(f"Début de la surveillance de restabilisation CO2 à {latest_co2} ppm")
+            self._log.info("Début de la surveillance de restabilisation CO2 à %s ppm", latest_co2)
             return False
         
         # Check if the current value is within the stability threshold
         if abs(latest_co2 - self.co2_restabilization_reference) <= CO2_STABILITY_THRESHOLD:
+            self._co2_restab_off_count = 0
+            
             # Still stable, check if we've been stable long enough
             if self.co2_restabilization_start_time is not None:
                 stable_duration = current_time - self.co2_restabilization_start_time
                 
-                print(f"DEBUG Restabilisation: Écart CO2 = {abs(latest_co2 - self.co2_restabilization_reference):.2f} ppm, Durée stable = {stable_duration:.1f}/{CO2_STABILITY_DURATION} s")
+                # Trace de débogage, formatée uniquement si le niveau DEBUG est actif
+                if self._log.isEnabledFor(logging.DEBUG):
+                    self._log.debug("Restabilisation: Écart CO2 = %.2f ppm, Durée stable = %.1f/%s s",
+                                    abs(latest_co2 - self.co2_restabilization_reference), stable_duration, CO2_STABILITY_DURATION)
                 
                 if stable_duration >= CO2_STABILITY_DURATION:
                     # Stability confirmed
                     self.co2_restabilized = True
                     
                     # Record the timestamp of restabilization
-                    if self.start_time_co2_temp_humidity is not None:
-                        self.regeneration_timestamps['co2_restabilized'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+                    self._stamp('co2_restabilized', current_time)
                     
-                    print(f"CO2 restabilisé à {latest_co2} ppm")
+                    self._log.info("CO2 restabilisé à %s ppm", latest_co2)
                     return True
                 else:
                     # Still waiting for full stability duration
                     return False
         else:
+            # Hors de la bande : la référence n'est réinitialisée qu'après plusieurs
+            # nouveaux points consécutifs hors bande (un point isolé est ignoré)
+            co2_count = len(self.values_co2)
+            if co2_count != self._co2_restab_seen:
+                self._co2_restab_seen = co2_count
+                self._co2_restab_off_count += 1
+            if self._co2_restab_off_count < self._CO2_RESTAB_OFF_SAMPLES:
+                return False
+            
             # Not stable, reset the reference
+            self._co2_restab_off_count = 0
             variation = abs(latest_co2 - self.co2_restabilization_reference)
             self.co2_restabilization_reference = latest_co2
             self.co2_restabilization_start_time = current_time
             
             # Mettre à jour le timestamp de début de recherche de restabilisation
-            if self.start_time_co2_temp_humidity is not None:
-                self.regeneration_timestamps['co2_restabilization_start_time'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+            self._stamp('co2_restabilization_start_time', current_time)
                 
-            print(f"Référence restabilisation réinitialisée: {latest_co2} ppm (variation de {variation:.2f} ppm > {CO2_STABILITY_THRESHOLD} ppm)")
+            self._log.info("Référence restabilisation réinitialisée: %s ppm (variation de %.2f ppm > %s ppm)",
+                           latest_co2, variation, CO2_STABILITY_THRESHOLD)
             return False
             
     def regeneration_complete(self):
         """Complete the regeneration process and reset variables"""
         from core.constants import CELL_VOLUME
         
-        print("Protocole de régénération terminé avec succès")
+        self._log.info("Protocole de régénération terminé avec succès")
         
         # Calculer le delta C et la masse de carbone
         delta_c = 0
@@ -1359,16 +2085,16 @@ class MeasurementManager:
             delta_c = self.co2_restabilization_reference - self.co2_stable_value
             
             # Calculer la masse de carbone en µg: mc = deltaC * volume / 24.5 * 12
-            carbon_mass = delta_c * CELL_VOLUME / 24.5 * 12
+            carbon_mass = delta_c * CELL_VOLUME * CARBON_MASS_FACTOR
             
-            print(f"Delta C: {delta_c:.2f} ppm")
-            print(f"Masse de carbone: {carbon_mass:.2f} µg")
+            self._log.info("Delta C: %.2f ppm", delta_c)
+            self._log.info("Masse de carbone: %.2f µg", carbon_mass)
         
         # Le temps de percolation est simplement le moment où l'augmentation commence
         percolation_time = 0
         if self.increase_time is not None:
             percolation_time = self.increase_time
-            print(f"Temps de percolation: {percolation_time:.1f} s")
+            self._log.info("Temps de percolation: %.1f s", percolation_time)
         
         # Stocker les résultats pour l'affichage
         self.regeneration_results = {
@@ -1380,7 +2106,7 @@ class MeasurementManager:
         
         # Reset regeneration state
         self.regeneration_in_progress = False
-        self.regeneration_step = 0
+        self.regeneration_step = RegenStep.IDLE
         
         # Reset all CO2 detection variables
         self.co2_increase_detected = False
@@ -1392,6 +2118,7 @@ class MeasurementManager:
         self.co2_restabilization_reference = None
         self.co2_restabilization_start_time = None
         self.tcons_reduced = False
+        self._reset_co2_hysteresis()
             
     def start_conductance_regen_protocol(self):
         """
@@ -1404,33 +2131,34 @@ class MeasurementManager:
             bool: True si le protocole a été démarré, False si déjà en cours
         """
         if self.conductance_regen_in_progress:
-            print("Protocole de conductance résistance/température déjà en cours")
+            self._log.info("Protocole de conductance résistance/température déjà en cours")
             return False
         
         # S'assurer que l'appareil de régénération est disponible
-        if self.regen is None or not hasattr(self.regen, 'device') or self.regen.device is None:
-            print("Appareil de régénération non disponible - impossible de démarrer le protocole")
+        if self.regen is None or not self.regen.is_connected():
+            self._log.warning("Appareil de régénération non disponible - impossible de démarrer le protocole")
             return False
         
         # S'assurer que le Keithley est disponible pour mesurer la résistance
-        if self.keithley is None or not hasattr(self.keithley, 'device') or self.keithley.device is None:
-            print("Keithley non disponible - impossible de démarrer le protocole")
+        if getattr(self.keithley, 'device', None) is None:
+            self._log.warning("Keithley non disponible - impossible de démarrer le protocole")
             return False
         
         # Initialiser les variables du protocole
         self.conductance_regen_in_progress = True
-        self.conductance_regen_start_time = time.time()
+        self.conductance_regen_start_time = _now()
         self.conductance_regen_target_reached = False
         self.conductance_regen_stop_time = None
         
         # Démarrer la régénération (température à 700°C)
-        success = self.set_Tcons(str(REGENERATION_TEMP))
+        success = self.set_Tcons(_REGEN_TEMP_STR)
         if not success:
-            print(f"Erreur lors de la définition de Tcons à {REGENERATION_TEMP}°C")
+            self._log.warning("Erreur lors de la définition de Tcons à %s°C", REGENERATION_TEMP)
             self.conductance_regen_in_progress = False
             return False
         
-        print(f"Protocole de conductance résistance/température démarré (chauffage à {REGENERATION_TEMP}°C)")
+        self._log.info("Protocole de conductance résistance/température démarré (chauffage à %s°C)",
+                       REGENERATION_TEMP)
         return True
     
     def cancel_conductance_regen_protocol(self):
@@ -1441,12 +2169,12 @@ class MeasurementManager:
             bool: True si le protocole a été annulé, False sinon
         """
         if not self.conductance_regen_in_progress:
-            print("Aucun protocole de conductance résistance/température en cours")
+            self._log.info("Aucun protocole de conductance résistance/température en cours")
             return False
         
         # Arrêter le chauffage
-        self.set_Tcons(str(TCONS_LOW))
-        print(f"Température remise à {TCONS_LOW}°C")
+        self.set_Tcons(_TCONS_LOW_STR, force=True)
+        self._log.info("Température remise à %s°C", TCONS_LOW)
         
         # Réinitialiser les variables
         self.conductance_regen_in_progress = False
@@ -1454,14 +2182,18 @@ class MeasurementManager:
         self.conductance_regen_target_reached = False
         self.conductance_regen_stop_time = None
         
-        print("Protocole de conductance résistance/température annulé")
+        self._log.info("Protocole de conductance résistance/température annulé")
         return True
     
-    def manage_conductance_regen_protocol(self):
+    def manage_conductance_regen_protocol(self, current_time=None):
         """
         Gère le protocole de conductance avec résistance/température:
         Surveille la résistance et arrête la régénération quand elle dépasse 1 MΩ
         
+        Args:
+            current_time: Temps courant (horloge monotone du gestionnaire) lu une seule
+                          fois par itération par l'appelant ; lu ici si None
+        
         Returns:
             dict: État actuel du protocole
         """
@@ -1471,14 +2203,10 @@ class MeasurementManager:
         self.check_conductance_increase_after_decrease()
         
         if not self.conductance_regen_in_progress:
-            return {
-                'active': False,
-                'step': 0,
-                'message': "Protocole non actif",
-                'progress': 0
-            }
+            return _STATUS_CONDUCTANCE_INACTIVE
         
-        current_time = time.time()
+        if current_time is None:
+            current_time = _now()
         
         # Si la cible est déjà atteinte
         if self.conductance_regen_target_reached:
@@ -1488,28 +2216,30 @@ class MeasurementManager:
             return {
                 'active': True,
                 'step': 2,
-                'message': f"Résistance > 1 MΩ atteinte! (arrêté depuis {elapsed:.1f}s)",
+                'message': _MSG_TARGET_STOPPED_PREFIX + "%.1fs)" % elapsed,
                 'progress': 100
             }
         
         # Vérifier si la résistance a dépassé 1 MΩ
-        if len(self.resistanceList) > 0:
-            current_resistance = self.resistanceList[-1]
+        if self.latest_resistance is not None:
+            current_resistance = self.latest_resistance
+            # Résistance en MΩ, rapportée à la cible (calculée une seule fois)
+            ratio_meg = current_resistance * _INV_OHM_TARGET
             
             # Si résistance > 1 MΩ (1 000 000 Ω)
-            if current_resistance > 1000000:
+            if current_resistance > _OHM_TARGET:
                 # La cible est atteinte, arrêter le chauffage
                 self.conductance_regen_target_reached = True
                 self.conductance_regen_stop_time = current_time
-                self.set_Tcons(str(TCONS_LOW))
+                self.set_Tcons(_TCONS_LOW_STR, force=True)
                 
-                print(f"Résistance cible atteinte: {current_resistance:.0f} Ω > 1 MΩ")
-                print(f"Chauffage arrêté, température réduite à {TCONS_LOW}°C")
+                self._log.info("Résistance cible atteinte: %.0f Ω > 1 MΩ", current_resistance)
+                self._log.info("Chauffage arrêté, température réduite à %s°C", TCONS_LOW)
                 
                 return {
                     'active': True,
                     'step': 2,
-                    'message': f"Résistance > 1 MΩ atteinte! ({current_resistance/1000000:.2f} MΩ)",
+                    'message': f"Résistance > 1 MΩ atteinte! ({ratio_meg:.2f} MΩ)",
                     'progress': 100
                 }
             
@@ -1518,12 +2248,14 @@ class MeasurementManager:
             
             # Estimer la progression (basée sur la résistance)
             # Progression de 0 à 90% basée sur la résistance
-            progress = min(90, (current_resistance / 1000000) * 90)
+            progress = ratio_meg * 90
+            if not progress < 90:
+                progress = 90
             
             return {
                 'active': True,
                 'step': 1,
-                'message': f"Chauffage en cours: {current_resistance/1000:.1f} kΩ (cible: 1000 kΩ)",
+                'message': _MSG_HEATING_PREFIX + "%.1f" % (current_resistance / 1000) + _MSG_HEATING_SUFFIX,
                 'progress': progress
             }
         
@@ -1532,7 +2264,7 @@ class MeasurementManager:
         return {
             'active': True,
             'step': 1,
-            'message': f"Chauffage en cours... ({elapsed:.1f}s)",
+            'message': _MSG_HEATING_WAIT_PREFIX + "%.1fs)" % elapsed,
             'progress': 10  # Valeur de progression arbitraire quand aucune donnée n'est disponible
         }
     
@@ -1553,15 +2285,16 @@ class MeasurementManager:
             bool: True si le protocole a démarré, False si déjà en cours
         """
         if self.full_protocol_in_progress:
-            print("Full protocol already in progress")
+            self._log.info("Full protocol already in progress")
             return False
 
         # Initialize protocol variables
         self.full_protocol_in_progress = True
         self.full_protocol_step = 1
-        self.full_protocol_start_time = time.time()
+        self.full_protocol_start_time = _now()
         self.full_protocol_substep = 0
         self.full_protocol_substep_start_time = None
+        self._full_heating_log_bucket = -1
         
         # Initial values for calculations
         self.full_protocol_co2_initial = None
@@ -1569,14 +2302,18 @@ class MeasurementManager:
 
         # Send retract command but don't wait
         self.retract_close_sensor()
-        print("Full protocol started - Step 1: Retracting sensor")
+        self._log.info("Full protocol started - Step 1: Retracting sensor")
 
         return True
 
-    def manage_full_protocol(self):
+    def manage_full_protocol(self, current_time=None):
         """
         Gère les différentes étapes du protocole complet.
 
+        Args:
+            current_time: Temps courant (horloge monotone du gestionnaire) lu une seule
+                          fois par itération par l'appelant ; lu ici si None
+
         Returns:
             dict: État actuel du protocole complet
                 'active': bool - True si le protocole est en cours
@@ -1586,535 +2323,724 @@ class MeasurementManager:
                 'protocol_type': str - Toujours "full" pour identifier ce protocole
         """
         if not self.full_protocol_in_progress:
+            return _STATUS_FULL_INACTIVE
+
+        if current_time is None:
+            current_time = _now()
+        
+        try:
+            handler = self._full_step_handlers.get(self.full_protocol_step)
+            status = handler(current_time) if handler is not None else None
+            if status is not None:
+                return status
+            
+            # Retourner le statut actuel
+            current_progress = min(99, _FULL_PROGRESS_PER_STEP * (self.full_protocol_step - 1))
+            return {
+                'active': True,
+                'step': self.full_protocol_step,
+                'message': f"Étape {self.full_protocol_step} en cours...",
+                'progress': current_progress,
+                'protocol_type': 'full'
+            }
+            
+        except Exception as e:
+            self._log.exception("Erreur dans manage_full_protocol")
+            self.full_protocol_in_progress = False
             return {
                 'active': False,
                 'step': 0,
-                'message': "Protocole complet non actif",
+                'message': f"Erreur: {str(e)}",
                 'progress': 0,
                 'protocol_type': 'full'
             }
-
-        current_time = time.time()
-        total_steps = 6  # Nombre total d'étapes
-        progress_per_step = 100 / total_steps
+    
+    def _full_step1(self, current_time):
+        """
+        Étape 1 du protocole complet : attente de la rétraction du vérin
         
-        try:
-            # Étape 1: Rétraction du vérin
-            if self.full_protocol_step == 1:
-                if current_time - self.full_protocol_start_time > VALVE_DELAY:
-                    self.full_protocol_step = 2
-                    self.full_protocol_substep = 0
-                    self.full_protocol_substep_start_time = current_time
-                    print("Passage à l'étape 2: Vérification CO2")
-                
-                return {
-                    'active': True,
-                    'step': 1,
-                    'message': "Vérin rétracté...",
-                    'progress': progress_per_step * 1,
-                    'protocol_type': 'full'
-                }
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole
+        """
+        if current_time - self.full_protocol_start_time > VALVE_DELAY:
+            self.full_protocol_step = 2
+            self.full_protocol_substep = 0
+            self.full_protocol_substep_start_time = current_time
+            self._log.info("Passage à l'étape 2: Vérification CO2")
+        
+        return {
+            'active': True,
+            'step': 1,
+            'message': "Vérin rétracté...",
+            'progress': _FULL_PROGRESS_PER_STEP * 1,
+            'protocol_type': 'full'
+        }
+    
+    def _full_step2(self, current_time):
+        """
+        Étape 2 du protocole complet : vérification de la stabilité du CO2 (3 minutes max)
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole, ou None pour l'état générique de l'étape
+        """
+        # Étape 2: Vérifier la stabilité du CO2
+        if self.full_protocol_substep == 0:
+            # Initialisation de la vérification
+            self.co2_stable_value = self.latest_co2
+            self.co2_stability_start_time = current_time
+            self.full_protocol_substep = 1
+            self._log.info("Démarrage de la vérification de stabilité CO2 - Valeur de référence: %s", self.co2_stable_value)
+            
+            # Enregistrer le timestamp du début de la vérification
+            self._stamp('co2_stability_started', current_time)
+        
+        elif self.full_protocol_substep == 1:
+            # Vérification en cours
+            if len(self.values_co2) > 0:
+                latest_co2 = self.latest_co2
+                self._log.debug("Vérification CO2: valeur courante = %s ppm, référence = %s ppm",
+                                latest_co2, self.co2_stable_value)
+                
+                # Si nous avons une valeur de référence, vérifier la stabilité
+                if self.co2_stable_value is not None:
+                    if abs(latest_co2 - self.co2_stable_value) <= CO2_STABILITY_THRESHOLD:
+                        # Toujours stable, vérifier la durée
+                        elapsed = current_time - self.co2_stability_start_time
+                        stability_progress = min(100, elapsed * _STABILITY_PERCENT_RATE)
+                        
+                        self._log.debug("CO2 stable depuis %.1fs (seuil: %ss)", elapsed, CO2_STABILITY_DURATION)
+                        
+                        if elapsed >= CO2_STABILITY_DURATION:
+                            # CO2 stabilisé, passer à l'étape suivante
+                            self.full_protocol_step = 3
+                            self.full_protocol_substep = 0  # Réinitialiser la sous-étape pour l'étape 3
+                            self.full_protocol_co2_initial = latest_co2  # Mémoriser la valeur CO2 initiale
+                            self._log.info("CO2 stable à %s ppm, passage à l'étape 3", latest_co2)
 
-            # Étape 2: Vérification CO2
-            elif self.full_protocol_step == 2:
-                # Étape 2: Vérifier la stabilité du CO2
-                if self.full_protocol_substep == 0:
-                    # Initialisation de la vérification
-                    self.co2_stable_value = self.values_co2[-1] if len(self.values_co2) > 0 else None
-                    self.co2_stability_start_time = current_time
-                    self.full_protocol_substep = 1
-                    print(f"Démarrage de la vérification de stabilité CO2 - Valeur de référence: {self.co2_stable_value}")
-                    
-                    # Enregistrer le timestamp du début de la vérification
-                    if self.start_time_co2_temp_humidity is not None:
-                        self.regeneration_timestamps['co2_stability_started'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
-                
-                elif self.full_protocol_substep == 1:
-                    # Vérification en cours
-                    if len(self.values_co2) > 0:
-                        latest_co2 = self.values_co2[-1]
-                        print(f"Vérification CO2: valeur courante = {latest_co2} ppm, référence = {self.co2_stable_value} ppm")
-                        
-                        # Si nous avons une valeur de référence, vérifier la stabilité
-                        if self.co2_stable_value is not None:
-                            if abs(latest_co2 - self.co2_stable_value) <= CO2_STABILITY_THRESHOLD:
-                                # Toujours stable, vérifier la durée
-                                elapsed = current_time - self.co2_stability_start_time
-                                stability_progress = min(100, (elapsed / CO2_STABILITY_DURATION) * 100)
-                                
-                                print(f"CO2 stable depuis {elapsed:.1f}s (seuil: {CO2_STABILITY_DURATION}s)")
-                                
-                                if elapsed >= CO2_STABILITY_DURATION:
-                                    # CO2 stabilisé, passer à l'étape suivante
-                                    self.full_protocol_step = 3
-                                    self.full_protocol_substep = 0  # Réinitialiser la sous-étape pour l'étape 3
-                                    self.full_protocol_co2_initial = latest_co2  # Mémoriser la valeur CO2 initiale
-                                    print(f"CO2 stable à {latest_co2} ppm, passage à l'étape 3")
+                            # Lire et actualiser R0 avant de passer à l'étape de chauffage
+                            R0 = self.read_R0()
+                            if R0 is not None:
+                                self.set_R0(str(R0))
+                                self._log.info("R0 actualisé avant régénération: %s", R0)
 
-                                    # Lire et actualiser R0 avant de passer à l'étape de chauffage
-                                    R0 = self.read_R0()
-                                    if R0 is not None:
-                                        self.set_R0(str(R0))
-                                        print(f"R0 actualisé avant régénération: {R0}")
+                                # Enregistrer le timestamp pour R0 actualisé
+                                self._stamp('r0_actualized', current_time)
 
-                                        # Enregistrer le timestamp pour R0 actualisé
-                                        if self.start_time_co2_temp_humidity is not None:
-                                            self.regeneration_timestamps['r0_actualized'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+                                # Enregistrer le timestamp pour CO2 stabilisé
+                                self._stamp('co2_stability_achieved', current_time)
 
-                                        # Enregistrer le timestamp pour CO2 stabilisé
-                                        if self.start_time_co2_temp_humidity is not None:
-                                            self.regeneration_timestamps['co2_stability_achieved'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
-
-                                        # Enregistrer le timestamp pour la première stabilité
-                                        if self.start_time_conductance is not None:
-                                            self.first_stability_time = current_time - self.start_time_conductance - self.elapsed_time_conductance
-                                            print(f"Première stabilité atteinte à {self.first_stability_time:.1f}s")
-                                
-                                return {
-                                    'active': True,
-                                    'step': 2,
-                                    'message': f"Vérification stabilité CO2 ({stability_progress:.0f}%)",
-                                    'progress': progress_per_step + (stability_progress / 100) * progress_per_step,
-                                    'protocol_type': 'full'
-                                }
-                            else:
-                                # CO2 a changé, réinitialiser la référence
-                                variation = abs(latest_co2 - self.co2_stable_value)
-                                self.co2_stable_value = latest_co2
-                                self.co2_stability_start_time = current_time
-                                print(f"CO2 instable, nouvelle référence: {latest_co2} ppm (variation de {variation:.2f} ppm)")
-                                
-                                # Mettre à jour le timestamp pour la stabilité CO2
-                                if self.start_time_co2_temp_humidity is not None:
-                                    self.regeneration_timestamps['co2_stability_started'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
-                        else:
-                            # Pas de valeur de référence, l'initialiser
-                            self.co2_stable_value = latest_co2
-                            self.co2_stability_start_time = current_time
-                            print(f"Initialisation valeur de référence CO2: {latest_co2} ppm")
-                    
-                    # Vérifier si le temps d'attente est trop long (3 minutes max)
-                    timeout_progress = min(100, ((current_time - self.full_protocol_substep_start_time) / (3*60)) * 100)
-                    if current_time - self.full_protocol_substep_start_time > 3*60:
-                        print("Délai d'attente pour stabilité CO2 dépassé, passage à l'étape suivante")
-                        self.full_protocol_step = 3
-                        self.full_protocol_substep = 0  # Réinitialiser la sous-étape pour l'étape 3
+                                # Enregistrer le timestamp pour la première stabilité
+                                if self.start_time_conductance is not None:
+                                    self.first_stability_time = current_time - self.start_time_conductance - self.elapsed_time_conductance
+                                    self._log.info("Première stabilité atteinte à %.1fs", self.first_stability_time)
                         
-                        # Mémoriser la dernière valeur CO2 comme référence
-                        if len(self.values_co2) > 0:
-                            self.full_protocol_co2_initial = self.values_co2[-1]
-                    
-                    return {
-                        'active': True,
-                        'step': 2,
-                        'message': f"Vérification stabilité CO2... (timeout: {timeout_progress:.0f}%)",
-                        'progress': progress_per_step + (timeout_progress / 100) * progress_per_step,
-                        'protocol_type': 'full'
-                    }
-            
-            elif self.full_protocol_step == 3:
-                # Étape 3: Augmenter Tcons à haute température (REGENERATION_TEMP = 700°C)
-                if self.full_protocol_substep == 0:
-                    # Démarrer le chauffage
-                    print(f"Démarrage de l'étape 3: Chauffage à {REGENERATION_TEMP}°C")
-                    success = self.set_Tcons(str(REGENERATION_TEMP))
-                    if success:
-                        print(f"Chauffage démarré à {REGENERATION_TEMP}°C")
-                        self.full_protocol_substep = 1
-                        self.full_protocol_substep_start_time = current_time
+                        return {
+                            'active': True,
+                            'step': 2,
+                            'message': f"Vérification stabilité CO2 ({stability_progress:.0f}%)",
+                            'progress': _FULL_PROGRESS_PER_STEP + (stability_progress / 100) * _FULL_PROGRESS_PER_STEP,
+                            'protocol_type': 'full'
+                        }
                     else:
-                        print(f"Erreur lors du démarrage du chauffage à {REGENERATION_TEMP}°C")
-                        # Réessayer encore une fois
-                        print("Nouvelle tentative de mise à température...")
-                        success = self.set_Tcons(str(REGENERATION_TEMP))
-                        if success:
-                            print("Seconde tentative réussie")
-                            self.full_protocol_substep = 1
-                            self.full_protocol_substep_start_time = current_time
-                        else:
-                            print("Échec de la seconde tentative, annulation du protocole")
-                            # Annuler le protocole en cas d'erreur
-                            self.full_protocol_in_progress = False
-                            return {
-                                'active': False,
-                                'step': 0,
-                                'message': "Erreur lors du démarrage du chauffage",
-                                'progress': 0,
-                                'protocol_type': 'full'
-                            }
+                        # CO2 a changé, réinitialiser la référence
+                        variation = abs(latest_co2 - self.co2_stable_value)
+                        self.co2_stable_value = latest_co2
+                        self.co2_stability_start_time = current_time
+                        self._log.info("CO2 instable, nouvelle référence: %s ppm (variation de %.2f ppm)", latest_co2, variation)
+                        
+                        # Mettre à jour le timestamp pour la stabilité CO2
+                        self._stamp('co2_stability_started', current_time)
+                else:
+                    # Pas de valeur de référence, l'initialiser
+                    self.co2_stable_value = latest_co2
+                    self.co2_stability_start_time = current_time
+                    self._log.info("Initialisation valeur de référence CO2: %s ppm", latest_co2)
+            
+            # Vérifier si le temps d'attente est trop long (3 minutes max)
+            timeout_progress = min(100, ((current_time - self.full_protocol_substep_start_time) / (3*60)) * 100)
+            if current_time - self.full_protocol_substep_start_time > 3*60:
+                self._log.info("Délai d'attente pour stabilité CO2 dépassé, passage à l'étape suivante")
+                self.full_protocol_step = 3
+                self.full_protocol_substep = 0  # Réinitialiser la sous-étape pour l'étape 3
                 
-                elif self.full_protocol_substep == 1:
-                    # Chauffage en cours, attendre que la conductance descende sous 5µS
-                    if len(self.conductanceList) > 0:
-                        current_conductance = self.conductanceList[-1]
-
-                        # Afficher la conductance actuelle périodiquement
-                        # Éviter de saturer la console avec trop de messages, uniquement afficher toutes les quelques secondes
-                        elapsed = current_time - self.full_protocol_substep_start_time
-                        if int(elapsed) % 5 == 0:  # Afficher tous les 5 secondes
-                            print(f"Étape 3 - Conductance actuelle: {current_conductance:.2f} µS")
-
-                        # Vérifier si on est descendu sous le seuil de conductance
-                        if current_conductance <= 5:  # Seuil en µS
-                            print(f"Conductance descendue sous 5 µS ({current_conductance:.6f} µS), passage à l'étape 4")
-                            self.full_protocol_step = 4
-                            self.full_protocol_substep = 0
-                            self.full_protocol_substep_start_time = current_time
-                        elif current_time - self.full_protocol_substep_start_time > 3*60:
-                            # Sécurité: après 3 minutes, passer à l'étape suivante même si la conductance n'est pas assez basse
-                            print(f"Délai de 3 minutes écoulé, sécurité activée - passage à l'étape 4 (conductance: {current_conductance:.2f} µS)")
-                            self.full_protocol_step = 4
-                            self.full_protocol_substep = 0
-                            self.full_protocol_substep_start_time = current_time
-                            print(f"Sécurité : mise de Tcons à {TCONS_LOW}°C car conductance > 5 µS après 3 minutes")
-                    
-                    # Calculer la progression basée sur le temps écoulé (max 3 minutes)
-                    elapsed = current_time - self.full_protocol_substep_start_time
-                    heat_progress = min(100, (elapsed / (3*60)) * 100)
-                    
+                # Mémoriser la dernière valeur CO2 comme référence
+                if len(self.values_co2) > 0:
+                    self.full_protocol_co2_initial = self.latest_co2
+            
+            return {
+                'active': True,
+                'step': 2,
+                'message': f"Vérification stabilité CO2... (timeout: {timeout_progress:.0f}%)",
+                'progress': _FULL_PROGRESS_PER_STEP + (timeout_progress / 100) * _FULL_PROGRESS_PER_STEP,
+                'protocol_type': 'full'
+            }
+    
+    def _full_step3(self, current_time):
+        """
+        Étape 3 du protocole complet : chauffage jusqu'à ce que la conductance descende sous 5 µS
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole, ou None pour l'état générique de l'étape
+        """
+        # Étape 3: Augmenter Tcons à haute température (REGENERATION_TEMP = 700°C)
+        if self.full_protocol_substep == 0:
+            # Démarrer le chauffage
+            self._log.info("Démarrage de l'étape 3: Chauffage à %s°C", REGENERATION_TEMP)
+            success = self.set_Tcons(_REGEN_TEMP_STR)
+            if success:
+                self._log.info("Chauffage démarré à %s°C", REGENERATION_TEMP)
+                self.full_protocol_substep = 1
+                self.full_protocol_substep_start_time = current_time
+            else:
+                self._log.warning("Erreur lors du démarrage du chauffage à %s°C", REGENERATION_TEMP)
+                # Réessayer encore une fois
+                self._log.info("Nouvelle tentative de mise à température...")
+                success = self.set_Tcons(_REGEN_TEMP_STR)
+                if success:
+                    self._log.info("Seconde tentative réussie")
+                    self.full_protocol_substep = 1
+                    self.full_protocol_substep_start_time = current_time
+                else:
+                    self._log.warning("Échec de la seconde tentative, annulation du protocole")
+                    # Annuler le protocole en cas d'erreur
+                    self.full_protocol_in_progress = False
                     return {
-                        'active': True,
-                        'step': 3,
-                        'message': f"Chauffage en cours ({heat_progress:.0f}%)",
-                        'progress': progress_per_step * 3 + (heat_progress / 100) * progress_per_step,
+                        'active': False,
+                        'step': 0,
+                        'message': "Erreur lors du démarrage du chauffage",
+                        'progress': 0,
                         'protocol_type': 'full'
                     }
+        
+        elif self.full_protocol_substep == 1:
+            # Chauffage en cours, attendre que la conductance descende sous 5µS
+            if len(self.conductanceList) > 0:
+                current_conductance = self.conductanceList[-1]
+
+                # Afficher la conductance actuelle une fois par tranche de 5 secondes
+                # (niveau DEBUG, formatée uniquement si ce niveau est actif)
+                bucket = int(current_time - self.full_protocol_substep_start_time) // 5
+                if bucket != self._full_heating_log_bucket:
+                    self._full_heating_log_bucket = bucket
+                    if self._log.isEnabledFor(logging.DEBUG):
+                        self._log.debug("Étape 3 - Conductance actuelle: %.2f µS", current_conductance)
+
+                # Vérifier si on est descendu sous le seuil de conductance
+                if current_conductance <= 5:  # Seuil en µS
+                    self._log.info("Conductance descendue sous 5 µS (%.6f µS), passage à l'étape 4", current_conductance)
+                    self.full_protocol_step = 4
+                    self.full_protocol_substep = 0
+                    self.full_protocol_substep_start_time = current_time
+                elif current_time - self.full_protocol_substep_start_time > 3*60:
+                    # Sécurité: après 3 minutes, passer à l'étape suivante même si la conductance n'est pas assez basse
+                    self._log.info("Délai de 3 minutes écoulé, sécurité activée - passage à l'étape 4 (conductance: %.2f µS)", current_conductance)
+                    self.full_protocol_step = 4
+                    self.full_protocol_substep = 0
+                    self.full_protocol_substep_start_time = current_time
+                    self._log.info("Sécurité : mise de Tcons à %s°C car conductance > 5 µS après 3 minutes", TCONS_LOW)
             
-            elif self.full_protocol_step == 4:
-                # Étape 4: Mettre Tcons à basse température (TCONS_LOW = 0°C)
-                if self.full_protocol_substep == 0:
-                    # Abaisser la température
-                    print(f"Démarrage de l'étape 4: Abaissement de la température à {TCONS_LOW}°C")
-                    success = self.set_Tcons(str(TCONS_LOW))
-                    if success:
-                        print(f"Température abaissée à {TCONS_LOW}°C")
-                        self.full_protocol_substep = 1
-                        self.full_protocol_substep_start_time = current_time
-                    else:
-                        print(f"Erreur lors de l'abaissement de la température à {TCONS_LOW}°C")
-                        # Réessayer encore une fois
-                        print("Nouvelle tentative d'abaissement de température...")
-                        success = self.set_Tcons(str(TCONS_LOW))
-                        if success:
-                            print("Seconde tentative réussie")
-                        else:
-                            print("Échec de la seconde tentative, mais continuation du protocole")
-                        
-                        # Continuer malgré l'erreur
-                        self.full_protocol_substep = 1
-                        self.full_protocol_substep_start_time = current_time
+            # Calculer la progression basée sur le temps écoulé (max 3 minutes)
+            elapsed = current_time - self.full_protocol_substep_start_time
+            heat_progress = min(100, (elapsed / (3*60)) * 100)
+            
+            return {
+                'active': True,
+                'step': 3,
+                'message': f"Chauffage en cours ({heat_progress:.0f}%)",
+                'progress': _FULL_PROGRESS_PER_STEP * 3 + (heat_progress / 100) * _FULL_PROGRESS_PER_STEP,
+                'protocol_type': 'full'
+            }
+    
+    def _full_step4(self, current_time):
+        """
+        Étape 4 du protocole complet : retour à la consigne basse puis courte attente
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole, ou None pour l'état générique de l'étape
+        """
+        # Étape 4: Mettre Tcons à basse température (TCONS_LOW = 0°C)
+        if self.full_protocol_substep == 0:
+            # Abaisser la température
+            self._log.info("Démarrage de l'étape 4: Abaissement de la température à %s°C", TCONS_LOW)
+            success = self.set_Tcons(_TCONS_LOW_STR, force=True)
+            if success:
+                self._log.info("Température abaissée à %s°C", TCONS_LOW)
+                self.full_protocol_substep = 1
+                self.full_protocol_substep_start_time = current_time
+            else:
+                self._log.warning("Erreur lors de l'abaissement de la température à %s°C", TCONS_LOW)
+                # Réessayer encore une fois
+                self._log.info("Nouvelle tentative d'abaissement de température...")
+                success = self.set_Tcons(_TCONS_LOW_STR, force=True)
+                if success:
+                    self._log.info("Seconde tentative réussie")
+                else:
+                    self._log.warning("Échec de la seconde tentative, mais continuation du protocole")
                 
-                elif self.full_protocol_substep == 1:
-                    # Attendre un court délai puis passer à l'étape suivante
-                    elapsed = current_time - self.full_protocol_substep_start_time
-                    if elapsed >= 5:  # 5 secondes
-                        print(f"Délai d'attente de 5 secondes écoulé après l'abaissement de température ({elapsed:.1f}s)")
-                        self.full_protocol_step = 5
-                        self.full_protocol_substep = 0
-                        self.full_protocol_substep_start_time = current_time
-                        print("Passage à l'étape 5: Surveillance de restabilisation du CO2")
-                    
-                    # Calculer progression (5 secondes max)
-                    progress_in_substep = min(100, (elapsed / 5) * 100)
-                    
-                    return {
-                        'active': True,
-                        'step': 4,
-                        'message': f"Température abaissée, attente ({progress_in_substep:.0f}%)",
-                        'progress': progress_per_step * 4 + (progress_in_substep / 100) * progress_per_step,
-                        'protocol_type': 'full'
-                    }
+                # Continuer malgré l'erreur
+                self.full_protocol_substep = 1
+                self.full_protocol_substep_start_time = current_time
+        
+        elif self.full_protocol_substep == 1:
+            # Attendre un court délai puis passer à l'étape suivante
+            elapsed = current_time - self.full_protocol_substep_start_time
+            if elapsed >= 5:  # 5 secondes
+                self._log.info("Délai d'attente de 5 secondes écoulé après l'abaissement de température (%.1fs)", elapsed)
+                self.full_protocol_step = 5
+                self.full_protocol_substep = 0
+                self.full_protocol_substep_start_time = current_time
+                self._log.info("Passage à l'étape 5: Surveillance de restabilisation du CO2")
             
-            elif self.full_protocol_step == 5:
-                # Étape 5: Attendre la restabilisation du CO2
-                if self.full_protocol_substep == 0:
-                    # Initialisation de la surveillance de restabilisation
-                    if len(self.values_co2) > 0:
-                        self.co2_restabilization_reference = self.values_co2[-1]
-                        self.co2_restabilization_start_time = current_time
-                        self.full_protocol_substep = 1
-                        print(f"Début de la surveillance de restabilisation du CO2 à {self.co2_restabilization_reference} ppm")
-                        
-                        # Enregistrer le timestamp pour le début de la surveillance
-                        if self.start_time_co2_temp_humidity is not None:
-                            self.regeneration_timestamps['co2_restabilization_start_time'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
-                    else:
-                        return {
-                            'active': True,
-                            'step': 5,
-                            'message': "En attente de données CO2 pour la restabilisation",
-                            'progress': progress_per_step * 5,
-                            'protocol_type': 'full'
-                        }
+            # Calculer progression (5 secondes max)
+            progress_in_substep = min(100, (elapsed / 5) * 100)
+            
+            return {
+                'active': True,
+                'step': 4,
+                'message': f"Température abaissée, attente ({progress_in_substep:.0f}%)",
+                'progress': _FULL_PROGRESS_PER_STEP * 4 + (progress_in_substep / 100) * _FULL_PROGRESS_PER_STEP,
+                'protocol_type': 'full'
+            }
+    
+    def _full_step5(self, current_time):
+        """
+        Étape 5 du protocole complet : surveillance de la restabilisation du CO2 (5 minutes max)
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole, ou None pour l'état générique de l'étape
+        """
+        # Étape 5: Attendre la restabilisation du CO2
+        if self.full_protocol_substep == 0:
+            # Initialisation de la surveillance de restabilisation
+            if len(self.values_co2) > 0:
+                self.co2_restabilization_reference = self.latest_co2
+                self.co2_restabilization_start_time = current_time
+                self.full_protocol_substep = 1
+                self._log.info("Début de la surveillance de restabilisation du CO2 à %s ppm", self.co2_restabilization_reference)
+                
+                # Enregistrer le timestamp pour le début de la surveillance
+                self._stamp('co2_restabilization_start_time', current_time)
+            else:
+                return {
+                    'active': True,
+                    'step': 5,
+                    'message': "En attente de données CO2 pour la restabilisation",
+                    'progress': _FULL_PROGRESS_PER_STEP * 5,
+                    'protocol_type': 'full'
+                }
+        
+        elif self.full_protocol_substep == 1:
+            # Vérification de la restabilisation
+            if len(self.values_co2) > 0:
+                latest_co2 = self.latest_co2
                 
-                elif self.full_protocol_substep == 1:
-                    # Vérification de la restabilisation
-                    if len(self.values_co2) > 0:
-                        latest_co2 = self.values_co2[-1]
-                        
-                        if abs(latest_co2 - self.co2_restabilization_reference) <= CO2_STABILITY_THRESHOLD:
-                            # CO2 stable, vérifier la durée
-                            elapsed = current_time - self.co2_restabilization_start_time
-                            stability_progress = min(100, (elapsed / CO2_STABILITY_DURATION) * 100)
-                            
-                            if elapsed >= CO2_STABILITY_DURATION:
-                                # CO2 restabilisé, passer à l'étape suivante
-                                self.full_protocol_step = 6
-                                self.full_protocol_co2_final = latest_co2  # Mémoriser la valeur CO2 finale
-                                self.co2_restabilized = True
-                                print(f"CO2 restabilisé à {latest_co2} ppm, passage à l'étape finale")
-                                
-                                # Enregistrer le timestamp pour CO2 restabilisé
-                                if self.start_time_co2_temp_humidity is not None:
-                                    self.regeneration_timestamps['co2_restabilized'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
-                            
-                            return {
-                                'active': True,
-                                'step': 5,
-                                'message': f"Surveillance restabilisation CO2 ({stability_progress:.0f}%)",
-                                'progress': progress_per_step * 5 + (stability_progress / 100) * progress_per_step,
-                                'protocol_type': 'full'
-                            }
-                        else:
-                            # CO2 a changé, réinitialiser la référence
-                            variation = abs(latest_co2 - self.co2_restabilization_reference)
-                            self.co2_restabilization_reference = latest_co2
-                            self.co2_restabilization_start_time = current_time
-                            print(f"CO2 instable, nouvelle référence: {latest_co2} ppm (variation de {variation:.2f} ppm)")
-                            
-                            # Mettre à jour le timestamp pour le début de la recherche de restabilisation
-                            if self.start_time_co2_temp_humidity is not None:
-                                self.regeneration_timestamps['co2_restabilization_start_time'] = current_time - self.start_time_co2_temp_humidity - self.elapsed_time_co2_temp_humidity
+                if abs(latest_co2 - self.co2_restabilization_reference) <= CO2_STABILITY_THRESHOLD:
+                    # CO2 stable, vérifier la durée
+                    elapsed = current_time - self.co2_restabilization_start_time
+                    stability_progress = min(100, elapsed * _STABILITY_PERCENT_RATE)
                     
-                    # Vérifier si le temps d'attente est trop long (5 minutes max)
-                    timeout_progress = min(100, ((current_time - self.full_protocol_substep_start_time) / (5*60)) * 100)
-                    if current_time - self.full_protocol_substep_start_time > 5*60:
-                        print("Délai d'attente pour restabilisation CO2 dépassé, passage à l'étape finale")
+                    if elapsed >= CO2_STABILITY_DURATION:
+                        # CO2 restabilisé, passer à l'étape suivante
                         self.full_protocol_step = 6
+                        self.full_protocol_co2_final = latest_co2  # Mémoriser la valeur CO2 finale
+                        self.co2_restabilized = True
+                        self._log.info("CO2 restabilisé à %s ppm, passage à l'étape finale", latest_co2)
                         
-                        # Mémoriser la dernière valeur CO2 comme valeur finale
-                        if len(self.values_co2) > 0:
-                            self.full_protocol_co2_final = self.values_co2[-1]
-                            
-                            # Forcer l'état restabilisé pour le calcul des résultats
-                            self.co2_restabilized = True
+                        # Enregistrer le timestamp pour CO2 restabilisé
+                        self._stamp('co2_restabilized', current_time)
                     
                     return {
                         'active': True,
                         'step': 5,
-                        'message': f"Surveillance restabilisation CO2... (timeout: {timeout_progress:.0f}%)",
-                        'progress': progress_per_step * 5 + (timeout_progress / 100) * progress_per_step,
+                        'message': f"Surveillance restabilisation CO2 ({stability_progress:.0f}%)",
+                        'progress': _FULL_PROGRESS_PER_STEP * 5 + (stability_progress / 100) * _FULL_PROGRESS_PER_STEP,
                         'protocol_type': 'full'
                     }
-            
-            elif self.full_protocol_step == 6:
-                # Étape 6: Calcul des résultats et fin du protocole
-                from core.constants import CELL_VOLUME
-                
-                # Calcul du delta C et de la masse de carbone
-                delta_c = 0
-                carbon_mass = 0
-                
-                if self.full_protocol_co2_initial is not None and self.full_protocol_co2_final is not None:
-                    # Calculer la différence entre la valeur stable initiale et la valeur finale
-                    delta_c = self.full_protocol_co2_final - self.full_protocol_co2_initial
+                else:
+                    # CO2 a changé, réinitialiser la référence
+                    variation = abs(latest_co2 - self.co2_restabilization_reference)
+                    self.co2_restabilization_reference = latest_co2
+                    self.co2_restabilization_start_time = current_time
+                    self._log.info("CO2 instable, nouvelle référence: %s ppm (variation de %.2f ppm)", latest_co2, variation)
                     
-                    # Calculer la masse de carbone en µg: mc = deltaC * volume / 24.5 * 12
-                    carbon_mass = delta_c * CELL_VOLUME / 24.5 * 12
+                    # Mettre à jour le timestamp pour le début de la recherche de restabilisation
+                    self._stamp('co2_restabilization_start_time', current_time)
+            
+            # Vérifier si le temps d'attente est trop long (5 minutes max)
+            timeout_progress = min(100, ((current_time - self.full_protocol_substep_start_time) / (5*60)) * 100)
+            if current_time - self.full_protocol_substep_start_time > 5*60:
+                self._log.info("Délai d'attente pour restabilisation CO2 dépassé, passage à l'étape finale")
+                self.full_protocol_step = 6
+                
+                # Mémoriser la dernière valeur CO2 comme valeur finale
+                if len(self.values_co2) > 0:
+                    self.full_protocol_co2_final = self.latest_co2
                     
-                    print(f"Delta C: {delta_c:.2f} ppm")
-                    print(f"Masse de carbone: {carbon_mass:.2f} µg")
-                
-                # Le temps de percolation est simplement le moment où l'augmentation commence
-                percolation_time = 0
-                if self.increase_time is not None:
-                    percolation_time = self.increase_time
-                    print(f"Temps de percolation: {percolation_time:.1f} s")
-                
-                # Stocker les résultats pour l'affichage
-                self.regeneration_results = {
-                    'delta_c': delta_c,
-                    'carbon_mass': carbon_mass,
-                    'percolation_time': percolation_time
-                }
-                
-                # Fin du protocole
-                self.full_protocol_in_progress = False
-                self.full_protocol_step = 0
-                print("Protocole complet terminé avec succès")
-                
-                return {
-                    'active': False,
-                    'step': 0,
-                    'message': "Protocole complet terminé",
-                    'progress': 100,
-                    'results': self.regeneration_results,
-                    'protocol_type': 'full'
-                }
+                    # Forcer l'état restabilisé pour le calcul des résultats
+                    self.co2_restabilized = True
             
-            # Retourner le statut actuel
-            current_progress = min(99, progress_per_step * (self.full_protocol_step - 1))
             return {
                 'active': True,
-                'step': self.full_protocol_step,
-                'message': f"Étape {self.full_protocol_step} en cours...",
-                'progress': current_progress,
+                'step': 5,
+                'message': f"Surveillance restabilisation CO2... (timeout: {timeout_progress:.0f}%)",
+                'progress': _FULL_PROGRESS_PER_STEP * 5 + (timeout_progress / 100) * _FULL_PROGRESS_PER_STEP,
                 'protocol_type': 'full'
             }
+    
+    def _full_step6(self, current_time):
+        """
+        Étape 6 du protocole complet : calcul des résultats et fin du protocole
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole
+        """
+        # Étape 6: Calcul des résultats et fin du protocole
+        from core.constants import CELL_VOLUME
+        
+        # Calcul du delta C et de la masse de carbone
+        delta_c = 0
+        carbon_mass = 0
+        
+        if self.full_protocol_co2_initial is not None and self.full_protocol_co2_final is not None:
+            # Calculer la différence entre la valeur stable initiale et la valeur finale
+            delta_c = self.full_protocol_co2_final - self.full_protocol_co2_initial
             
-        except Exception as e:
-            print(f"Erreur dans manage_full_protocol: {e}")
-            self.full_protocol_in_progress = False
-            return {
-                'active': False,
-                'step': 0,
-                'message': f"Erreur: {str(e)}",
-                'progress': 0,
-                'protocol_type': 'full'
-            }
+            # Calculer la masse de carbone en µg: mc = deltaC * volume / 24.5 * 12
+            carbon_mass = delta_c * CELL_VOLUME * CARBON_MASS_FACTOR
+            
+            self._log.info("Delta C: %.2f ppm", delta_c)
+            self._log.info("Masse de carbone: %.2f µg", carbon_mass)
+        
+        # Le temps de percolation est simplement le moment où l'augmentation commence
+        percolation_time = 0
+        if self.increase_time is not None:
+            percolation_time = self.increase_time
+            self._log.info("Temps de percolation: %.1f s", percolation_time)
+        
+        # Stocker les résultats pour l'affichage
+        self.regeneration_results = {
+            'delta_c': delta_c,
+            'carbon_mass': carbon_mass,
+            'percolation_time': percolation_time
+        }
+        
+        # Fin du protocole
+        self.full_protocol_in_progress = False
+        self.full_protocol_step = 0
+        self._log.info("Protocole complet terminé avec succès")
+        
+        return {
+            'active': False,
+            'step': 0,
+            'message': "Protocole complet terminé",
+            'progress': 100,
+            'results': self.regeneration_results,
+            'protocol_type': 'full'
+        }
+    
+    def _reset_co2_hysteresis(self):
+        """Remet à zéro les compteurs d'hystérésis CO2 du protocole de régénération"""
+        self._co2_increase_on_count = 0
+        self._co2_restab_off_count = 0
+        self._co2_regen_seen = 0
+        self._co2_restab_seen = 0
+        self._co2_restab_checked = 0
+        self._co2_stability_checked = 0
+    
+    def _regen_stability_detected(self, current_time):
+        """
+        Vérifie la stabilité initiale du CO2 pour le protocole, sans appel inutile
+        
+        Même principe que _regen_restabilization_detected : sans nouveau point CO2
+        et tant que la durée de stabilité ne peut pas être atteinte, le résultat de
+        check_co2_stability est nécessairement False.
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            bool: True si le CO2 est stable depuis CO2_STABILITY_DURATION
+        """
+        co2_count = len(self.values_co2)
+        start = self.co2_stability_start_time
+        if (co2_count == self._co2_stability_checked and self.co2_stable_value is not None
+                and start is not None and current_time - start < CO2_STABILITY_DURATION):
+            return False
+        self._co2_stability_checked = co2_count
+        return self.check_co2_stability(current_time)
+    
+    def _regen_restabilization_detected(self, current_time):
+        """
+        Vérifie la restabilisation du CO2 pour le protocole, sans appel inutile
+        
+        Sans nouveau point CO2, l'écart à la référence est inchangé : tant que la durée
+        de stabilité ne peut pas encore être atteinte, le résultat est nécessairement False.
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            bool: True si le CO2 est restabilisé
+        """
+        co2_count = len(self.values_co2)
+        start = self.co2_restabilization_start_time
+        if (co2_count == self._co2_restab_checked and start is not None
+                and current_time - start < CO2_STABILITY_DURATION):
+            return False
+        self._co2_restab_checked = co2_count
+        return self.check_co2_restabilization(current_time)
     
-    def manage_regeneration_protocol(self):
+    def manage_regeneration_protocol(self, current_time=None):
         """
         Gère le protocole de régénération avec les nouvelles règles :
         1. La détection de restabilisation peut commencer dès le pic détecté
         2. La température reste à 700°C jusqu'à la fin de REGENERATION_DURATION
         3. La restabilisation peut se terminer avant ou après le retour à 0°C
+        
+        Args:
+            current_time: Temps courant (horloge monotone du gestionnaire) lu une seule
+                          fois par itération par l'appelant ; lu ici si None
+        
+        Returns:
+            dict: État actuel du protocole
         """
         if not self.regeneration_in_progress:
-            return {
-                'active': False,
-                'step': 0,
-                'message': "Regeneration not active",
-                'progress': 0
+            return _STATUS_REGEN_INACTIVE
+        
+        if current_time is None:
+            current_time = _now()
+        
+        # Sans nouveau point CO2 ni changement d'étape, l'état n'évolue qu'avec le temps :
+        # le résultat précédent est réutilisé tant que l'on reste dans la même seconde
+        key = (self.regeneration_step, len(self.values_co2), int(current_time))
+        if key == self._regen_last_key:
+            return dict(self._regen_last_result)
+        
+        handler = self._regen_step_handlers.get(self.regeneration_step)
+        if handler is not None:
+            result = handler(current_time)
+        else:
+            result = {
+                'active': True,
+                'step': self.regeneration_step,
+                'message': "État inconnu",
+                'progress': 75.0
             }
         
-        current_time = time.time()
+        # La clé est prise avant l'appel : une transition d'étape invalide le cache
+        self._regen_last_key = key
+        self._regen_last_result = result
+        return dict(result)
+    
+    def _regen_dispatch(self, event, current_time):
+        """
+        Applique la transition associée à un événement pour l'étape courante
         
-        # Étape 1: Vérification stabilité CO2 initiale
-        if self.regeneration_step == 1:
-            if self.check_co2_stability():
-                # Stabilité atteinte, passer à l'étape 2
-                self.regeneration_step = 2
-                self.regeneration_start_time = current_time
-                self.co2_base_value = self.values_co2[-1]
-                
-                # Démarrage de la régénération (température à 700°C)
-                self.set_Tcons(str(REGENERATION_TEMP))
-                
-                return {
-                    'active': True,
-                    'step': 2,
-                    'message': f"Régénération à {REGENERATION_TEMP}°C démarrée",
-                    'progress': 33.3
-                }
-            else:
-                return {
-                    'active': True,
-                    'step': 1,
-                    'message': "Recherche stabilité CO2 initiale...",
-                    'progress': (min(current_time - self.co2_stability_start_time, CO2_STABILITY_DURATION) 
-                                / CO2_STABILITY_DURATION) * 33.3
-                }
+        Args:
+            event: Événement RegenEvent survenu
+            current_time: Temps courant (horloge du gestionnaire)
+        """
+        action = self._regen_transitions.get((self.regeneration_step, event))
+        if action is not None:
+            action(current_time)
+    
+    def _on_regen_co2_stable(self, current_time):
+        """Stabilité initiale atteinte : démarrage du chauffage (étape HEATING)"""
+        self.regeneration_step = RegenStep.HEATING
+        self.regeneration_start_time = current_time
+        self.co2_base_value = self.latest_co2
+        
+        # Démarrage de la régénération (température à 700°C)
+        self.set_Tcons(_REGEN_TEMP_STR)
+    
+    def _on_regen_co2_increase(self, current_time):
+        """Augmentation du CO2 confirmée pendant le chauffage"""
+        self.co2_increase_detected = True
+        self._stamp('co2_increase_detected', current_time)
+        self._log.info("Augmentation CO2 détectée: %.1f ppm", self.latest_co2 - self.co2_base_value)
+    
+    def _on_regen_co2_peak(self, current_time):
+        """Pic de CO2 détecté : la surveillance de restabilisation démarre immédiatement"""
+        self.co2_restabilization_reference = self.latest_co2
+        self.co2_restabilization_start_time = current_time
+        self._stamp('co2_restabilization_start_time', current_time)
+        self._log.info("Pic CO2 détecté, début surveillance restabilisation à %s ppm", self.co2_restabilization_reference)
+        
+        # Chauffage déjà terminé : il ne reste qu'à attendre la restabilisation
+        if self.tcons_reduced:
+            self.regeneration_step = RegenStep.AWAIT_RESTAB
+    
+    def _on_regen_heating_elapsed(self, current_time):
+        """Durée de régénération écoulée : retour à la consigne basse"""
+        self.set_Tcons(_TCONS_LOW_STR, force=True)
+        self.tcons_reduced = True
+        self._log.info("Durée de régénération écoulée - température réduite à 0°C")
+        
+        # Sans pic détecté, l'étape HEATING continue de le chercher
+        if self.co2_peak_detected:
+            self.regeneration_step = RegenStep.AWAIT_RESTAB
+    
+    def _on_regen_co2_restabilized(self, current_time):
+        """CO2 restabilisé après la fin du chauffage : fin du protocole"""
+        self.regeneration_complete()
+    
+    def _regen_restab_status(self, current_time):
+        """
+        État du protocole pendant l'attente de la restabilisation (chauffage terminé)
         
-        # Étape 2: Régénération à haute température (durée fixe)
-        elif self.regeneration_step == 2:
-            elapsed = current_time - self.regeneration_start_time
-            regeneration_completed = elapsed >= REGENERATION_DURATION
-            
-            # Détection de l'augmentation CO2 (peut se faire à tout moment)
-            if not self.co2_increase_detected and self.co2_base_value is not None:
-                current_co2 = self.values_co2[-1]
-                if current_co2 - self.co2_base_value >= CO2_INCREASE_THRESHOLD:  # Seuil d'augmentation
-                    self.co2_increase_detected = True
-                    self.regeneration_timestamps['co2_increase_detected'] = current_time - self.start_time_co2_temp_humidity
-                    print(f"Augmentation CO2 détectée: {current_co2 - self.co2_base_value:.1f} ppm")
-            
-            # Détection du pic CO2 (peut se faire à tout moment)
-            if self.co2_increase_detected and not self.co2_peak_detected:
-                self.detect_co2_peak()
-                
-                # Si pic détecté, lancer la surveillance de restabilisation IMMÉDIATEMENT
-                if self.co2_peak_detected:
-                    self.co2_restabilization_reference = self.values_co2[-1]
-                    self.co2_restabilization_start_time = current_time
-                    self.regeneration_timestamps['co2_restabilization_start_time'] = current_time - self.start_time_co2_temp_humidity
-                    print(f"Pic CO2 détecté, début surveillance restabilisation à {self.co2_restabilization_reference} ppm")
-            
-            # Vérifier la restabilisation si le pic a été détecté
-            restabilization_detected = False
-            if self.co2_peak_detected:
-                restabilization_detected = self.check_co2_restabilization()
-            
-            # Gestion de la température
-            if not regeneration_completed:
-                # Maintenir à 700°C jusqu'à la fin de la durée, même si restabilisation détectée
-                if not self.tcons_reduced:
-                    self.set_Tcons(str(REGENERATION_TEMP))
-                
-                progress = 33.3 + (elapsed / REGENERATION_DURATION) * 66.7 * 0.5  # Progress jusqu'à 66.6%
-                
-                return {
-                    'active': True,
-                    'step': 2,
-                    'message': f"Régénération en cours ({elapsed:.1f}/{REGENERATION_DURATION}s)" + 
-                            (" (restabilisation en cours)" if self.co2_peak_detected else ""),
-                    'progress': min(66.6, progress)
-                }
-            else:
-                # Durée de régénération écoulée
-                if not self.tcons_reduced:
-                    self.set_Tcons(str(TCONS_LOW))
-                    self.tcons_reduced = True
-                    print("Durée de régénération écoulée - température réduite à 0°C")
-                
-                if restabilization_detected:
-                    # Restabilisation terminée - fin du protocole
-                    self.regeneration_complete()
-                    return {
-                        'active': False,
-                        'step': 4,
-                        'message': "Régénération terminée avec succès",
-                        'progress': 100
-                    }
-                else:
-                    # Attendre la restabilisation après la fin du chauffage
-                    restab_time = current_time - self.co2_restabilization_start_time if self.co2_restabilization_start_time else 0
-                    progress = 75.0 + min(25.0, (restab_time / CO2_STABILITY_DURATION) * 25.0)
-                    
-                    return {
-                        'active': True,
-                        'step': 3,
-                        'message': f"Attente restabilisation CO2 ({restab_time:.1f}/{CO2_STABILITY_DURATION}s)",
-                        'progress': progress
-                    }
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
         
-        # Étape 3: Attente restabilisation après fin de régénération (si pas encore détectée)
-        elif self.regeneration_step == 3:
-            if self.check_co2_restabilization():
-                self.regeneration_complete()
-                return {
-                    'active': False,
-                    'step': 4,
-                    'message': "Régénération terminée avec succès",
-                    'progress': 100
-                }
-            else:
-                restab_time = current_time - self.co2_restabilization_start_time if self.co2_restabilization_start_time else 0
-                progress = 75.0 + min(25.0, (restab_time / CO2_STABILITY_DURATION) * 25.0)
-                
-                return {
-                    'active': True,
-                    'step': 3,
-                    'message': f"Surveillance restabilisation CO2 ({restab_time:.1f}/{CO2_STABILITY_DURATION}s)",
-                    'progress': progress
-                }
+        Returns:
+            dict: État du protocole
+        """
+        if not self.regeneration_in_progress:
+            # Restabilisation terminée - fin du protocole (copié par manage_regeneration_protocol)
+            return _STATUS_REGEN_DONE
+        
+        restab_time = current_time - self.co2_restabilization_start_time if self.co2_restabilization_start_time else 0
+        restab_progress = restab_time * _RESTAB_PROGRESS_RATE
+        progress = 75.0 + (restab_progress if restab_progress < 25.0 else 25.0)
         
         return {
             'active': True,
-            'step': self.regeneration_step,
-            'message': "État inconnu",
-            'progress': 75.0
+            'step': RegenStep.AWAIT_RESTAB,
+            'message': _MSG_RESTAB_WAIT_PREFIX + "%.1f" % restab_time + _MSG_RESTAB_SUFFIX,
+            'progress': progress
         }
+    
+    def _regen_step1(self, current_time):
+        """
+        Étape INIT_STABILITY du protocole : vérification de la stabilité CO2 initiale
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole
+        """
+        if self._regen_stability_detected(current_time):
+            self._regen_dispatch(RegenEvent.CO2_STABLE, current_time)
+            return {
+                'active': True,
+                'step': RegenStep.HEATING,
+                'message': _MSG_REGEN_STARTED,
+                'progress': 33.3
+            }
+        
+        stable_time = current_time - self.co2_stability_start_time
+        return {
+            'active': True,
+            'step': RegenStep.INIT_STABILITY,
+            'message': "Recherche stabilité CO2 initiale...",
+            'progress': (CO2_STABILITY_DURATION if stable_time > CO2_STABILITY_DURATION else stable_time)
+                        * _CO2_STABILITY_PROGRESS_RATE
+        }
+    
+    def _regen_step2(self, current_time):
+        """
+        Étape HEATING du protocole : régénération à haute température (durée fixe)
+        
+        L'augmentation et le pic de CO2 peuvent survenir à tout moment ; une fois la
+        durée écoulée, l'étape se poursuit (consigne basse) jusqu'à la détection du pic.
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole
+        """
+        elapsed = current_time - self.regeneration_start_time
+        
+        # Les détections d'augmentation et de pic ne sont évaluées qu'à l'arrivée
+        # d'un nouveau point CO2 (les appels intermédiaires n'ont rien à examiner)
+        co2_count = len(self.values_co2)
+        new_co2_sample = co2_count != self._co2_regen_seen
+        self._co2_regen_seen = co2_count
+        
+        # Indicateurs lus une seule fois ; seules les transitions (et detect_co2_peak)
+        # les modifient, ils sont relus uniquement après celles-ci
+        increase_detected = self.co2_increase_detected
+        peak_detected = self.co2_peak_detected
+        
+        if new_co2_sample and not increase_detected:
+            # Détection de l'augmentation CO2
+            base_value = self.co2_base_value
+            if base_value is not None:
+                if self.latest_co2 - base_value >= CO2_INCREASE_THRESHOLD:  # Seuil d'augmentation
+                    on_count = self._co2_increase_on_count + 1
+                else:
+                    on_count = 0
+                self._co2_increase_on_count = on_count
+                
+                # Augmentation validée après plusieurs points consécutifs au-dessus du seuil
+                if on_count >= self._CO2_INCREASE_ON_SAMPLES:
+                    self._regen_dispatch(RegenEvent.CO2_INCREASE, current_time)
+                    increase_detected = self.co2_increase_detected
+        
+        if new_co2_sample and increase_detected and not peak_detected:
+            # Détection du pic CO2
+            self.detect_co2_peak()
+            peak_detected = self.co2_peak_detected
+            if peak_detected:
+                self._regen_dispatch(RegenEvent.CO2_PEAK, current_time)
+        
+        # Vérifier la restabilisation si le pic a été détecté
+        restabilization_detected = peak_detected and self._regen_restabilization_detected(current_time)
+        
+        if elapsed < REGENERATION_DURATION:
+            # La consigne de 700°C, envoyée à l'entrée dans l'étape, est maintenue jusqu'à
+            # la fin de la durée, même si la restabilisation est détectée
+            progress = 33.3 + elapsed * _REGEN_PROGRESS_RATE  # Progress jusqu'à 66.6%
+            
+            return {
+                'active': True,
+                'step': RegenStep.HEATING,
+                'message': _MSG_REGEN_PREFIX + "%.1f" % elapsed +
+                        (_MSG_REGEN_RESTAB_SUFFIX if peak_detected else _MSG_REGEN_SUFFIX),
+                'progress': progress if progress < 66.6 else 66.6
+            }
+        
+        # Durée de régénération écoulée
+        if not self.tcons_reduced:
+            self._regen_dispatch(RegenEvent.HEATING_ELAPSED, current_time)
+        if restabilization_detected:
+            self._regen_dispatch(RegenEvent.CO2_RESTABILIZED, current_time)
+        
+        return self._regen_restab_status(current_time)
+    
+    def _regen_step3(self, current_time):
+        """
+        Étape AWAIT_RESTAB du protocole : attente de la restabilisation après la fin du chauffage
+        
+        Args:
+            current_time: Temps courant (horloge du gestionnaire)
+        
+        Returns:
+            dict: État du protocole
+        """
+        if self._regen_restabilization_detected(current_time):
+            self._regen_dispatch(RegenEvent.CO2_RESTABILIZED, current_time)
+        
+        return self._regen_restab_status(current_time)
 
     def get_events_dictionary(self):
         """
@@ -2132,18 +3058,18 @@ class MeasurementManager:
         if self.stabilization_time is not None:
             events['stabilization_time'] = self.stabilization_time
 
-        if hasattr(self, 'max_slope_time') and self.max_slope_time:
+        if self.max_slope_time:
             events['max_slope_time'] = self.max_slope_time
 
         # Ajouter les événements post-régénération
-        if hasattr(self, 'conductance_decrease_time') and self.conductance_decrease_time is not None:
+        if self.conductance_decrease_time is not None:
             events['conductance_decrease_time'] = self.conductance_decrease_time
 
-        if hasattr(self, 'post_regen_stability_time') and self.post_regen_stability_time is not None:
+        if self.post_regen_stability_time is not None:
             events['post_regen_stability_time'] = self.post_regen_stability_time
 
         # Ajouter l'événement de première stabilité du protocole complet
-        if hasattr(self, 'first_stability_time') and self.first_stability_time is not None:
+        if self.first_stability_time is not None:
             events['first_stability_time'] = self.first_stability_time
 
         return events
\ No newline at end of file
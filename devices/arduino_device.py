@@ -4,9 +4,16 @@ Gère la communication avec l'Arduino qui mesure le CO2, la température et l'hu
 Auteur: Guillaume Pailloux
 """
 
+import collections
+import logging
 import serial
 import time
 from core.constants import ARDUINO_DEFAULT_BAUD_RATE, ARDUINO_DEFAULT_TIMEOUT
+from utils.logging_utils import RateLimitFilter
+
+# Rafales de messages identiques écartées : voir utils.logging_utils.RateLimitFilter
+logger = logging.getLogger(__name__)
+logger.addFilter(RateLimitFilter(interval=1.0))
 
 class ArduinoDevice:
     """Interface pour l'appareil Arduino qui mesure le CO2, la température et l'humidité"""
@@ -24,6 +31,10 @@ class ArduinoDevice:
         self.baud_rate = baud_rate
         self.timeout = timeout
         self.device = None
+        # Octets reçus après la dernière fin de ligne (ligne incomplète)
+        self._rx_buf = bytearray()
+        # Lignes complètes déjà lues mais pas encore rendues par read_line
+        self._pending_lines = collections.deque()
     
     def connect(self):
         """
@@ -37,39 +48,69 @@ class ArduinoDevice:
                 raise ValueError("Port série non spécifié")
             
             self.device = serial.Serial(self.port, self.baud_rate, timeout=self.timeout)
+            self._rx_buf.clear()
+            self._pending_lines.clear()
             return True
         except Exception as e:
             print(f"Erreur de connexion à l'Arduino: {e}")
             return False
     
+    def read_lines(self):
+        """
+        Lire en une fois toutes les lignes complètes disponibles
+        
+        Les octets en attente sont lus en un seul appel et ajoutés au tampon de
+        réception ; la dernière ligne, si elle est incomplète, y reste jusqu'au
+        prochain appel. Les erreurs du port série sont propagées à l'appelant.
+        
+        Returns:
+            list: Lignes décodées et nettoyées, vide si aucune ligne complète n'est disponible
+        """
+        if not self.device:
+            return []
+        
+        waiting = self.device.in_waiting
+        if waiting <= 0:
+            return []
+        
+        buf = self._rx_buf
+        buf += self.device.read(waiting)
+        end = buf.rfind(b'\n')
+        if end < 0:
+            return []
+        
+        complete = bytes(buf[:end])
+        del buf[:end + 1]
+        
+        lines = []
+        for raw in complete.split(b'\n'):
+            try:
+                line = raw.decode('utf-8').strip()
+            except UnicodeDecodeError:
+                # Encodage Latin-1 comme solution de repli
+                line = raw.decode('latin-1').strip()
+            if line:
+                lines.append(line)
+        return lines
+    
     def read_line(self):
         """
         Lire une ligne depuis l'Arduino
         
+        Les lignes sont rendues une par une à partir des lectures groupées de read_lines.
+        
         Returns:
-            str: La ligne lue, ou None en cas d'erreur
+            str: La ligne lue, ou None si aucune ligne n'est disponible ou en cas d'erreur
         """
         
         try:
-            if not self.device:
-                return None
-                
-            # Vérifie s'il y a des données disponibles dans le buffer
-            if self.device.in_waiting > 0:
-                line = self.device.readline().decode('utf-8').strip()
-                return line
+            pending = self._pending_lines
+            if not pending:
+                pending.extend(self.read_lines())
             # Si aucune donnée n'est disponible, retourne None immédiatement sans bloquer
-            return None
-        except UnicodeDecodeError:
-            # En cas d'erreur de décodage UTF-8, essaie avec l'encodage Latin-1 comme solution de repli
-            try:
-                line = self.device.readline().decode('latin-1').strip()
-                return line
-            except Exception:
-                print("Erreur de décodage des données Arduino")
-                return None
+            return pending.popleft() if pending else None
         except Exception as e:
-            print(f"Erreur lors de la lecture depuis Arduino: {e}")
+            logger.warning("Erreur lors de la lecture depuis Arduino: %s", e)
             return None
     
     def send_command(self, command):
@@ -89,7 +130,7 @@ class ArduinoDevice:
             self.device.write(command.encode('utf-8'))
             return True
         except Exception as e:
-            print(f"Erreur lors de l'envoi de commande à l'Arduino: {e}")
+            logger.warning("Erreur lors de l'envoi de commande à l'Arduino: %s", e)
             return False
     
     def close(self):
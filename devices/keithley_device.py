@@ -3,6 +3,7 @@ Interface pour l'appareil Keithley 6517.
 Gère la communication, la configuration et les mesures de résistance via l'instrument GPIB.
 """
 
+import logging
 import pyvisa
 import sys
 from core.constants import (
@@ -13,6 +14,11 @@ from core.constants import (
     KEITHLEY_VISA_ERROR_CLOSING_FAILED,
     KEITHLEY_POLARIZATION_VOLTAGE
 )
+from utils.logging_utils import RateLimitFilter
+
+# Rafales de messages identiques écartées : voir utils.logging_utils.RateLimitFilter
+logger = logging.getLogger(__name__)
+logger.addFilter(RateLimitFilter(interval=1.0))
 
 class KeithleyDevice:
     """Interface pour l'électromètre Keithley 6517 permettant la mesure précise de résistance électrique"""
@@ -129,20 +135,20 @@ class KeithleyDevice:
             return resistance
         except pyvisa.errors.VisaIOError as e:
             # Erreur spécifique de communication VISA (timeout, etc.)
-            print(f"Error reading resistance: {e}")
+            logger.warning("Error reading resistance: %s", e)
             
             # Marquer l'appareil comme non disponible pour éviter d'autres erreurs
             # et déclencher la pause des mesures dans l'interface
             self.device = None
             
             # Signal à l'interface que l'appareil s'est déconnecté
-            print("Keithley déconnecté - marquer comme indisponible")
+            logger.warning("Keithley déconnecté - marquer comme indisponible")
             
             # Retourner None pour indiquer une déconnexion
             return None
         except (ValueError, IndexError) as e:
             # Erreur de format ou de parsing
-            print(f"Error parsing resistance data: {e}")
+            logger.warning("Error parsing resistance data: %s", e)
             return None
     
     async def _async_delay(self, seconds):
@@ -3,7 +3,10 @@ Interface pour l'appareil de régénération.
 Gère la communication série avec l'appareil qui contrôle la température de la résistance.
 """
 
+import logging
+import queue
 import serial
+import threading
 import time
 from serial.serialutil import SerialException
 from core.constants import (
@@ -12,8 +15,14 @@ from core.constants import (
     REGEN_COMMAND_DELAY,
     REGEN_DATA_CHECK_INTERVAL,
     REGEN_MAX_DATA_CHECK_ATTEMPTS,
-    REGEN_WRITE_DELAY
+    REGEN_WRITE_DELAY,
+    REGEN_WRITE_TIMEOUT
 )
+from utils.logging_utils import RateLimitFilter
+
+# Rafales de messages identiques écartées : voir utils.logging_utils.RateLimitFilter
+logger = logging.getLogger(__name__)
+logger.addFilter(RateLimitFilter(interval=1.0))
 
 class RegenDevice:
     """Interface pour l'appareil de régénération de résistance, permettant de contrôler et lire la température"""
@@ -31,6 +40,11 @@ class RegenDevice:
         self.baud_rate = baud_rate
         self.timeout = timeout
         self.device = None
+        # Verrou sérialisant les échanges sur le port (thread principal et thread d'écriture)
+        self._lock = threading.RLock()
+        # File des écritures et thread d'écriture (démarré à la première écriture)
+        self._tx_queue = queue.SimpleQueue()
+        self._tx_thread = None
     
     def connect(self):
         """
@@ -49,6 +63,15 @@ class RegenDevice:
             print(f"Erreur de connexion à l'appareil de régénération: {e}")
             return False
     
+    def is_connected(self):
+        """
+        Indique si une connexion série est établie avec l'appareil
+        
+        Returns:
+            bool: True si le port série est attribué, False sinon
+        """
+        return self.device is not None
+    
     def read_variable(self, command, address):
         """
         Lire une variable depuis l'appareil de régénération
@@ -60,13 +83,18 @@ class RegenDevice:
         Returns:
             str: La valeur lue, ou "0.0" en cas d'erreur (jamais None)
         """
+        with self._lock:
+            return self._read_variable(command, address)
+    
+    def _read_variable(self, command, address):
+        """Échange de lecture d'une variable, à appeler avec le verrou du port"""
         try:
             if not self.device:
                 return "0.0"  # Retourne une chaîne par défaut au lieu de None
             
             # Vérifier si le port est encore ouvert
             if not self.device.is_open:
-                print("Port série fermé détecté lors de la lecture")
+                logger.warning("Port série fermé détecté lors de la lecture")
                 self.device = None
                 return "0.0"
                 
@@ -79,7 +107,7 @@ class RegenDevice:
 
             # Vérifier encore une fois si le port est ouvert avant la lecture
             if not self.device.is_open:
-                print("Port série fermé détecté après écriture")
+                logger.warning("Port série fermé détecté après écriture")
                 self.device = None
                 return "0.0"
 
@@ -90,7 +118,7 @@ class RegenDevice:
                 attempts += 1
                 
             if self.device.in_waiting == 0:
-                print(f"Aucune donnée reçue après {attempts} tentatives")
+                logger.warning("Aucune donnée reçue après %d tentatives", attempts)
                 
             response = self.device.read(self.device.in_waiting).decode().strip()
             
@@ -104,33 +132,203 @@ class RegenDevice:
             return "0.0"
         except (OSError, IOError, serial.SerialException, PermissionError) as e:
             # Erreurs de communication série - probablement déconnecté
-            print(f"Error reading variable from regeneration device: {e}")
+            logger.warning("Error reading variable from regeneration device: %s", e)
             # Marquer l'appareil comme non disponible
             self.device = None
             return "0.0"
         except Exception as e:
-            print(f"Unexpected error reading from regeneration device: {e}")
+            logger.warning("Unexpected error reading from regeneration device: %s", e)
             return "0.0"  # Retourne une chaîne par défaut au lieu de None
     
-    def write_parameter(self, command, address, value):
+    def read_variables(self, command, addresses):
+        """
+        Lire plusieurs variables en un seul échange avec l'appareil de régénération
+        
+        Les requêtes sont envoyées à la suite en une seule écriture puis toutes les
+        réponses sont lues ensemble : un seul délai de réponse au lieu d'un par variable.
+        
+        Args:
+            command: Caractère de commande (par exemple, 'L')
+            addresses: Caractères d'adresse, dans l'ordre souhaité (par exemple, ['a', 'd'])
+            
+        Returns:
+            list: Les valeurs lues dans l'ordre des adresses ; chaque réponse est
+                  rattachée à l'adresse qu'elle rappelle (ou à sa position si aucune
+                  réponse ne rappelle d'adresse), et une adresse restée sans
+                  réponse (ou toutes en cas d'erreur) vaut None
+        """
+        with self._lock:
+            return self._read_variables(command, addresses)
+    
+    def _read_variables(self, command, addresses):
+        """Échange de lecture groupée, à appeler avec le verrou du port"""
+        count = len(addresses)
+        values = [None] * count
+        try:
+            if not self.device:
+                return values
+            
+            # Vérifier si le port est encore ouvert
+            if not self.device.is_open:
+                logger.warning("Port série fermé détecté lors de la lecture")
+                self.device = None
+                return values
+                
+            # Vider le tampon d'entrée avant d'envoyer les commandes
+            self.device.reset_input_buffer()
+            
+            # Envoyer toutes les commandes en une seule écriture
+            self.device.write("".join(f"{command}{address}" for address in addresses).encode())
+            time.sleep(REGEN_COMMAND_DELAY)  # Délai pour donner le temps au périphérique de répondre
+
+            # Vérifier encore une fois si le port est ouvert avant la lecture
+            if not self.device.is_open:
+                logger.warning("Port série fermé détecté après écriture")
+                self.device = None
+                return values
+
+            # Lire jusqu'à recevoir une réponse par adresse, avec plusieurs tentatives
+            response = ""
+            attempts = 0
+            while True:
+                waiting = self.device.in_waiting
+                if waiting:
+                    response += self.device.read(waiting).decode()
+                if response.count(command) >= count or attempts >= REGEN_MAX_DATA_CHECK_ATTEMPTS:
+                    break
+                time.sleep(REGEN_DATA_CHECK_INTERVAL)
+                attempts += 1
+                
+            if not response:
+                logger.warning("Aucune donnée reçue après %d tentatives", attempts)
+            
+            # Chaque réponse commence par le caractère de commande, suivi de l'adresse
+            # rappelée si l'appareil la renvoie : la valeur est alors rangée selon
+            # cette adresse et non selon sa position, pour qu'une réponse manquante
+            # ne décale pas les suivantes
+            chunks = [chunk.strip() for chunk in response.split(command)[1:]]
+            answers = {}
+            if len(chunks) == count and not any(chunk[:1] in addresses for chunk in chunks):
+                # Aucune adresse rappelée (comme accepté par read_variable) et une
+                # réponse par adresse : rattachement selon la position
+                pairs = zip(addresses, chunks)
+            else:
+                pairs = ((chunk[:1], chunk[1:]) for chunk in chunks)
+            for address, cleaned_response in pairs:
+                if address not in addresses or address in answers:
+                    continue
+                cleaned_response = cleaned_response.strip()
+                if cleaned_response:
+                    if '.' not in cleaned_response:
+                        cleaned_response += '.0'
+                    answers[address] = cleaned_response
+            
+            values = [answers.get(address) for address in addresses]
+            if len(answers) < count:
+                logger.warning("Pas de réponse pour l'adresse %s (réponse: %r)",
+                               ", ".join(a for a, v in zip(addresses, values) if v is None), response)
+            return values
+        except (OSError, IOError, serial.SerialException, PermissionError) as e:
+            # Erreurs de communication série - probablement déconnecté
+            logger.warning("Error reading variables from regeneration device: %s", e)
+            # Marquer l'appareil comme non disponible
+            self.device = None
+            return values
+        except Exception as e:
+            logger.warning("Unexpected error reading from regeneration device: %s", e)
+            return values
+    
+    def write_parameter(self, command, address, value, timeout=REGEN_WRITE_TIMEOUT):
         """
         Écrire un paramètre dans l'appareil de régénération
         
+        L'écriture est exécutée par le thread d'écriture de l'appareil ; l'appelant
+        attend sa confirmation au plus `timeout` secondes, pour qu'un port série
+        bloqué ne fige pas la boucle de mesure. Une écriture encore en file à
+        l'expiration du délai est annulée : elle n'est jamais envoyée plus tard.
+        
         Args:
             command: Caractère de commande (par exemple, 'e')
             address: Caractère d'adresse (par exemple, 'a', 'b')
             value: Valeur à écrire
+            timeout: Durée maximale d'attente de la confirmation en secondes
             
         Returns:
-            bool: True si le paramètre a été écrit avec succès, False sinon
+            bool: True si le thread d'écriture a confirmé l'écriture, False en cas
+                  d'échec ou si l'écriture a été annulée avant son envoi ;
+                  None si l'envoi était en cours à l'expiration du délai
+                  (issue inconnue, l'écriture ne doit pas être répétée)
+        """
+        if not self.device:
+            return False
+        
+        if self._tx_thread is None:
+            self._tx_thread = threading.Thread(target=self._tx_loop, name="regen-tx", daemon=True)
+            self._tx_thread.start()
+        
+        done = threading.Event()
+        outcome = []
+        # Pris par le thread d'écriture au début de l'envoi, ou par l'appelant pour l'annuler
+        claim = threading.Lock()
+        self._tx_queue.put((command, address, value, done, outcome, claim))
+        if not done.wait(timeout):
+            if claim.acquire(blocking=False):
+                logger.warning("Écriture de %s%s%s annulée : non envoyée après %.1f s",
+                               command, address, value, timeout)
+                return False
+            logger.warning("Écriture de %s%s%s en cours, non confirmée après %.1f s",
+                           command, address, value, timeout)
+            return None
+        return outcome[0]
+    
+    def write_raw(self, data, timeout=REGEN_WRITE_TIMEOUT):
         """
+        Envoyer des octets bruts sur le port, sous le verrou du port
+        
+        Args:
+            data: Octets à écrire
+            timeout: Durée maximale d'attente du verrou en secondes
+            
+        Returns:
+            bool: True si les octets ont été écrits, False sinon
+        """
+        if not self._lock.acquire(timeout=timeout):
+            logger.warning("Port de régénération occupé, écriture brute abandonnée")
+            return False
+        try:
+            if not self.device or not self.device.is_open:
+                return False
+            self.device.write(data)
+            return True
+        except (OSError, IOError, serial.SerialException, PermissionError) as e:
+            # Erreurs de communication série - probablement déconnecté
+            logger.warning("Error writing to regeneration device: %s", e)
+            self.device = None
+            return False
+        finally:
+            self._lock.release()
+    
+    def _tx_loop(self):
+        """Boucle du thread d'écriture : exécute les écritures mises en file, dans l'ordre"""
+        while True:
+            command, address, value, done, outcome, claim = self._tx_queue.get()
+            # Écriture annulée par l'appelant (délai d'attente expiré) : ne pas l'envoyer
+            if not claim.acquire(blocking=False):
+                continue
+            with self._lock:
+                result = self._write_parameter(command, address, value)
+            outcome.append(result)
+            done.set()
+    
+    def _write_parameter(self, command, address, value):
+        """Écriture d'un paramètre, à appeler avec le verrou du port"""
         try:
             if not self.device:
                 return False
                 
             # Vérifier si le port est encore ouvert
             if not self.device.is_open:
-                print("Port série fermé détecté lors de l'écriture")
+                logger.warning("Port série fermé détecté lors de l'écriture")
                 self.device = None
                 return False
             
@@ -142,7 +340,7 @@ class RegenDevice:
             
             # Vérifier encore une fois si le port est ouvert
             if not self.device.is_open:
-                print("Port série fermé détecté après envoi de commande")
+                logger.warning("Port série fermé détecté après envoi de commande")
                 self.device = None
                 return False
             
@@ -153,12 +351,12 @@ class RegenDevice:
             return True
         except (OSError, IOError, serial.SerialException, PermissionError) as e:
             # Erreurs de communication série - probablement déconnecté
-            print(f"Error writing parameter to regeneration device: {e}")
+            logger.warning("Error writing parameter to regeneration device: %s", e)
             # Marquer l'appareil comme non disponible
             self.device = None
             return False
         except Exception as e:
-            print(f"Unexpected error writing to regeneration device: {e}")
+            logger.warning("Unexpected error writing to regeneration device: %s", e)
             return False
     
     def close(self):
@@ -168,6 +366,11 @@ class RegenDevice:
         Returns:
             bool: True si la fermeture a réussi ou si l'appareil était déjà fermé, False en cas d'erreur
         """
+        with self._lock:
+            return self._close()
+    
+    def _close(self):
+        """Fermeture du port, à appeler avec le verrou du port"""
         if self.device:
             try:
                 # Vérifier si le port est déjà fermé avant d'essayer de le fermer
@@ -15,6 +15,10 @@ def main():
     Initialise l'interface utilisateur et gère les exceptions globales.
     """
     try:
+        # Journalisation via une file traitée en arrière-plan
+        from utils.logging_utils import configure_logging
+        configure_logging()
+        
         # Charger la configuration externe si en mode exécutable
         from utils.config_manager import update_constants_from_config
         update_constants_from_config()
@@ -179,8 +179,11 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         print("Regeneration device not needed or not available - using dummy device")
         regen = type('DummyRegen', (), {
             'read_variable': lambda *args: "0",
-            'write_parameter': lambda *args: None,
+            'read_variables': lambda self, command, addresses: ["0"] * len(addresses),
+            'write_parameter': lambda *args: False,
+            'write_raw': lambda *args: False,
             'close': lambda *args: None,  # Accepte un self implicite
+            'is_connected': lambda *args: False,
             'device': None
         })()
         
@@ -268,9 +271,9 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     escape_pressed = False
     
     # Variables pour la sauvegarde de secours
-    last_backup_time = time.time()
+    last_backup_time = time.monotonic()
     backup_interval = 500  # Sauvegarde automatique toutes les 500 secondes (environ 8 minutes)
-    last_notification_time = time.time()  # Pour limiter les notifications
+    last_notification_time = time.monotonic()  # Pour limiter les notifications
     notification_cooldown = 30  # 30 secondes entre les notifications
     emergency_mode = False  # Indique si on est en mode d'urgence
     device_error_count = {
@@ -282,7 +285,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     
     # Configuration pour le scan automatique des périphériques
     scan_for_devices_interval = 30  # Intervalle de scan en secondes (0 pour désactiver)
-    last_device_scan_time = time.time()  # Temps du dernier scan
+    last_device_scan_time = time.monotonic()  # Temps du dernier scan
     last_backup_status = {
         'time': None,
         'success': False,
@@ -365,7 +368,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         
         # Si on reprend après pause - NE PAS SAUVEGARDER ici
         if not previous_state and measure_conductance_active and measurements.pause_time_conductance is not None:
-            current_time = time.time()
+            current_time = time.monotonic()
             pause_duration = current_time - measurements.pause_time_conductance
             measurements.elapsed_time_conductance += pause_duration
         
@@ -406,7 +409,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         
         # Si on reprend après pause - NE PAS SAUVEGARDER ici
         if not previous_state and measure_co2_temp_humidity_active and measurements.pause_time_co2_temp_humidity is not None:
-            current_time = time.time()
+            current_time = time.monotonic()
             pause_duration = current_time - measurements.pause_time_co2_temp_humidity
             measurements.elapsed_time_co2_temp_humidity += pause_duration
         
@@ -442,7 +445,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         
         # Si on reprend après pause - NE PAS SAUVEGARDER ici
         if not previous_state and measure_res_temp_active and measurements.pause_time_res_temp is not None:
-            current_time = time.time()
+            current_time = time.monotonic()
             pause_duration = current_time - measurements.pause_time_res_temp
             measurements.elapsed_time_res_temp += pause_duration
         
@@ -546,12 +549,12 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     def set_R0(event):
         """Gère la définition de R0"""
         value = plot_manager.textboxes['R0'].text
-        measurements.set_R0(value)
+        measurements.set_R0(value, force=True)
     
     def set_Tcons(event):
         """Gère la définition de Tcons"""
         value = plot_manager.textboxes['Tcons'].text
-        success = measurements.set_Tcons(value)
+        success = measurements.set_Tcons(value, force=True)
         if success and measure_res_temp_active:
             # Forcer une lecture immédiate pour mettre à jour l'affichage
             temp_data = measurements.read_res_temp()
@@ -564,7 +567,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     
     def update_read_R0(event):
         """Gère la lecture de R0"""
-        R0 = measurements.read_R0()
+        R0 = measurements.read_R0(force=True)
         if R0 is not None:
             plot_manager.update_R0_display(R0)
     
@@ -741,7 +744,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         # Définir Tcons à 0°C avant de fermer
         from core.constants import TCONS_LOW
         try:
-            measurements.set_Tcons(str(TCONS_LOW))
+            measurements.set_Tcons(str(TCONS_LOW), force=True)
             print(f"Tcons défini à {TCONS_LOW}°C avant fermeture")
         except Exception as e:
             print(f"Erreur lors de la définition de Tcons: {e}")
@@ -759,7 +762,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
             )
             
             # Vérifier si nous avons eu une sauvegarde d'urgence récente
-            current_time = time.time()
+            current_time = time.monotonic()
             recent_emergency_backup = hasattr(perform_emergency_backup, 'last_emergency_time') and \
                                     (current_time - perform_emergency_backup.last_emergency_time < 60)
                 
@@ -1265,8 +1268,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                 print(f"Vérification état Keithley après mise à jour: measurements.keithley = {measurements.keithley}, device = {measurements.keithley.device if hasattr(measurements.keithley, 'device') else 'None'}")
                 
                 # Force la réinitialisation du flag d'erreur dans MeasurementManager
-                if hasattr(measurements, '_keithley_error_reported'):
-                    measurements._keithley_error_reported = False
+                measurements._keithley_error_reported = False
             
             # Mettre à jour l'interface
             plot_manager.update_add_device_buttons({'keithley': True})
@@ -1389,7 +1391,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                 print(f"Carte de régénération connectée avec succès sur le port {regen_port}")
                 
                 # Test silencieux pour vérifier que la communication fonctionne
-                measurements.read_R0()
+                measurements.read_R0(force=True)
             else:
                 # Échec de la connexion
                 print(f"Échec de la connexion à la carte de régénération sur le port {regen_port}")
@@ -1566,209 +1568,153 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     
     # Main loop
     while not escape_pressed:
-        current_time = time.time()
+        current_time = time.monotonic()
         
         # Lire toutes les données disponibles du port série
         # Vérifier si données disponibles et les traiter en fonction du mode actif
         # Ne tenter de lire que si l'Arduino est connecté
         if arduino_connected:
-            for _ in range(10):  # Lire jusqu'à 10 lignes par itération pour vider le buffer
-                line = None
-                try:
-                    # Vérification sécurisée pour éviter les erreurs série critiques
-                    if arduino.device and hasattr(arduino.device, 'in_waiting'):
+            co2_samples = []
+            try:
+                # Synchroniser les références pour être sûr qu'ils partagent le même objet
+                measurements.arduino = arduino
+                
+                # Vérification sécurisée pour éviter les erreurs série critiques
+                if arduino.device and hasattr(arduino, 'read_lines'):
+                    try:
+                        # Lire en une seule fois toutes les lignes complètes en attente :
+                        # états des pins (pour les voyants) et données CO2/temp/humidity
+                        # si le mode est actif
+                        pin_states = measurements.pin_states
+                        co2_samples = measurements.read_arduino_batch(
+                            store_co2=bool(measure_co2 and measure_co2_temp_humidity_active),
+                            raise_errors=True
+                        )
+                        if measurements.pin_states is not pin_states:
+                            plot_manager.update_sensor_indicators(measurements.pin_states)
+                    except (serial.SerialException, IOError, OSError, PermissionError) as serial_err:
+                        print(f"Erreur critique sur le port série Arduino: {serial_err}")
+                        device_error_count['arduino'] += 2  # Augmentation plus importante pour les erreurs critiques
+                        # Tentative de fermeture et réinitialisation de l'appareil
                         try:
-                            # Tenter d'accéder à in_waiting de manière sécurisée
-                            waiting_bytes = arduino.device.in_waiting
-                            if waiting_bytes > 0:
-                                line = arduino.device.readline().decode('utf-8', errors='ignore').strip()
-                        except (serial.SerialException, IOError, OSError, PermissionError) as serial_err:
-                            print(f"Erreur critique sur le port série Arduino: {serial_err}")
-                            device_error_count['arduino'] += 2  # Augmentation plus importante pour les erreurs critiques
-                            # Tentative de fermeture et réinitialisation de l'appareil
-                            try:
-                                if arduino.device:
-                                    arduino.device.close()
-                            except:
-                                pass  # Ignorer les erreurs lors de la fermeture
-                            arduino.device = None
-                            arduino_connected = False
-                            # Mettre à jour l'interface
-                            plot_manager.update_add_device_buttons({'arduino': False})
+                            if arduino.device:
+                                arduino.device.close()
+                        except:
+                            pass  # Ignorer les erreurs lors de la fermeture
+                        arduino.device = None
+                        arduino_connected = False
+                        # Mettre à jour l'interface
+                        plot_manager.update_add_device_buttons({'arduino': False})
+                        
+                        # Mettre automatiquement en pause la mesure de CO2/temp/humidity
+                        if measure_co2_temp_humidity_active:
+                            print("Mise en pause automatique de la mesure de CO2/température/humidité")
                             
-                            # Mettre automatiquement en pause la mesure de CO2/temp/humidity
-                            if measure_co2_temp_humidity_active:
-                                print("Mise en pause automatique de la mesure de CO2/température/humidité")
+                            # Sauvegarder immédiatement les données de CO2/temp/humidity
+                            if ((measurements.timestamps_co2 and len(measurements.timestamps_co2) > 0) or
+                                (measurements.timestamps_temp and len(measurements.timestamps_temp) > 0) or
+                                (measurements.timestamps_humidity and len(measurements.timestamps_humidity) > 0)):
                                 
-                                # Sauvegarder immédiatement les données de CO2/temp/humidity
-                                if ((measurements.timestamps_co2 and len(measurements.timestamps_co2) > 0) or
-                                    (measurements.timestamps_temp and len(measurements.timestamps_temp) > 0) or
-                                    (measurements.timestamps_humidity and len(measurements.timestamps_humidity) > 0)):
+                                print("Sauvegarde immédiate des données de CO2/temp/humidity suite à la déconnexion...")
+                                try:
+                                    # S'assurer que le fichier est initialisé
+                                    if not co2_temp_humidity_file_initialized:
+                                        data_handler.initialize_file("co2_temp_humidity")
+                                        co2_temp_humidity_file_initialized = True
                                     
-                                    print("Sauvegarde immédiate des données de CO2/temp/humidity suite à la déconnexion...")
-                                    try:
-                                        # S'assurer que le fichier est initialisé
-                                        if not co2_temp_humidity_file_initialized:
-                                            data_handler.initialize_file("co2_temp_humidity")
-                                            co2_temp_humidity_file_initialized = True
-                                        
-                                        # Sauvegarde
-                                        data_handler.save_co2_temp_humidity_data(
-                                            measurements.timestamps_co2,
-                                            measurements.values_co2,
-                                            measurements.timestamps_temp,
-                                            measurements.values_temp,
-                                            measurements.timestamps_humidity,
-                                            measurements.values_humidity
-                                        )
-                                        print(f"✓ {len(measurements.timestamps_co2)} points de CO2/temp/humidity sauvegardés")
-                                    except Exception as e:
-                                        print(f"Erreur lors de la sauvegarde des données de CO2/temp/humidity: {e}")
-                                
-                                measure_co2_temp_humidity_active = False
-                                # Mettre à jour l'interface
-                                if 'co2_temp_humidity' in plot_manager.buttons:
-                                    plot_manager.buttons['co2_temp_humidity'].ax.set_facecolor('darkred')
-                                    plot_manager.buttons['co2_temp_humidity'].color = 'darkred'
-                                    plot_manager.buttons['co2_temp_humidity'].label.set_color('white')
-                                    plot_manager.fig.canvas.draw_idle()
-                            
-                            # Sauvegarde d'urgence seulement si pas de sauvegarde récente
-                            current_time = time.time()
-                            if (not hasattr(perform_emergency_backup, 'last_emergency_time') or 
-                                current_time - perform_emergency_backup.last_emergency_time >= 60):
-                                perform_emergency_backup("Déconnexion Arduino détectée")
-                                # Mettre à jour le timestamp pour éviter les sauvegardes en rafale
-                                perform_emergency_backup.last_emergency_time = current_time
-                                
-                            # Sortir complètement des tentatives de lecture
-                            break
-                        except Exception as e:
-                            print(f"Error reading from Arduino: {e}")
-                            device_error_count['arduino'] += 1
-                except Exception as e:
-                    # Ne pas spammer la console - réduire les messages d'erreur
-                    # Incrémenter le compteur quand même
-                    device_error_count['arduino'] += 1
-                    
-                    # N'afficher l'erreur que toutes les 20 itérations environ
-                    if sum(device_error_count.values()) % 20 == 0:
-                        print(f"Erreur générale lors de l'accès à l'Arduino: {e}")
-                        
-                    # Si on a une erreur générale, marquer l'Arduino comme déconnecté
-                    arduino.device = None
-                    arduino_connected = False
-                    plot_manager.update_add_device_buttons({'arduino': False})
-                    
-                    # Mettre automatiquement en pause la mesure de CO2/temp/humidity
-                    if measure_co2_temp_humidity_active:
-                        print("Mise en pause automatique de la mesure de CO2/température/humidité")
-                        
-                        # Sauvegarder immédiatement les données de CO2/temp/humidity
-                        if ((measurements.timestamps_co2 and len(measurements.timestamps_co2) > 0) or
-                            (measurements.timestamps_temp and len(measurements.timestamps_temp) > 0) or
-                            (measurements.timestamps_humidity and len(measurements.timestamps_humidity) > 0)):
+                                    # Sauvegarde
+                                    data_handler.save_co2_temp_humidity_data(
+                                        measurements.timestamps_co2,
+                                        measurements.values_co2,
+                                        measurements.timestamps_temp,
+                                        measurements.values_temp,
+                                        measurements.timestamps_humidity,
+                                        measurements.values_humidity
+                                    )
+                                    print(f"✓ {len(measurements.timestamps_co2)} points de CO2/temp/humidity sauvegardés")
+                                except Exception as e:
+                                    print(f"Erreur lors de la sauvegarde des données de CO2/temp/humidity: {e}")
                             
-                            print("Sauvegarde immédiate des données de CO2/temp/humidity suite à la déconnexion...")
-                            try:
-                                # S'assurer que le fichier est initialisé
-                                if not co2_temp_humidity_file_initialized:
-                                    data_handler.initialize_file("co2_temp_humidity")
-                                    co2_temp_humidity_file_initialized = True
-                                
-                                # Sauvegarde
-                                data_handler.save_co2_temp_humidity_data(
-                                    measurements.timestamps_co2,
-                                    measurements.values_co2,
-                                    measurements.timestamps_temp,
-                                    measurements.values_temp,
-                                    measurements.timestamps_humidity,
-                                    measurements.values_humidity
-                                )
-                                print(f"✓ {len(measurements.timestamps_co2)} points de CO2/temp/humidity sauvegardés")
-                            except Exception as e:
-                                print(f"Erreur lors de la sauvegarde des données de CO2/temp/humidity: {e}")
-                        
-                        measure_co2_temp_humidity_active = False
-                        # Mettre à jour l'interface
-                        if 'co2_temp_humidity' in plot_manager.buttons:
-                            plot_manager.buttons['co2_temp_humidity'].ax.set_facecolor('darkred')
-                            plot_manager.buttons['co2_temp_humidity'].color = 'darkred'
-                            plot_manager.buttons['co2_temp_humidity'].label.set_color('white')
-                            plot_manager.fig.canvas.draw_idle()
-                    break
-                
-                if not line:
-                    break  # Aucune donnée disponible, sortir de la boucle
-                
-                # Traiter les états des pins (pour les voyants)
-                if "VR:" in line and "VS:" in line and "TO:" in line and "TF:" in line:
-                    try:
-                        # Parse individual pin states
-                        vr_part = line.split("VR:")[1].split()[0]
-                        vs_part = line.split("VS:")[1].split()[0]
-                        to_part = line.split("TO:")[1].split()[0]
-                        tf_part = line.split("TF:")[1].split()[0]
-                        
-                        # Clarify status parsing (HIGH = True, LOW = False)
-                        vr_state = vr_part == "HIGH"
-                        vs_state = vs_part == "HIGH"
-                        to_state = to_part == "HIGH"
-                        tf_state = tf_part == "HIGH"
-                        
-                        # Store the pin states for UI updating
-                        measurements.pin_states = {
-                            'vr': vr_state,  # Vérin Rentré
-                            'vs': vs_state,  # Vérin Sorti
-                            'to': to_state,  # Trappe Ouverte
-                            'tf': tf_state   # Trappe Fermée
-                        }
+                            measure_co2_temp_humidity_active = False
+                            # Mettre à jour l'interface
+                            if 'co2_temp_humidity' in plot_manager.buttons:
+                                plot_manager.buttons['co2_temp_humidity'].ax.set_facecolor('darkred')
+                                plot_manager.buttons['co2_temp_humidity'].color = 'darkred'
+                                plot_manager.buttons['co2_temp_humidity'].label.set_color('white')
+                                plot_manager.fig.canvas.draw_idle()
                         
-                        # Update indicator LEDs if pin states changed
-                        plot_manager.update_sensor_indicators(measurements.pin_states)
+                        # Sauvegarde d'urgence seulement si pas de sauvegarde récente
+                        current_time = time.monotonic()
+                        if (not hasattr(perform_emergency_backup, 'last_emergency_time') or 
+                            current_time - perform_emergency_backup.last_emergency_time >= 60):
+                            perform_emergency_backup("Déconnexion Arduino détectée")
+                            # Mettre à jour le timestamp pour éviter les sauvegardes en rafale
+                            perform_emergency_backup.last_emergency_time = current_time
                     except Exception as e:
-                        print(f"Error parsing pin states: {e}, line: {line}")
-                        # Incrémenter le compteur d'erreurs Arduino (erreur de parsing)
+                        print(f"Error reading from Arduino: {e}")
                         device_error_count['arduino'] += 1
+            except Exception as e:
+                # Ne pas spammer la console - réduire les messages d'erreur
+                # Incrémenter le compteur quand même
+                device_error_count['arduino'] += 1
                 
-                # Traiter les données CO2/temp/humidity uniquement si le mode est actif
-                elif line.startswith('@') and measure_co2 and measure_co2_temp_humidity_active:
-                    data = line[1:].split()
-                    if len(data) == 3:
+                # N'afficher l'erreur que toutes les 20 itérations environ
+                if sum(device_error_count.values()) % 20 == 0:
+                    print(f"Erreur générale lors de l'accès à l'Arduino: {e}")
+                    
+                # Si on a une erreur générale, marquer l'Arduino comme déconnecté
+                arduino.device = None
+                arduino_connected = False
+                plot_manager.update_add_device_buttons({'arduino': False})
+                
+                # Mettre automatiquement en pause la mesure de CO2/temp/humidity
+                if measure_co2_temp_humidity_active:
+                    print("Mise en pause automatique de la mesure de CO2/température/humidité")
+                    
+                    # Sauvegarder immédiatement les données de CO2/temp/humidity
+                    if ((measurements.timestamps_co2 and len(measurements.timestamps_co2) > 0) or
+                        (measurements.timestamps_temp and len(measurements.timestamps_temp) > 0) or
+                        (measurements.timestamps_humidity and len(measurements.timestamps_humidity) > 0)):
+                        
+                        print("Sauvegarde immédiate des données de CO2/temp/humidity suite à la déconnexion...")
                         try:
-                            co2 = float(data[0])
-                            temperature = float(data[1])
-                            humidity = float(data[2])
-                            
-                            # Only initialize start_time when we actually get data to plot
-                            if measurements.start_time_co2_temp_humidity is None:
-                                measurements.start_time_co2_temp_humidity = current_time
-                            
-                            # Calculate timestamp
-                            timestamp = current_time - measurements.start_time_co2_temp_humidity - measurements.elapsed_time_co2_temp_humidity
+                            # S'assurer que le fichier est initialisé
+                            if not co2_temp_humidity_file_initialized:
+                                data_handler.initialize_file("co2_temp_humidity")
+                                co2_temp_humidity_file_initialized = True
                             
-                            # Store data
-                            measurements.timestamps_co2.append(timestamp)
-                            measurements.values_co2.append(co2)
-                            measurements.timestamps_temp.append(timestamp)
-                            measurements.values_temp.append(temperature)
-                            measurements.timestamps_humidity.append(timestamp)
-                            measurements.values_humidity.append(humidity)
-                            
-                            # Update plot
-                            plot_manager.update_co2_temp_humidity_plot(
+                            # Sauvegarde
+                            data_handler.save_co2_temp_humidity_data(
                                 measurements.timestamps_co2,
                                 measurements.values_co2,
                                 measurements.timestamps_temp,
                                 measurements.values_temp,
                                 measurements.timestamps_humidity,
-                                measurements.values_humidity,
-                                measurements.regeneration_timestamps
+                                measurements.values_humidity
                             )
-                        except ValueError:
-                            print(f"Error parsing CO2/temp/humidity data: {line}")
-                            # Incrémenter le compteur d'erreurs Arduino (erreur de parsing CO2/temp/humidity)
-                            device_error_count['arduino'] += 1
+                            print(f"✓ {len(measurements.timestamps_co2)} points de CO2/temp/humidity sauvegardés")
+                        except Exception as e:
+                            print(f"Erreur lors de la sauvegarde des données de CO2/temp/humidity: {e}")
+                    
+                    measure_co2_temp_humidity_active = False
+                    # Mettre à jour l'interface
+                    if 'co2_temp_humidity' in plot_manager.buttons:
+                        plot_manager.buttons['co2_temp_humidity'].ax.set_facecolor('darkred')
+                        plot_manager.buttons['co2_temp_humidity'].color = 'darkred'
+                        plot_manager.buttons['co2_temp_humidity'].label.set_color('white')
+                        plot_manager.fig.canvas.draw_idle()
+            
+            # Update plot (une fois pour toutes les lignes reçues)
+            if co2_samples:
+                plot_manager.update_co2_temp_humidity_plot(
+                    measurements.timestamps_co2,
+                    measurements.values_co2,
+                    measurements.timestamps_temp,
+                    measurements.values_temp,
+                    measurements.timestamps_humidity,
+                    measurements.values_humidity,
+                    measurements.regeneration_timestamps
+                )
         
         # Handle conductance measurements
         if measure_conductance and measure_conductance_active:
@@ -1790,7 +1736,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                     plot_manager.update_add_device_buttons({'keithley': False})
                     
                     # Tenter une reconnexion automatique (nouvelle fonctionnalité)
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if scan_for_devices_interval > 0 and (current_time - last_device_scan_time) >= scan_for_devices_interval:
                         print("Tentative de reconnexion automatique du Keithley...")
                         last_device_scan_time = current_time
@@ -1828,7 +1774,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                             plot_manager.fig.canvas.draw_idle()
                     
                     # Sauvegarde d'urgence seulement si pas de sauvegarde récente
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if (not hasattr(perform_emergency_backup, 'last_emergency_time') or 
                         current_time - perform_emergency_backup.last_emergency_time >= 60):
                         perform_emergency_backup("Déconnexion Keithley détectée")
@@ -1857,7 +1803,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                         plot_manager.update_add_device_buttons({'keithley': False})
                         
                         # Tenter une reconnexion automatique (nouvelle fonctionnalité)
-                        current_time = time.time()
+                        current_time = time.monotonic()
                         if scan_for_devices_interval > 0 and (current_time - last_device_scan_time) >= scan_for_devices_interval:
                             print("Tentative de reconnexion automatique du Keithley...")
                             last_device_scan_time = current_time
@@ -1895,7 +1841,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                                 plot_manager.fig.canvas.draw_idle()
                         
                         # Sauvegarde d'urgence seulement si pas de sauvegarde récente
-                        current_time = time.time()
+                        current_time = time.monotonic()
                         if (not hasattr(perform_emergency_backup, 'last_emergency_time') or 
                             current_time - perform_emergency_backup.last_emergency_time >= 60):
                             perform_emergency_backup("Déconnexion Keithley détectée")
@@ -2001,7 +1947,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                             plot_manager.fig.canvas.draw_idle()
                     
                     # Sauvegarde d'urgence seulement si pas de sauvegarde récente
-                    current_time = time.time()
+                    current_time = time.monotonic()
                     if (not hasattr(perform_emergency_backup, 'last_emergency_time') or 
                         current_time - perform_emergency_backup.last_emergency_time >= 60):
                         perform_emergency_backup("Déconnexion carte de régénération détectée")
@@ -2075,7 +2021,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                                 plot_manager.fig.canvas.draw_idle()
                         
                         # Sauvegarde d'urgence seulement si pas de sauvegarde récente
-                        current_time = time.time()
+                        current_time = time.monotonic()
                         if (not hasattr(perform_emergency_backup, 'last_emergency_time') or 
                             current_time - perform_emergency_backup.last_emergency_time >= 60):
                             perform_emergency_backup("Déconnexion carte de régénération détectée")
@@ -2100,10 +2046,13 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                     measurements.regeneration_timestamps
                 )
         
+        # Horloge des protocoles, lue une seule fois pour toute l'itération
+        protocol_time = time.monotonic()
+        
         # Handle regeneration protocol
         if measurements.regeneration_in_progress:
             try:
-                regeneration_status = measurements.manage_regeneration_protocol()
+                regeneration_status = measurements.manage_regeneration_protocol(protocol_time)
                 plot_manager.update_regeneration_status(regeneration_status, measurements.regeneration_results)
                 
                 # Force completion de protocole s'il atteint 100%
@@ -2144,7 +2093,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
         # Handle conductance regeneration protocol
         if measurements.conductance_regen_in_progress:
             try:
-                conductance_regen_status = measurements.manage_conductance_regen_protocol()
+                conductance_regen_status = measurements.manage_conductance_regen_protocol(protocol_time)
                 plot_manager.update_regeneration_status(conductance_regen_status)
                 
                 # Force completion de protocole s'il atteint 100%
@@ -2186,7 +2135,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                     })
                 else:
                     # Gérer le protocole normalement
-                    full_protocol_status = measurements.manage_full_protocol()
+                    full_protocol_status = measurements.manage_full_protocol(protocol_time)
                     plot_manager.update_regeneration_status(full_protocol_status, full_protocol_status.get('results'))
                     
                     # Afficher l'étape actuelle et le message dans la console pour le débogage
@@ -2227,7 +2176,7 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
                     cancel_button.ax.figure.canvas.draw_idle()
             
         # Vérifier si des erreurs d'appareils ont été détectées ou si l'intervalle de sauvegarde automatique est écoulé
-        current_time = time.time()
+        current_time = time.monotonic()
         should_backup = False
         backup_reason = "sauvegarde périodique"
         
@@ -2407,4 +2356,6 @@ def main(arduino_port=None, arduino_baud_rate=None, other_port=None, other_baud_
     sys.exit(0)
 
 if __name__ == "__main__":
+    from utils.logging_utils import configure_logging
+    configure_logging()
     main()
\ No newline at end of file
@@ -10,6 +10,18 @@ from matplotlib.widgets import Button, TextBox, RadioButtons
 class PlotManager:
     """Gère les graphiques matplotlib et les éléments d'interface utilisateur"""
     
+    # Lignes verticales des événements de régénération, dans l'ordre de tracé :
+    # (clé de regeneration_timestamps, couleur, libellé de légende)
+    _REGENERATION_MARKERS = (
+        ('r0_actualized', 'purple', 'R0 actualisé'),
+        ('co2_stability_started', 'green', 'Début stabilité CO2'),
+        ('co2_stability_achieved', 'orange', 'Stabilité CO2 atteinte'),
+        ('co2_increase_detected', 'magenta', 'Augmentation CO2 détectée'),
+        ('co2_peak_reached', 'red', 'Pic de CO2 atteint'),
+        ('co2_restabilized', 'blue', 'CO2 restabilisé'),
+        ('co2_restabilization_start_time', 'purple', 'Début recherche restabilisation'),
+    )
+    
     def __init__(self, mode="manual"):
         """
         Initialise le gestionnaire de graphiques
@@ -905,52 +917,40 @@ class PlotManager:
         ax_right.legend(loc='center right', handles=[temperature_plot, humidity_plot])
         
         # Ajouter des pointillés verticaux pour les événements clés de régénération
-        if regeneration_timestamps:
-            # Afficher une ligne verticale lorsque R0 a été actualisé
-            if regeneration_timestamps.get('r0_actualized') is not None:
-                r0_time = regeneration_timestamps['r0_actualized'] / 60.0 if self.display_minutes else regeneration_timestamps['r0_actualized']
-                ax.axvline(x=r0_time, color='purple', linestyle='--', linewidth=1.5, label='R0 actualisé')
-            
-            # Afficher une ligne verticale pour le début de la vérification de la stabilité CO2
-            if regeneration_timestamps.get('co2_stability_started') is not None:
-                start_time = regeneration_timestamps['co2_stability_started'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_stability_started']
-                ax.axvline(x=start_time, color='green', linestyle='--', linewidth=1.5, label='Début stabilité CO2')
-            
-            # Afficher une ligne verticale pour la confirmation de stabilité CO2
-            if regeneration_timestamps.get('co2_stability_achieved') is not None:
-                end_time = regeneration_timestamps['co2_stability_achieved'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_stability_achieved']
-                ax.axvline(x=end_time, color='orange', linestyle='--', linewidth=1.5, label='Stabilité CO2 atteinte')
-            
-            # Afficher une ligne verticale pour l'augmentation de CO2 après Tcons=700
-            if regeneration_timestamps.get('co2_increase_detected') is not None:
-                increase_time = regeneration_timestamps['co2_increase_detected'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_increase_detected']
-                ax.axvline(x=increase_time, color='magenta', linestyle='--', linewidth=1.5, label='Augmentation CO2 détectée')
-            
-            # Afficher une ligne verticale pour le pic de CO2 (fin de montée)
-            if regeneration_timestamps.get('co2_peak_reached') is not None:
-                peak_time = regeneration_timestamps['co2_peak_reached'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_peak_reached']
-                ax.axvline(x=peak_time, color='red', linestyle='--', linewidth=1.5, label='Pic de CO2 atteint')
-                
-            # Afficher une ligne verticale pour la restabilisation du CO2
-            if regeneration_timestamps.get('co2_restabilized') is not None:
-                restab_time = regeneration_timestamps['co2_restabilized'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_restabilized']
-                ax.axvline(x=restab_time, color='blue', linestyle='--', linewidth=1.5, label='CO2 restabilisé')
-                
-                # Si nous avons une nouvelle restabilisation, mettre à jour la référence
-                if self.reference_restabilization_time is None:
-                    self.reference_restabilization_time = regeneration_timestamps['co2_restabilized']
-            
-            # Ajouter la ligne de référence de la recherche de restabilisation si disponible
-            if regeneration_timestamps.get('co2_restabilization_start_time') is not None:
-                restab_start_time = regeneration_timestamps['co2_restabilization_start_time'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_restabilization_start_time']
-                ax.axvline(x=restab_start_time, color='purple', linestyle='--', linewidth=1.5, label='Début recherche restabilisation')
-            
-            # Ajouter une légende si des événements sont présents
-            if any(v is not None for v in regeneration_timestamps.values()):
-                ax.legend(loc='upper left')
+        # (légende ajoutée si des événements sont présents)
+        if regeneration_timestamps and self._draw_regeneration_markers(ax, regeneration_timestamps):
+            ax.legend(loc='upper left')
         
         self.fig.canvas.draw()
     
+    def _draw_regeneration_markers(self, ax, regeneration_timestamps, count=None):
+        """
+        Trace les pointillés verticaux des événements clés de régénération
+        
+        Chaque horodatage n'est lu qu'une fois dans le dictionnaire.
+        
+        Args:
+            ax: Axe sur lequel tracer les lignes
+            regeneration_timestamps: Dictionnaire des horodatages des événements
+            count: Nombre de marqueurs de _REGENERATION_MARKERS à considérer (tous si None)
+            
+        Returns:
+            bool: True si au moins une ligne a été tracée
+        """
+        drawn = False
+        for key, color, label in self._REGENERATION_MARKERS[:count]:
+            event_time = regeneration_timestamps.get(key)
+            if event_time is None:
+                continue
+            x = event_time / 60.0 if self.display_minutes else event_time
+            ax.axvline(x=x, color=color, linestyle='--', linewidth=1.5, label=label)
+            drawn = True
+            
+            # Si nous avons une nouvelle restabilisation, mettre à jour la référence
+            if key == 'co2_restabilized' and self.reference_restabilization_time is None:
+                self.reference_restabilization_time = event_time
+        return drawn
+    
     def update_res_temp_plot(self, timestamps, temperatures, tcons_values, regeneration_timestamps=None):
         """
         Met à jour le graphique de température de résistance
@@ -979,21 +979,9 @@ class PlotManager:
         ax.set_ylabel('Température °C')
         
         # Ajouter des pointillés verticaux pour les événements clés de régénération
+        # (seulement ceux qui précèdent le chauffage)
         if regeneration_timestamps:
-            # Afficher une ligne verticale lorsque R0 a été actualisé
-            if regeneration_timestamps.get('r0_actualized') is not None:
-                r0_time = regeneration_timestamps['r0_actualized'] / 60.0 if self.display_minutes else regeneration_timestamps['r0_actualized']
-                ax.axvline(x=r0_time, color='purple', linestyle='--', linewidth=1.5, label='R0 actualisé')
-            
-            # Afficher une ligne verticale pour le début de la vérification de la stabilité CO2
-            if regeneration_timestamps.get('co2_stability_started') is not None:
-                start_time = regeneration_timestamps['co2_stability_started'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_stability_started']
-                ax.axvline(x=start_time, color='green', linestyle='--', linewidth=1.5, label='Début stabilité CO2')
-            
-            # Afficher une ligne verticale pour la confirmation de stabilité CO2
-            if regeneration_timestamps.get('co2_stability_achieved') is not None:
-                end_time = regeneration_timestamps['co2_stability_achieved'] / 60.0 if self.display_minutes else regeneration_timestamps['co2_stability_achieved']
-                ax.axvline(x=end_time, color='orange', linestyle='--', linewidth=1.5, label='Stabilité CO2 atteinte')
+            self._draw_regeneration_markers(ax, regeneration_timestamps, count=3)
             
         self.fig.canvas.draw()
     
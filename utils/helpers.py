@@ -6,15 +6,31 @@ du système de capteurs, notamment pour les calculs de pente, l'analyse des
 données de série et la gestion des fenêtres glissantes.
 """
 
+import bisect
+import re
 import time
 import numpy as np
 
+# Champ d'une trame d'état des capteurs de position : "<capteur>:<état>".
+# Chaque champ est reconnu indépendamment, quel que soit l'ordre dans la trame
+_PIN_FIELD_RE = re.compile(r'(VR|VS|TO|TF):\s*(\S+)')
+
+# Nombre décimal tel qu'envoyé par les appareils (signe et exposant optionnels).
+# Les lignes mal formées (trames tronquées, bruit au démarrage) sont écartées par
+# une correspondance plutôt que par l'exception levée par float()
+_NUMBER = r'[-+]?(?:\d+\.?\d*|\.\d+)(?:[eE][-+]?\d+)?'
+_NUMBER_RE = re.compile(_NUMBER)
+
+# Trame de mesure de l'Arduino : "@<CO2> <température> <humidité>"
+_CO2_FRAME_RE = re.compile(rf'@\s*({_NUMBER})\s+({_NUMBER})\s+({_NUMBER})\s*')
+
 def calculate_slope(x_values, y_values, window_size=10):
     """
     Calcule la pente d'une ligne ajustée aux valeurs données en utilisant la régression linéaire
     
-    Cette fonction utilise numpy.polyfit pour calculer la pente (coefficient de premier degré)
-    d'une droite ajustée aux données. Elle est utile pour déterminer le taux de variation
+    Cette fonction calcule la pente (coefficient de premier degré) d'une droite ajustée
+    aux données par la forme fermée des moindres carrés (slope_last_n), sans passer
+    par numpy.polyfit. Elle est utile pour déterminer le taux de variation
     d'un signal, par exemple pour détecter l'augmentation de conductance.
     
     Args:
@@ -23,7 +39,7 @@ def calculate_slope(x_values, y_values, window_size=10):
         window_size: Nombre de points à inclure dans le calcul de la pente
     
     Returns:
-        float: Pente de la ligne (taux de variation)
+        float: Pente de la ligne (taux de variation), 0.0 si les abscisses sont toutes identiques
     """
     if len(x_values) < 2 or len(y_values) < 2:
         return 0.0
@@ -31,13 +47,301 @@ def calculate_slope(x_values, y_values, window_size=10):
     if len(x_values) != len(y_values):
         raise ValueError("x_values et y_values doivent avoir la même longueur")
     
-    if window_size > len(x_values):
-        window_size = len(x_values)
+    return slope_last_n(x_values, y_values, min(window_size, len(x_values)))
+
+def slope_last_n(times, values, n):
+    """
+    Calcule la pente de régression linéaire sur les n derniers points
+    
+    Forme fermée des moindres carrés (covariance / variance en deux passes),
+    équivalente à numpy.polyfit(..., 1)[0] sans construire de matrice ni
+    allouer de tableau NumPy : adaptée aux petites fenêtres évaluées à chaque mesure.
+    
+    Args:
+        times: Séquence des valeurs x (généralement le temps)
+        values: Séquence des valeurs y (même longueur que times)
+        n: Nombre de points en fin de série à utiliser
+    
+    Returns:
+        float: Pente de la droite ajustée, 0.0 si les abscisses sont toutes identiques
+    """
+    x_window = times[-n:]
+    y_window = values[-n:]
+    count = len(x_window)
+    
+    x_mean = sum(x_window) / count
+    y_mean = sum(y_window) / count
+    
+    sxy = 0.0
+    sxx = 0.0
+    for x, y in zip(x_window, y_window):
+        dx = x - x_mean
+        sxy += dx * (y - y_mean)
+        sxx += dx * dx
+    
+    if sxx == 0.0:
+        return 0.0
+    return float(sxy / sxx)
+
+def three_point_slope(t0, t1, t2, v0, v1, v2):
+    """
+    Pente des moindres carrés sur trois points, sous forme développée
+    
+    Variante de slope_last_n pour n = 3 prenant directement les six scalaires,
+    sans découpage de séquence.
+    
+    Args:
+        t0, t1, t2: Abscisses des trois points (temps)
+        v0, v1, v2: Ordonnées des trois points
+    
+    Returns:
+        float: Pente de la droite ajustée, 0.0 si les abscisses sont identiques
+    """
+    tm = (t0 + t1 + t2) / 3
+    vm = (v0 + v1 + v2) / 3
+    d0 = t0 - tm
+    d1 = t1 - tm
+    d2 = t2 - tm
+    den = d0 * d0 + d1 * d1 + d2 * d2
+    if den == 0.0:
+        return 0.0
+    return (d0 * (v0 - vm) + d1 * (v1 - vm) + d2 * (v2 - vm)) / den
+
+class RollingSlope:
+    """
+    Pente de régression linéaire sur une fenêtre glissante de taille fixe
+    
+    Les sommes S_x, S_y, S_xy et S_xx sont mises à jour en O(1) à chaque point :
+    ajout du point entrant et retrait du point sortant. Les points sont
+    stockés relativement à une origine (ancre) pour limiter les pertes de
+    précision (la pente ne dépend pas de cette translation), et les sommes sont recalculées exactement depuis la fenêtre
+    (avec une nouvelle ancre) tous les `window_size` points pour éliminer
+    la dérive d'arrondi des soustractions successives.
+    
+    Les points sont rangés dans deux tampons circulaires préalloués (abscisses et
+    ordonnées) réécrits sur place : aucun objet n'est alloué par point ajouté.
+    """
+    
+    def __init__(self, window_size=10):
+        """
+        Initialise la fenêtre glissante
+        
+        Args:
+            window_size: Nombre de points utilisés pour la pente
+        """
+        self.window_size = window_size
+        self._xs = [0.0] * window_size
+        self._ys = [0.0] * window_size
+        self.clear()
+    
+    def clear(self):
+        """Vide la fenêtre et remet les sommes à zéro"""
+        self._count = 0
+        self._head = 0  # Position du point le plus ancien
+        self._anchor = None
+        self._anchor_y = 0.0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._sum_xx = 0.0
+        self._pushes_since_resum = 0
+    
+    def __len__(self):
+        return self._count
+    
+    def push(self, x, y):
+        """
+        Ajoute un point à la fenêtre (le plus ancien sort si elle est pleine)
+        
+        Args:
+            x: Abscisse du point (généralement le temps)
+            y: Ordonnée du point (généralement la conductance)
+        """
+        if self._anchor is None:
+            self._anchor = x
+            self._anchor_y = y
+        
+        xs = self._xs
+        ys = self._ys
+        size = self.window_size
+        if self._count == size:
+            # Fenêtre pleine : le point entrant remplace le plus ancien
+            slot = self._head
+            old_x = xs[slot]
+            old_y = ys[slot]
+            self._sum_x -= old_x
+            self._sum_y -= old_y
+            self._sum_xy -= old_x * old_y
+            self._sum_xx -= old_x * old_x
+            self._head = (slot + 1) % size
+        else:
+            slot = (self._head + self._count) % size
+            self._count += 1
+        
+        x -= self._anchor
+        y -= self._anchor_y
+        xs[slot] = x
+        ys[slot] = y
+        self._sum_x += x
+        self._sum_y += y
+        self._sum_xy += x * y
+        self._sum_xx += x * x
+        
+        self._pushes_since_resum += 1
+        if self._pushes_since_resum >= size:
+            self._resum()
+    
+    def _resum(self):
+        """Recalcule exactement les sommes en prenant le plus ancien point comme ancre"""
+        xs = self._xs
+        ys = self._ys
+        size = self.window_size
+        head = self._head
+        shift_x = xs[head]
+        shift_y = ys[head]
+        self._anchor += shift_x
+        self._anchor_y += shift_y
+        
+        sum_x = sum_y = sum_xy = sum_xx = 0.0
+        for k in range(self._count):
+            slot = (head + k) % size
+            x = xs[slot] - shift_x
+            y = ys[slot] - shift_y
+            xs[slot] = x
+            ys[slot] = y
+            sum_x += x
+            sum_y += y
+            sum_xy += x * y
+            sum_xx += x * x
+        
+        self._sum_x = sum_x
+        self._sum_y = sum_y
+        self._sum_xy = sum_xy
+        self._sum_xx = sum_xx
+        self._pushes_since_resum = 0
+    
+    def slope(self):
+        """
+        Retourne la pente courante de la fenêtre
+        
+        Returns:
+            float: Pente de la droite ajustée, 0.0 si moins de 2 points ou abscisses identiques
+        """
+        n = self._count
+        if n < 2:
+            return 0.0
+        denominator = n * self._sum_xx - self._sum_x * self._sum_x
+        if denominator == 0.0:
+            return 0.0
+        return (n * self._sum_xy - self._sum_x * self._sum_y) / denominator
+
+class OnlineRegression:
+    """
+    Régression linéaire en ligne sur une fenêtre de taille variable
+    
+    Les moments S_x, S_y, S_xy, S_xx et S_yy sont mis à jour en O(1) par ajout
+    (push) ou retrait (pop) d'un point, ce qui permet de suivre une fenêtre
+    temporelle glissante sans réajuster la droite à chaque mesure. Les points
+    sont translatés par une ancre pour limiter les pertes de précision ;
+    rebuild() recalcule les moments exactement depuis la fenêtre courante.
+    """
+    
+    def __init__(self):
+        """Initialise une régression vide"""
+        self.clear()
+    
+    def clear(self):
+        """Remet tous les moments à zéro"""
+        self.n = 0
+        self._anchor_x = None
+        self._anchor_y = 0.0
+        self._sum_x = 0.0
+        self._sum_y = 0.0
+        self._sum_xy = 0.0
+        self._sum_xx = 0.0
+        self._sum_yy = 0.0
+        self.updates_since_rebuild = 0
+    
+    def __len__(self):
+        return self.n
+    
+    def _accumulate(self, x, y, sign):
+        if self._anchor_x is None:
+            self._anchor_x = x
+            self._anchor_y = y
+        x -= self._anchor_x
+        y -= self._anchor_y
+        self.n += sign
+        self._sum_x += sign * x
+        self._sum_y += sign * y
+        self._sum_xy += sign * x * y
+        self._sum_xx += sign * x * x
+        self._sum_yy += sign * y * y
+        self.updates_since_rebuild += 1
+    
+    def push(self, x, y):
+        """Ajoute un point à la fenêtre"""
+        self._accumulate(x, y, 1)
+    
+    def pop(self, x, y):
+        """Retire de la fenêtre un point précédemment ajouté"""
+        self._accumulate(x, y, -1)
+        if self.n == 0:
+            self.clear()
+    
+    def rebuild(self, x_values, y_values):
+        """
+        Recalcule exactement les moments à partir des points de la fenêtre
+        
+        Args:
+            x_values: Tableau NumPy des abscisses de la fenêtre
+            y_values: Tableau NumPy des ordonnées de la fenêtre
+        """
+        self.clear()
+        if len(x_values) == 0:
+            return
+        self._anchor_x = float(x_values[0])
+        self._anchor_y = float(y_values[0])
+        dx = np.asarray(x_values, dtype=float) - self._anchor_x
+        dy = np.asarray(y_values, dtype=float) - self._anchor_y
+        self.n = len(dx)
+        self._sum_x = float(dx.sum())
+        self._sum_y = float(dy.sum())
+        self._sum_xy = float(np.dot(dx, dy))
+        self._sum_xx = float(np.dot(dx, dx))
+        self._sum_yy = float(np.dot(dy, dy))
     
-    x_window = x_values[-window_size:]
-    y_window = y_values[-window_size:]
+    def slope(self):
+        """
+        Retourne la pente de la droite ajustée sur la fenêtre
+        
+        Returns:
+            float: Pente, 0.0 si moins de 2 points ou abscisses identiques
+        """
+        n = self.n
+        if n < 2:
+            return 0.0
+        sxx = n * self._sum_xx - self._sum_x * self._sum_x
+        if sxx <= 0.0:
+            return 0.0
+        return (n * self._sum_xy - self._sum_x * self._sum_y) / sxx
     
-    return np.polyfit(x_window, y_window, 1)[0]
+    def r2(self):
+        """
+        Retourne le coefficient de détermination de l'ajustement
+        
+        Returns:
+            float: R² entre 0 et 1, 0.0 si non défini (moins de 2 points ou série constante)
+        """
+        n = self.n
+        if n < 2:
+            return 0.0
+        sxx = n * self._sum_xx - self._sum_x * self._sum_x
+        syy = n * self._sum_yy - self._sum_y * self._sum_y
+        if sxx <= 0.0 or syy <= 0.0:
+            return 0.0
+        sxy = n * self._sum_xy - self._sum_x * self._sum_y
+        return min(1.0, (sxy * sxy) / (sxx * syy))
 
 def find_indices_for_sliding_window(time_values, current_time, half_window_size):
     """
@@ -49,26 +353,24 @@ def find_indices_for_sliding_window(time_values, current_time, half_window_size)
     analyser une période spécifique avant et après un événement.
     
     Args:
-        time_values: Liste des valeurs temporelles (timestamps)
+        time_values: Liste croissante des valeurs temporelles (timestamps)
         current_time: Temps central pour la fenêtre
         half_window_size: Demi-taille de la fenêtre en unités de temps
     
     Returns:
         tuple: (indice_début, indice_fin) définissant les bornes de la fenêtre
     """
-    start_idx = None
-    end_idx = None
+    # Recherche dichotomique des bornes (les timestamps sont croissants)
+    start_idx = bisect.bisect_left(time_values, current_time - half_window_size)
     
-    for i, t in enumerate(time_values):
-        if t >= current_time - half_window_size and start_idx is None:
-            start_idx = i
-        if t <= current_time + half_window_size:
-            end_idx = i
-    
-    if end_idx >= len(time_values):
+    # Cas courant : fenêtre centrée sur la dernière mesure, la borne haute
+    # inclut forcément toute la fin de la série
+    if time_values and current_time + half_window_size >= time_values[-1]:
         end_idx = len(time_values) - 1
+    else:
+        end_idx = bisect.bisect_right(time_values, current_time + half_window_size) - 1
     
-    if start_idx is None:
+    if start_idx >= len(time_values):
         start_idx = 0
     
     return start_idx, end_idx
@@ -90,17 +392,30 @@ def parse_co2_data(line):
     if not line or not line.startswith('@'):
         return None
     
-    data = line[1:].split()
-    if len(data) != 3:
+    # Contrôle du format et du nombre de champs en une seule correspondance :
+    # les valeurs capturées sont toujours convertibles par float()
+    match = _CO2_FRAME_RE.fullmatch(line)
+    if match is None:
         return None
+    co2, temperature, humidity = match.groups()
+    return float(co2), float(temperature), float(humidity)
+
+def parse_number(text):
+    """
+    Convertit une valeur numérique lue sur un appareil, sans lever d'exception
+    
+    Args:
+        text: Chaîne à convertir (les espaces en bordure sont ignorés)
     
-    try:
-        co2 = float(data[0])
-        temperature = float(data[1])
-        humidity = float(data[2])
-        return co2, temperature, humidity
-    except ValueError:
+    Returns:
+        float: La valeur convertie, ou None si la chaîne n'est pas un nombre décimal
+    """
+    if not isinstance(text, str):
+        return None
+    text = text.strip()
+    if _NUMBER_RE.fullmatch(text) is None:
         return None
+    return float(text)
 
 def parse_pin_states(line):
     """
@@ -122,28 +437,24 @@ def parse_pin_states(line):
         dict: Dictionnaire des états des pins {'vr': bool, 'vs': bool, 'to': bool, 'tf': bool}
               ou None si l'analyse a échoué
     """
-    if not line or not ("VR:" in line and "VS:" in line and "TO:" in line and "TF:" in line):
+    if not line:
         return None
-        
-    try:
-        # Analyser les états des pins individuels
-        vr_part = line.split("VR:")[1].split()[0]
-        vs_part = line.split("VS:")[1].split()[0]
-        to_part = line.split("TO:")[1].split()[0]
-        tf_part = line.split("TF:")[1].split()[0]
-        
-        # Clarifier l'analyse des états (HIGH = True, LOW = False)
-        vr_state = vr_part == "HIGH"
-        vs_state = vs_part == "HIGH"
-        to_state = to_part == "HIGH"
-        tf_state = tf_part == "HIGH"
-        
-        # Retourner les états des pins
-        return {
-            'vr': vr_state,  # Vérin Rentré
-            'vs': vs_state,  # Vérin Sorti
-            'to': to_state,  # Trappe Ouverte
-            'tf': tf_state   # Trappe Fermée
-        }
-    except Exception as e:
-        return None
\ No newline at end of file
+    
+    # Clarifier l'analyse des états (HIGH = True, LOW = False) ;
+    # seule la première occurrence de chaque capteur est retenue
+    states = {}
+    for match in _PIN_FIELD_RE.finditer(line):
+        name, part = match.groups()
+        states.setdefault(name, part == "HIGH")
+    
+    # Les quatre capteurs doivent être présents
+    if len(states) < 4:
+        return None
+    
+    # Retourner les états des pins
+    return {
+        'vr': states['VR'],  # Vérin Rentré
+        'vs': states['VS'],  # Vérin Sorti
+        'to': states['TO'],  # Trappe Ouverte
+        'tf': states['TF']   # Trappe Fermée
+    }
\ No newline at end of file
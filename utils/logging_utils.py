@@ -0,0 +1,84 @@
+"""
+Utilitaires de journalisation pour le système de capteurs
+"""
+
+import atexit
+import logging
+import queue
+import sys
+import time
+from logging.handlers import QueueHandler, QueueListener
+
+# Écouteur de la file de journalisation (un seul par processus)
+_listener = None
+
+
+class RateLimitFilter(logging.Filter):
+    """
+    Filtre qui écarte les messages identiques répétés dans un court intervalle
+
+    Deux enregistrements sont considérés identiques s'ils ont le même logger,
+    le même niveau et le même gabarit de message (avant formatage des arguments),
+    ce qui évite de formater et d'afficher les rafales d'erreurs d'un appareil
+    déconnecté interrogé en boucle.
+
+    Les loggers des appareils (Arduino, Keithley, régénération) et du
+    gestionnaire de mesures en installent un avec un intervalle d'une seconde,
+    de l'ordre de la période de la boucle de mesure : une erreur persistante
+    reste visible sans inonder la console à chaque itération.
+    """
+
+    def __init__(self, interval=1.0, name=""):
+        """
+        Initialise le filtre
+
+        Args:
+            interval: Durée minimale en secondes entre deux messages identiques
+            name: Nom de logger transmis à logging.Filter
+        """
+        super().__init__(name)
+        self.interval = interval
+        self._last_seen = {}
+
+    def filter(self, record):
+        key = (record.name, record.levelno, record.msg)
+        now = time.monotonic()
+        last = self._last_seen.get(key)
+        if last is not None and now - last < self.interval:
+            return False
+        self._last_seen[key] = now
+        return True
+
+
+def configure_logging(level=logging.INFO):
+    """
+    Configure la journalisation de l'application à travers une file
+
+    Les appels de journalisation se contentent de déposer l'enregistrement dans
+    une file ; un thread d'arrière-plan (QueueListener) se charge de l'écriture
+    sur la sortie standard, sans bloquer la boucle de mesure. Les appels
+    suivants sont sans effet.
+
+    Args:
+        level: Niveau minimal des messages affichés
+
+    Returns:
+        QueueListener: L'écouteur démarré
+    """
+    global _listener
+    if _listener is not None:
+        return _listener
+
+    log_queue = queue.SimpleQueue()
+    console_handler = logging.StreamHandler(sys.stdout)
+    console_handler.setFormatter(logging.Formatter('%(message)s'))
+
+    root_logger = logging.getLogger()
+    root_logger.setLevel(level)
+    root_logger.addHandler(QueueHandler(log_queue))
+
+    _listener = QueueListener(log_queue, console_handler, respect_handler_level=True)
+    _listener.start()
+    # Vider la file avant la fin du processus
+    atexit.register(_listener.stop)
+    return _listener
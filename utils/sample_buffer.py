@@ -0,0 +1,100 @@
+"""
+Tampon d'échantillons contigu pour les séries de mesure
+
+Ce module fournit SampleBuffer, un conteneur de flottants stocké dans un tableau
+NumPy préalloué avec une tête d'écriture. Il se comporte comme une liste pour le
+code existant (append, len, indexation, itération) tout en évitant de créer un
+objet Python par échantillon, et ses tranches sont des vues sans copie.
+"""
+
+import numpy as np
+
+
+class SampleBuffer:
+    """
+    Série de valeurs flottantes à croissance par doublement
+
+    Les valeurs sont écrites dans un tableau NumPy préalloué ; lorsqu'il est plein,
+    sa capacité est doublée. clear() ne fait que remettre la tête d'écriture à zéro
+    et conserve la mémoire allouée pour l'essai suivant.
+    """
+
+    __slots__ = ('_data', '_size')
+
+    def __init__(self, capacity=1024, dtype=np.float64):
+        """
+        Initialise le tampon
+
+        Args:
+            capacity: Nombre d'échantillons préalloués
+            dtype: Type NumPy des valeurs stockées
+        """
+        self._data = np.empty(max(int(capacity), 1), dtype=dtype)
+        self._size = 0
+
+    def append(self, value):
+        """Ajoute une valeur en fin de série"""
+        size = self._size
+        if size == self._data.shape[0]:
+            self._grow(size + 1)
+        self._data[size] = value
+        self._size = size + 1
+
+    def extend(self, values):
+        """Ajoute plusieurs valeurs en fin de série"""
+        values = np.asarray(values, dtype=self._data.dtype)
+        count = values.shape[0]
+        size = self._size
+        if size + count > self._data.shape[0]:
+            self._grow(size + count)
+        self._data[size:size + count] = values
+        self._size = size + count
+
+    def _grow(self, required):
+        """Agrandit le tableau par doublement jusqu'à contenir `required` valeurs"""
+        capacity = self._data.shape[0]
+        while capacity < required:
+            capacity *= 2
+        data = np.empty(capacity, dtype=self._data.dtype)
+        data[:self._size] = self._data[:self._size]
+        self._data = data
+
+    def clear(self):
+        """Vide la série en conservant la capacité allouée"""
+        self._size = 0
+
+    def view(self):
+        """Retourne une vue NumPy (sans copie) des valeurs enregistrées"""
+        return self._data[:self._size]
+
+    def tolist(self):
+        """Retourne une copie des valeurs sous forme de liste de flottants Python"""
+        return self._data[:self._size].tolist()
+
+    def __len__(self):
+        return self._size
+
+    def __bool__(self):
+        return self._size > 0
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return self._data[:self._size][index]
+        size = self._size
+        if index < 0:
+            index += size
+        if not 0 <= index < size:
+            raise IndexError("SampleBuffer index out of range")
+        return self._data.item(index)
+
+    def __iter__(self):
+        return iter(self._data[:self._size].tolist())
+
+    def __array__(self, dtype=None, copy=None):
+        values = self._data[:self._size]
+        if dtype is not None and dtype != values.dtype:
+            return values.astype(dtype)
+        return values.copy() if copy else values
+
+    def __repr__(self):
+        return f"SampleBuffer({self.tolist()!r})"